@@ -0,0 +1,27 @@
+from pathlib import Path
+import shutil
+
+import pytest
+
+from uroman import Uroman
+from uroman.uroman import DEFAULT_ROM_MAX_CACHE_SIZE, SNAPSHOT_FILENAME
+
+TEST_DIR = Path(__file__).parent
+DATA_DIR = Path(Uroman.default_data_dir())
+
+
+@pytest.fixture(scope='session')
+def uroman() -> Uroman:
+    """Shared instance (with romanization cache) for tests that neither modify it nor depend on its cache state."""
+    return Uroman(cache_size=DEFAULT_ROM_MAX_CACHE_SIZE)
+
+
+@pytest.fixture
+def data_dir(tmp_path) -> Path:
+    """Copy of the uroman data directory (without snapshot) that tests may modify."""
+    return Path(shutil.copytree(DATA_DIR, tmp_path / 'data', ignore=shutil.ignore_patterns(SNAPSHOT_FILENAME)))
+
+
+@pytest.fixture(scope='session')
+def multi_script_lines() -> list[str]:
+    return (TEST_DIR / 'multi-script.txt').read_text(encoding='utf-8').splitlines()
@@ -0,0 +1,82 @@
+import asyncio
+import concurrent.futures
+import threading
+
+from uroman import AsyncUroman, RomFormat, Uroman
+
+TEXTS = ['Игорь', 'ちょっと', 'Ελλάδα', '१२३', 'مرحبا', 'สวัสดี', '안녕하세요', '北京']
+
+
+def test_thread_executor_with_small_shared_cache_matches_serial_output(uroman):
+    shared_uroman = Uroman(cache_size=4)  # frequent concurrent evictions
+    texts = [f'{TEXTS[i % len(TEXTS)]} {i % 13}' for i in range(400)]
+
+    async def romanize_all():
+        async with AsyncUroman(shared_uroman, max_workers=8) as async_uroman:
+            return await asyncio.gather(*[async_uroman.romanize(text) for text in texts])
+
+    assert asyncio.run(romanize_all()) == [uroman.romanize_string(text) for text in texts]
+    assert len(shared_uroman.rom_cache) <= 4
+
+
+def test_process_executor_matches_serial_output(uroman):
+    async def romanize_all():
+        async with AsyncUroman(uroman, executor='process', max_workers=2) as async_uroman:
+            return await asyncio.gather(*[async_uroman.romanize(text, rom_format=RomFormat.STR) for text in TEXTS])
+
+    assert asyncio.run(romanize_all()) == [uroman.romanize_string(text) for text in TEXTS]
+
+
+def test_concurrent_requests_for_the_same_string_are_coalesced(uroman):
+    async def romanize_all():
+        async with AsyncUroman(uroman) as async_uroman:
+            results = await asyncio.gather(*[async_uroman.romanize('ちょっと') for _ in range(10)],
+                                           async_uroman.romanize('ちょっと', rom_format=RomFormat.EDGES))
+            return results, async_uroman.stats()
+
+    results, stats = asyncio.run(romanize_all())
+    assert results[:10] == ['chotto'] * 10
+    assert list(map(str, results[10])) == list(map(str, uroman.romanize_string('ちょっと', rom_format=RomFormat.EDGES)))
+    assert stats == {'requests': 11, 'coalesced': 9, 'computations': 2, 'in_flight': 0}
+
+
+def test_computation_is_cancelled_only_when_all_its_requests_are_cancelled(uroman):
+    async def romanize_with_cancellations():
+        release = threading.Event()
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            executor.submit(release.wait)  # keeps the single thread busy, so computations stay pending
+            async_uroman = AsyncUroman(uroman, executor=executor)
+            requests = [asyncio.ensure_future(async_uroman.romanize(s)) for s in ('Игорь', 'Игорь', 'Ελλάδα')]
+            await asyncio.sleep(0.05)
+            computation = async_uroman.in_flight[('Игорь', None, RomFormat.STR)][0]
+            requests[0].cancel()
+            await asyncio.sleep(0.05)
+            assert not computation.cancelled()  # still awaited by requests[1]
+            requests[2].cancel()
+            await asyncio.sleep(0.05)
+            assert list(async_uroman.in_flight) == [('Игорь', None, RomFormat.STR)]
+            release.set()
+            results = await asyncio.gather(*requests, return_exceptions=True)
+            return results, async_uroman.stats()
+
+    results, stats = asyncio.run(romanize_with_cancellations())
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1] == 'Igor'
+    assert isinstance(results[2], asyncio.CancelledError)
+    assert stats == {'requests': 3, 'coalesced': 1, 'computations': 2, 'in_flight': 0}
+
+
+def test_coalesced_requests_get_their_own_edges(uroman):
+    async def romanize_all():
+        async with AsyncUroman(uroman) as async_uroman:
+            return await asyncio.gather(*[async_uroman.romanize('Игорь 12', rom_format=rom_format)
+                                          for rom_format in (RomFormat.EDGES, RomFormat.EDGES, RomFormat.LATTICE,
+                                                             RomFormat.LATTICE)])
+
+    results = asyncio.run(romanize_all())
+    for edges, other_edges in (results[:2], results[2:]):
+        expected = list(map(str, other_edges))
+        for edge in edges:
+            edge.txt = 'modified'
+        assert list(map(str, other_edges)) == expected
+        assert not ({id(edge) for edge in edges} & {id(edge) for edge in other_edges})
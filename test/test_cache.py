@@ -0,0 +1,301 @@
+import json
+import multiprocessing
+import os
+import threading
+
+import pytest
+import regex
+
+from uroman import RomFormat, Uroman
+from uroman.uroman import ANY_LCODE, AdaptiveRomCache, PersistentRomCache, RomCache, SharedRomCache
+
+EDGE_RECORDS = ((0, 2, 'Ig', None), (2, 5, 'or', 'rom'))
+
+
+def shared_cache_name(suffix: str) -> str:
+    return f'uroman-test-{os.getpid()}-{suffix}'
+
+
+def shared_cache_get(name: str, data_fingerprint: str, s: str, rom_format: RomFormat):
+    shared_cache = SharedRomCache(name, data_fingerprint, create=False)
+    try:
+        return shared_cache.get(s, None, rom_format)
+    finally:
+        shared_cache.close()
+
+
+def test_rom_cache_evicts_least_recently_used_entries():
+    cache = RomCache(3)
+    for key in 'abc':
+        cache.put(key, key.upper())
+    assert cache.get('a') == 'A'  # now most recently used
+    cache.put('d', 'D')
+    assert cache.keys() == ['c', 'a', 'd']
+    assert (cache.get('b'), cache.evictions) == (None, 1)
+    cache.resize(max_size=1)
+    assert cache.keys() == ['d']
+    assert len(cache) == 1
+
+
+def test_small_rom_cache_stays_within_max_size(uroman, multi_script_lines):
+    small_cache_uroman = Uroman(cache_size=50)
+    for line in multi_script_lines * 2:
+        assert small_cache_uroman.romanize_string(line) == uroman.romanize_string(line)
+        assert len(small_cache_uroman.rom_cache) <= 50
+    assert small_cache_uroman.cache_stats()['evictions'] > 0
+
+
+def test_rom_cache_stays_within_max_bytes(uroman, multi_script_lines):
+    max_bytes = 20000
+    budget_uroman = Uroman(cache_size=10000, cache_max_bytes=max_bytes)
+    rom_cache = budget_uroman.rom_cache
+    for line in multi_script_lines:
+        for rom_format in (RomFormat.STR, RomFormat.EDGES, RomFormat.ALTS):
+            assert list(map(str, budget_uroman.romanize_string(line, rom_format=rom_format))) \
+                == list(map(str, uroman.romanize_string(line, rom_format=rom_format)))
+            assert rom_cache.n_bytes <= max_bytes
+    assert rom_cache.n_bytes == sum([rom_cache.entry_n_bytes(key, value) for key, value in rom_cache.items()])
+    assert 0 < len(rom_cache) < 10000
+    assert rom_cache.evictions > 0
+
+
+def test_rom_cache_hits_concurrent_with_evictions_return_correct_values():
+    max_bytes = 4000
+    cache = RomCache(16, max_bytes=max_bytes)
+    errors = []
+
+    def get_and_put(thread_id: int):
+        for i in range(3000):
+            key = f'{(thread_id + i) % 40}'
+            if (value := cache.get(key)) is None:
+                cache.put(key, f'value {key}')
+            elif value != f'value {key}':
+                errors.append((key, value))
+
+    threads = [threading.Thread(target=get_and_put, args=(thread_id,)) for thread_id in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert len(cache) <= 16
+    assert cache.n_bytes == sum([cache.entry_n_bytes(key, value) for key, value in cache.items()]) <= max_bytes
+    assert cache.evictions > 0
+
+
+def test_results_with_lcodes_match_uncached_results(multi_script_lines):
+    cached_uroman, uncached_uroman = Uroman(cache_size=10000), Uroman()
+    texts = [regex.sub(r'^::lcode \S+ ', '', line) for line in multi_script_lines]
+    lcodes = [None] + sorted(set(regex.findall(r'^::lcode (\S+) ', '\n'.join(multi_script_lines), regex.M)))
+    for text in texts:
+        for lcode in lcodes:  # cache entries of one lcode must not leak into romanizations of another lcode
+            assert cached_uroman.romanize_string(text, lcode) == uncached_uroman.romanize_string(text, lcode)
+    assert cached_uroman.cache_stats()['hits'] > 0
+
+
+def test_persistent_cache_round_trip(uroman, multi_script_lines, tmp_path):
+    filename = str(tmp_path / 'rom-cache.sqlite')
+    rom_formats = (RomFormat.STR, RomFormat.EDGES)
+    writer = Uroman(cache_size=1000, persistent_cache=filename)
+    for line in multi_script_lines:
+        for rom_format in rom_formats:
+            writer.romanize_string(line, rom_format=rom_format)
+    writer.close_persistent_cache()
+    reader = Uroman(cache_size=1000, persistent_cache=filename, persistent_cache_read_only=True)
+    for line in multi_script_lines:
+        for rom_format in rom_formats:
+            assert list(map(str, reader.romanize_string(line, rom_format=rom_format))) \
+                == list(map(str, uroman.romanize_string(line, rom_format=rom_format)))
+    persistent_stats = reader.cache_stats()['persistent']
+    assert persistent_stats['hits'] > persistent_stats['misses']  # misses: e.g. number edges, which are not stored
+
+
+def test_persistent_cache_keeps_entries_put_concurrently_with_flushes(tmp_path):
+    filename = str(tmp_path / 'rom-cache.sqlite')
+    persistent_cache = PersistentRomCache(filename, 'fingerprint', batch_size=7)
+
+    def put_entries(thread_id: int):
+        for i in range(300):
+            persistent_cache.put((f'{thread_id} {i}', None, RomFormat.STR), f'rom {thread_id} {i}')
+
+    threads = [threading.Thread(target=put_entries, args=(thread_id,)) for thread_id in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    persistent_cache.close()
+    assert persistent_cache.writes == 4 * 300
+    reader = PersistentRomCache(filename, 'fingerprint', read_only=True)
+    assert all([reader.get(f'{thread_id} {i}', None, RomFormat.STR) == (None, f'rom {thread_id} {i}')
+                for thread_id in range(4) for i in range(300)])
+    assert (reader.hits, reader.misses) == (4 * 300, 0)
+    reader.close()
+
+
+def test_warm_export_and_warm_from_file_round_trip(tmp_path):
+    tokens, lcodes = ['Игорь', 'Київ', 'ちょっと'], [None, 'ukr', 'rus']
+    rom_formats = [RomFormat.STR, RomFormat.EDGES, RomFormat.ALTS]
+    uroman = Uroman(cache_size=1000)
+    assert uroman.warm_cache(tokens, lcodes, rom_formats) == len(tokens)
+    filename = tmp_path / 'cache.jsonl'
+    entries = uroman.export_cache(str(filename))
+    assert {entry['lcode'] for entry in entries} == {None, 'ukr', 'rus', ANY_LCODE}
+    assert {type(entry['rom']) for entry in entries} == {str, tuple}  # EDGES/ALTS: tuple of edge records
+    header = json.loads(filename.read_text(encoding='utf-8').splitlines()[0])['uroman-cache']
+    assert header['data_fingerprint'] == uroman.data_fingerprint
+
+    def sorted_roms(some_uroman: Uroman) -> list:
+        return [sorted(map(str, [rom] if isinstance(rom, str) else rom))
+                for token in tokens for lcode in lcodes for rom_format in rom_formats
+                if (rom := some_uroman.romanize_string(token, lcode, rom_format)) is not None]
+
+    for fingerprint in (uroman.data_fingerprint, 'outdated'):  # loaded directly; romanized again
+        filename.write_text('\n'.join([json.dumps({'uroman-cache': {**header, 'data_fingerprint': fingerprint}})]
+                                      + filename.read_text(encoding='utf-8').splitlines()[1:]) + '\n',
+                            encoding='utf-8')
+        warm_uroman = Uroman(cache_size=1000)
+        assert warm_uroman.warm_cache_from_file(str(filename)) == len(entries)
+        assert set(warm_uroman.rom_cache.keys()) == set(uroman.rom_cache.keys())
+        cache_stats = warm_uroman.cache_stats()
+        assert sorted_roms(warm_uroman) == sorted_roms(uroman)
+        assert warm_uroman.cache_stats()['hits'] - cache_stats['hits'] >= len(entries)
+        assert warm_uroman.cache_stats()['misses'] == cache_stats['misses']
+
+
+def test_warm_cache_from_token_list(tmp_path):
+    filename = tmp_path / 'tokens.txt'
+    filename.write_text('Игорь\t1000\nちょっと\t10\nКиїв\n', encoding='utf-8')
+    uroman = Uroman(cache_size=1000)
+    assert uroman.warm_cache_from_file(str(filename), lcodes='ukr', rom_formats=RomFormat.EDGES) == 3
+    assert set(uroman.rom_cache.keys()) == {('Игорь', 'ukr', RomFormat.EDGES), ('ちょっと', ANY_LCODE, RomFormat.EDGES),
+                                            ('Київ', 'ukr', RomFormat.EDGES)}
+    assert [str(edge) for edge in uroman.romanize_string('Игорь', 'ukr', RomFormat.EDGES)][0].startswith('[0-1] Y')
+    assert uroman.cache_stats()['hits'] == 1
+
+
+def test_line_memo_hits_duplicate_lines_without_collisions(tmp_path):
+    uroman = Uroman(cache_size=1000, line_memo_size=100)
+    lines = ['Игорь\n', 'Игорь\n', '::lcode ukr Игорь\n', 'Игорь\n']
+    output_filename = str(tmp_path / 'output.txt')
+
+    def romanize_lines(**args) -> list[str]:
+        uroman.romanize_file(None, output_filename, direct_input=lines, **{'silent': True, **args})
+        with open(output_filename, encoding='utf-8') as f:
+            return f.read().splitlines()
+
+    assert romanize_lines() == ['Igor', 'Igor', '::lcode ukr Yhor', 'Igor']
+    assert uroman.cache_stats()['line_memo']['hits'] == 2
+    assert romanize_lines(lcode='ukr') == ['Yhor', 'Yhor', '::lcode ukr Yhor', 'Yhor']
+    edges_lines = romanize_lines(rom_format=RomFormat.EDGES)
+    assert edges_lines[0].startswith('[[0, 1, "I", "rom"][1, 2, "g", "rom"]')
+    assert edges_lines[1] == edges_lines[3] != edges_lines[2]
+    line_memo_size = len(uroman.line_memo)
+    assert romanize_lines(ablation='nocap', silent=False, workers=1) == ['Igor', 'Igor', '::lcode ukr Yhor', 'Igor']
+    assert len(uroman.line_memo) == line_memo_size + 2  # other keys for output-affecting args only
+
+
+def test_reload_clears_line_memo(data_dir, tmp_path):
+    uroman = Uroman(data_dir, cache_size=1000, line_memo_size=100)
+    output_filename = str(tmp_path / 'output.txt')
+    uroman.romanize_file(None, output_filename, direct_input=['Ꝗuick\n'], silent=True)
+    with open(data_dir / 'romanization-table.txt', 'a', encoding='utf-8') as f:
+        f.write('::s Ꝗ ::t Kw\n')
+    uroman.reload()
+    assert len(uroman.line_memo) == 0
+    uroman.romanize_file(None, output_filename, direct_input=['Ꝗuick\n'], silent=True)
+    with open(output_filename, encoding='utf-8') as f:
+        assert f.read() == 'Kwuick\n'
+
+
+def test_adaptive_cache_grows_for_reuse_beyond_max_size_and_shrinks_without_reuse():
+    for n_keys, grows in ((280, True), (30000, False)):  # cyclic working set slightly larger than max_size; no reuse
+        cache = AdaptiveRomCache(256, max_bytes=None, min_size=64)
+        for i in range(30000):
+            if cache.get(i % n_keys) is None:
+                cache.put(i % n_keys, 'rom')
+        assert (cache.max_size > 256) if grows else (64 <= cache.max_size < 256)
+        assert len(cache) <= cache.max_size
+
+
+def test_adaptive_cache_stays_within_max_bytes(uroman, multi_script_lines):
+    max_bytes = 30000
+    adaptive_uroman = Uroman(adaptive_cache=True, cache_max_bytes=max_bytes)
+    for line in multi_script_lines * 2:
+        for rom_format in (RomFormat.STR, RomFormat.EDGES):
+            assert list(map(str, adaptive_uroman.romanize_string(line, rom_format=rom_format))) \
+                == list(map(str, uroman.romanize_string(line, rom_format=rom_format)))
+            assert adaptive_uroman.rom_cache.n_bytes <= max_bytes
+    assert adaptive_uroman.cache_stats()['evictions'] > 0
+
+
+def test_shared_cache_hit_in_spawned_process():
+    shared_cache = SharedRomCache(shared_cache_name('spawn'), 'fingerprint', n_slots=64)
+    try:
+        shared_cache.put(('Игорь', None, RomFormat.STR), 'Igor')
+        shared_cache.put(('Игорь', None, RomFormat.EDGES), EDGE_RECORDS)
+        with multiprocessing.get_context('spawn').Pool(1) as pool:
+            assert pool.apply(shared_cache_get, (shared_cache.name, 'fingerprint', 'Игорь', RomFormat.STR)) \
+                == (None, 'Igor')
+            assert pool.apply(shared_cache_get, (shared_cache.name, 'fingerprint', 'Игорь', RomFormat.EDGES)) \
+                == (None, EDGE_RECORDS)
+            assert pool.apply(shared_cache_get, (shared_cache.name, 'fingerprint', 'Ελλάδα', RomFormat.STR)) is None
+    finally:
+        shared_cache.close()
+
+
+def test_shared_cache_treats_corrupted_slot_as_miss():
+    shared_cache = SharedRomCache(shared_cache_name('corrupt'), 'fingerprint', n_slots=64)
+    try:
+        shared_cache.put(('Игорь', None, RomFormat.STR), 'Igor')
+        digest = shared_cache.key_digest('Игорь', None, 'str')
+        position = next(position for position in shared_cache.slot_positions(digest)
+                        if bytes(shared_cache.shm.buf[position:position + 16]) == digest)
+        value_start = position + shared_cache.slot_header_struct.size
+        shared_cache.shm.buf[value_start] ^= 0xFF  # e.g. torn by a concurrent write
+        assert shared_cache.get('Игорь', None, RomFormat.STR) is None
+        shared_cache.slot_header_struct.pack_into(shared_cache.shm.buf, position, digest, b'\0' * 8, 10 ** 6)
+        assert shared_cache.get('Игорь', None, RomFormat.STR) is None  # invalid value length
+        shared_cache.put(('Игорь', None, RomFormat.STR), 'Igor')
+        assert shared_cache.get('Игорь', None, RomFormat.STR) == (None, 'Igor')
+        assert (shared_cache.hits, shared_cache.misses) == (1, 2)
+    finally:
+        shared_cache.close()
+
+
+def test_shared_cache_isolates_data_fingerprints():
+    shared_cache = SharedRomCache(shared_cache_name('isolation'), 'fingerprint', n_slots=64)
+    other_shared_cache = SharedRomCache(shared_cache.name, 'other fingerprint', create=False)
+    try:
+        shared_cache.put(('Игорь', None, RomFormat.STR), 'Igor')
+        other_shared_cache.put(('Игорь', None, RomFormat.STR), 'Igorj')
+        assert shared_cache.get('Игорь', None, RomFormat.STR) == (None, 'Igor')
+        assert other_shared_cache.get('Игорь', None, RomFormat.STR) == (None, 'Igorj')
+        assert other_shared_cache.get('Игорь', 'rus', RomFormat.STR) is None
+    finally:
+        other_shared_cache.close()
+        shared_cache.close()
+
+
+def test_shared_cache_does_not_store_results_larger_than_slot():
+    shared_cache = SharedRomCache(shared_cache_name('too-large'), 'fingerprint', n_slots=64, slot_size=64)
+    try:
+        shared_cache.put(('long', None, RomFormat.STR), 'x' * 64)
+        shared_cache.put(('short', None, RomFormat.STR), 'x' * 8)
+        assert shared_cache.get('long', None, RomFormat.STR) is None
+        assert shared_cache.get('short', None, RomFormat.STR) == (None, 'x' * 8)
+        assert shared_cache.stats()['too_large'] == 1
+        assert shared_cache.stats()['writes'] == 1
+    finally:
+        shared_cache.close()
+
+
+def test_shared_cache_block_is_unlinked_only_when_its_creator_closes():
+    creator = SharedRomCache(shared_cache_name('unlink'), 'fingerprint', n_slots=64)
+    creator.put(('Игорь', None, RomFormat.STR), 'Igor')
+    attached = SharedRomCache(creator.name, 'fingerprint', create=False)
+    assert not attached.created
+    attached.close()
+    assert shared_cache_get(creator.name, 'fingerprint', 'Игорь', RomFormat.STR) == (None, 'Igor')
+    creator.close()
+    with pytest.raises(FileNotFoundError):
+        SharedRomCache(creator.name, 'fingerprint', create=False)
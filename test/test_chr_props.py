@@ -0,0 +1,36 @@
+import pytest
+
+from uroman import Uroman
+from uroman.uroman import CP_LETTER, CP_NAME_PROPS
+
+PRIVATE_USE_CHAR = '\ue000'  # no Unicode name
+UNASSIGNED_HANGUL_CHAR = '\ud7fc'  # no Unicode name; in the codepoint ranges of lazy script group Hangul
+
+
+def add_name(data_dir, char: str, name: str):
+    with open(data_dir / 'UnicodeDataOverwrite.txt', 'a', encoding='utf-8') as f:
+        f.write(f'::u {ord(char):04X} ::r x ::name {name}\n')
+
+
+def test_reload_recomputes_name_props_of_renamed_char(data_dir):
+    uroman = Uroman(data_dir)
+    assert not (uroman.chr_props(PRIVATE_USE_CHAR) & CP_LETTER)
+    add_name(data_dir, PRIVATE_USE_CHAR, 'PRIVATE LETTER X')
+    assert uroman.reload() == ['UnicodeDataOverwrite.txt']
+    assert uroman.chr_props(PRIVATE_USE_CHAR) & CP_LETTER
+    assert uroman.chr_props(PRIVATE_USE_CHAR) == Uroman(data_dir).chr_props(PRIVATE_USE_CHAR)
+
+
+@pytest.mark.parametrize('use_snapshot', [False, True])
+def test_script_group_load_recomputes_name_props(data_dir, use_snapshot):
+    add_name(data_dir, UNASSIGNED_HANGUL_CHAR, 'HANGUL TEST LETTER X')
+    if use_snapshot:
+        Uroman(data_dir, use_snapshot=False).save_snapshot()
+    uroman = Uroman(data_dir, use_snapshot=use_snapshot)
+    assert uroman.pending_script_groups.keys() == {'CJK', 'Hangul'}
+    uroman.chr_props(UNASSIGNED_HANGUL_CHAR)  # computed before the group (with the name) is loaded
+    uroman.romanize_string('서울' + UNASSIGNED_HANGUL_CHAR)
+    assert 'Hangul' not in uroman.pending_script_groups
+    assert uroman.chr_props(UNASSIGNED_HANGUL_CHAR) & (CP_NAME_PROPS | CP_LETTER) == CP_NAME_PROPS | CP_LETTER
+    eager_uroman = Uroman(data_dir, use_snapshot=False, lazy_script_loading=False)
+    assert uroman.chr_props(UNASSIGNED_HANGUL_CHAR) == eager_uroman.chr_props(UNASSIGNED_HANGUL_CHAR)
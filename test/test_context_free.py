@@ -0,0 +1,35 @@
+import pytest
+
+from uroman import RomFormat, Uroman
+
+LATIN_CHARS = ['a', 'k', 'é', 'ß', 'Œ', 'ĳ', 'ñ', 'Ǹ', '-', '.']
+CONTEXT_CHARS = ['́', '̈', 'เ', 'ก', 'ไ', 'ำ', 'ក', '្', 'ុ', 'ء', 'ـ', '1', '٣', '½', '²', 'Ⅻ', ' ']
+STRINGS = ['été', 'äb', 'เกม', 'ไทย', 'สวัสดี', 'កម្ពុជា', 'សួស្តី', 'a1b', '١٢٣', 'x½y', '12.5%',
+           'Straße', 'οδός', 'Ӂ', 'Ꝗuick']
+
+
+@pytest.fixture(scope='module')
+def lattice_uroman() -> Uroman:
+    """Instance without the context-free fast path"""
+    uroman = Uroman()
+    uroman.context_free_roms_of_string = lambda _s: None
+    return uroman
+
+
+def test_context_free_fast_path_equals_lattice_path(lattice_uroman):
+    uroman = Uroman()
+    strings = STRINGS + [s for char in LATIN_CHARS for context_char in CONTEXT_CHARS
+                         for s in (char + context_char, context_char + char, char + context_char + char)]
+    assert sum([uroman.context_free_roms_of_string(s) is not None for s in strings]) > 20  # fast path is taken
+    for s in strings:
+        for rom_format in (RomFormat.STR, RomFormat.EDGES):
+            assert list(map(str, uroman.romanize_string(s, rom_format=rom_format))) \
+                == list(map(str, lattice_uroman.romanize_string(s, rom_format=rom_format))), (s, rom_format)
+
+
+def test_context_free_fast_path_equals_lattice_path_for_decoded_input(lattice_uroman):
+    uroman = Uroman()
+    for s in ('caf\\u00e9', '\\u0e40\\u0e01\\u0e21', 'a\\u0301b', '\\u17a0\\u17d2\\u1793'):
+        for rom_format in (RomFormat.STR, RomFormat.EDGES):
+            assert list(map(str, uroman.romanize_string(s, rom_format=rom_format, decode_unicode=True))) \
+                == list(map(str, lattice_uroman.romanize_string(s, rom_format=rom_format, decode_unicode=True)))
@@ -0,0 +1,49 @@
+import json
+import subprocess
+import sys
+
+from uroman import Uroman
+from uroman.uroman import RESOURCE_FILES
+
+from conftest import TEST_DIR
+
+
+def check_timings(record: dict):
+    assert record['wall_sec'] >= 0
+    assert record['cpu_sec'] >= 0
+    assert (record['peak_rss_delta_kb'] is None) or (record['peak_rss_delta_kb'] >= 0)
+
+
+def test_load_report_of_resource_files(data_dir):
+    uroman = Uroman(data_dir, use_snapshot=False)
+    uroman.load_scripts()
+    report = uroman.load_report()
+    assert report['load_source'] == 'resource files'
+    assert report['data_fingerprint'] == uroman.data_fingerprint
+    assert report['pending_script_groups'] == []
+    resources = {record['resource']: record for record in report['resources']}
+    assert set(RESOURCE_FILES) <= set(resources)
+    for record in report['resources']:
+        check_timings(record)
+    assert all([resources[base_file]['entries'] > 0 for base_file in RESOURCE_FILES])
+    check_timings(report['totals'])
+    assert report['tables']['rom_rules']['entries'] == len(uroman.rom_rules)
+
+
+def test_load_report_of_snapshot(data_dir):
+    Uroman(data_dir).save_snapshot()
+    report = Uroman(data_dir).load_report(table_sizes=False)
+    assert report['load_source'] == 'snapshot'
+    assert 'snapshot' in [record['resource'] for record in report['resources']]
+    assert not (set(RESOURCE_FILES) & {record['resource'] for record in report['resources']})
+    assert report['pending_script_groups'] == ['CJK', 'Hangul']
+    assert 'tables' not in report
+
+
+def test_load_report_command_line_option_prints_json():
+    result = subprocess.run([sys.executable, '-m', 'uroman', '--load_report', '--no_snapshot'], capture_output=True,
+                            text=True, cwd=TEST_DIR.parent, check=True)
+    report = json.loads(result.stdout)
+    assert report['load_source'] == 'resource files'
+    for record in report['resources']:
+        check_timings(record)
@@ -0,0 +1,89 @@
+import gc
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+from uroman import RomFormat, Uroman
+
+from conftest import TEST_DIR
+
+
+def canonical(rom) -> str | list[str]:
+    return rom if isinstance(rom, str) else list(map(str, rom))
+
+
+def test_worker_pools_do_not_accumulate_frozen_objects():
+    uroman = Uroman()
+    freeze_count = gc.get_freeze_count()
+    for _ in range(3):
+        garbage = [[] for _ in range(1000)]
+        for item in garbage:
+            item.append(item)  # cyclic garbage, only freed by the garbage collector
+        del garbage
+        assert list(uroman.romanize_iter(['Игорь', 'ちょっと'], workers=2)) == ['Igor', 'chotto']
+        assert gc.get_freeze_count() == freeze_count
+
+
+def test_prefetched_parallel_romanize_iter_matches_serial_output(uroman):
+    items = ['Игорь', ('ちょっと', 'jpn'), 'Ελλάδα', ('१२३', None), 'مرحبا'] * 7
+    serial = list(uroman.romanize_iter(items))
+    assert list(uroman.romanize_iter(iter(items), prefetch=3, workers=2, chunk_size=4)) == serial
+
+
+def test_parallel_romanize_file_matches_serial_output_in_order(uroman, multi_script_lines, tmp_path):
+    input_filename = tmp_path / 'input.txt'
+    input_filename.write_text(''.join([f'{i}: {line}\n' for i, line in enumerate(multi_script_lines * 40)]),
+                              encoding='utf-8')  # several chunks of ROMANIZE_FILE_CHUNK_SIZE lines
+    output_texts = []
+    for workers in (1, 3):
+        output_filename = tmp_path / f'output-{workers}.txt'
+        uroman.romanize_file(str(input_filename), str(output_filename), workers=workers)
+        output_texts.append(output_filename.read_text(encoding='utf-8'))
+    assert output_texts[1] == output_texts[0]
+    assert output_texts[0].count('\n') == 40 * len(multi_script_lines)
+
+
+def test_parallel_romanize_batch_matches_serial_output(uroman, multi_script_lines):
+    words = ' '.join(multi_script_lines).split()
+    strings = [f'{words[i % len(words)]} {i % 1500}' for i in range(5000)]  # > ROMANIZE_BATCH_CHUNK_SIZE distinct
+    lcodes = [(None, 'rus', 'ukr')[i % 3] for i in range(len(strings))]
+    for rom_format in (RomFormat.STR, RomFormat.EDGES):
+        serial = [canonical(uroman.romanize_string(s, lcode, rom_format=rom_format))
+                  for s, lcode in zip(strings, lcodes)]
+        parallel = uroman.romanize_batch(strings, lcodes, rom_format=rom_format, workers=2)
+        assert list(map(canonical, parallel)) == serial
+
+
+def test_parallel_romanize_iter_matches_serial_output_in_order(uroman, multi_script_lines):
+    items = [(line, ('rus', None)[i % 2]) for i, line in enumerate(multi_script_lines * 3)]
+    for rom_format in (RomFormat.STR, RomFormat.EDGES):
+        serial = [canonical(uroman.romanize_string(s, lcode, rom_format=rom_format)) for s, lcode in items]
+        parallel = uroman.romanize_iter(iter(items), rom_format=rom_format, workers=3, chunk_size=10)
+        assert list(map(canonical, parallel)) == serial
+
+
+def fork_memory_report(input_filename: Path, *options: str) -> dict:
+    result = subprocess.run([sys.executable, '-m', 'uroman', '--fork_memory_report', '2', '-i', str(input_filename),
+                             '-o', str(input_filename.with_suffix('.uroman.txt')), '--silent', *options],
+                            capture_output=True, text=True, cwd=TEST_DIR.parent, check=True)
+    return json.loads(result.stdout)
+
+
+@pytest.mark.skipif(not Path('/proc/self/smaps_rollup').exists(), reason='requires /proc/<pid>/smaps_rollup (Linux)')
+def test_prefork_workers_keep_private_memory_bounded(multi_script_lines, tmp_path):
+    """Workers romanizing non-Latin text in prefork mode copy only a small part of the shared tables."""
+    reports = {}
+    for n_copies in (1, 10):
+        input_filename = tmp_path / f'input{n_copies}.txt'
+        input_filename.write_text('\n'.join(multi_script_lines * n_copies) + '\n', encoding='utf-8')
+        reports[n_copies] = fork_memory_report(input_filename, '--prefork')
+    default_report = fork_memory_report(tmp_path / 'input1.txt')
+    assert reports[1]['prefork'] and not default_report['prefork']
+    for worker_memory in reports[1]['workers'] + reports[10]['workers']:
+        assert worker_memory['Private_Clean'] + worker_memory['Private_Dirty'] < worker_memory['Rss'] / 4
+    assert reports[1]['worker_private_kb'] < default_report['worker_private_kb'] / 2
+    # more text of the same scripts (no new lazily computed table entries) copies hardly any further pages
+    assert reports[10]['worker_private_kb'] - reports[1]['worker_private_kb'] < 2 * 1024 * reports[1]['n_workers']
@@ -0,0 +1,17 @@
+from uroman import RomFormat, Uroman
+
+
+def test_reload_after_rule_edit_equals_fresh_load(data_dir, multi_script_lines):
+    uroman = Uroman(data_dir, cache_size=1000)
+    lines = multi_script_lines + ['Ꝗuick', 'Ꝗ Ꝗ']
+    uroman.romanize_string('Ꝗuick')  # cached before the edit
+    with open(data_dir / 'romanization-table.txt', 'a', encoding='utf-8') as f:
+        f.write('::s Ꝗ ::t Kw\n')
+    assert uroman.reload() == ['romanization-table.txt']
+    assert uroman.reload() == []
+    fresh_uroman = Uroman(data_dir)
+    for line in lines:
+        assert uroman.romanize_string(line) == fresh_uroman.romanize_string(line)
+        assert list(map(str, uroman.romanize_string(line, rom_format=RomFormat.EDGES))) \
+            == list(map(str, fresh_uroman.romanize_string(line, rom_format=RomFormat.EDGES)))
+    assert uroman.romanize_string('Ꝗuick') == 'Kwuick'
@@ -0,0 +1,48 @@
+import pickle
+
+from uroman.uroman import (RULE_DONT_USE_AT_END_OF_WORD, RULE_IS_MINUS_SIGN, RULE_USE_ONLY_AT_START_OF_WORD,
+                           RULE_WORD_RESTRICTIONS, RomRule)
+
+
+def test_dictionary_style_access_to_set_and_unset_slots():
+    rom_rule = RomRule(s='ь', t='', prov='man', lcodes=['ukr'], t_alts=["'"], n_restr=1,
+                       use_only_at_start_of_word=False, dont_use_at_end_of_word=True)
+    assert (rom_rule['s'], rom_rule['prov'], rom_rule['lcodes'], rom_rule['t-alts']) == ('ь', 'man', ['ukr'], ["'"])
+    assert rom_rule['t'] == ''  # empty target is set (unlike None, [] and False)
+    assert rom_rule['n-restr'] == 1
+    assert rom_rule['dont-use-at-end-of-word'] is True
+    assert rom_rule['use-only-at-start-of-word'] is None
+    assert rom_rule.get('use-only-at-start-of-word', False) is False
+    assert rom_rule['num'] is None
+    assert rom_rule.get('t-at-end-of-syllable', 'default') == 'default'
+    assert rom_rule.get('no-such-key') is None
+
+    unset_rom_rule = RomRule(s='x', t_alts=[], num=0, n_restr=0)
+    assert (unset_rom_rule['t'], unset_rom_rule['t-alts'], unset_rom_rule['num']) == (None, None, None)
+    assert unset_rom_rule['n-restr'] is None
+    assert unset_rom_rule.get('n-restr', 0) == 0
+
+
+def test_flags():
+    rom_rule = RomRule(s='-', t='-', use_only_at_start_of_word=True, is_minus_sign=True)
+    assert rom_rule.flags == RULE_USE_ONLY_AT_START_OF_WORD | RULE_IS_MINUS_SIGN
+    assert rom_rule.flags & RULE_WORD_RESTRICTIONS
+    assert not (rom_rule.flags & RULE_DONT_USE_AT_END_OF_WORD)
+    assert (rom_rule['use-only-at-start-of-word'], rom_rule['is-minus-sign']) == (True, True)
+    assert not (RomRule(s='a', t='a', is_minus_sign=True).flags & RULE_WORD_RESTRICTIONS)
+    assert repr(rom_rule) == "{'s': '-', 't': '-', 'use-only-at-start-of-word': True, 'is-minus-sign': True}"
+
+
+def test_pickle_round_trip():
+    rom_rules = [RomRule(s='ь', t='', prov='man', lcodes=['ukr'], t_alts=["'"], n_restr=1,
+                         dont_use_at_end_of_word=True),
+                 RomRule(s='½', num=0.5, fraction_connector='and', is_large_power=True),
+                 RomRule(s='x'),
+                 RomRule()]
+    for rom_rule in rom_rules:
+        restored = pickle.loads(pickle.dumps(rom_rule, protocol=pickle.HIGHEST_PROTOCOL))
+        assert type(restored) is RomRule
+        assert [getattr(restored, slot) for slot in RomRule.__slots__] \
+            == [getattr(rom_rule, slot) for slot in RomRule.__slots__]
+        assert repr(restored) == repr(rom_rule)
+    assert len(pickle.dumps(rom_rules[2])) < len(pickle.dumps(rom_rules[0]))  # trailing defaults are not pickled
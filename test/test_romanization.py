@@ -0,0 +1,57 @@
+from uroman import RomFormat, Uroman
+from uroman.uroman import DEFAULT_TOKEN_DELIMITERS, SCRIPT_TOKEN_DELIMITERS, Edge, NumEdge
+
+from conftest import TEST_DIR
+
+
+def test_number_edges_keep_their_class(uroman):
+    for _ in range(2):  # computed, then cached
+        for rom_format in (RomFormat.EDGES, RomFormat.ALTS):
+            edges = uroman.romanize_string('१२३', rom_format=rom_format)
+            assert len(edges) == 1
+            assert isinstance(edges[0], NumEdge)
+            assert (edges[0].value, edges[0].script) == (123, 'Devanagari')
+            edges = uroman.romanize_string('abc ½', rom_format=rom_format)
+            assert isinstance(edges[-1], NumEdge)
+            assert (edges[-1].start, edges[-1].end, edges[-1].txt) == (4, 5, '1/2')
+            assert all([type(edge) is Edge for edge in edges[:-1]])
+
+
+def test_cached_number_edges_are_not_modified_by_offsets(uroman):
+    uroman.romanize_string('5', rom_format=RomFormat.EDGES)
+    shifted = uroman.romanize_string('x 5', rom_format=RomFormat.EDGES)
+    assert (shifted[-1].start, shifted[-1].end) == (2, 3)
+    edge = uroman.romanize_string('5', rom_format=RomFormat.EDGES)[0]
+    assert isinstance(edge, NumEdge) and (edge.start, edge.end) == (0, 1)
+
+
+def test_romanize_file_matches_reference_output(uroman, tmp_path):
+    output_filename = tmp_path / 'multi-script.uroman.txt'
+    uroman.romanize_file(str(TEST_DIR / 'multi-script.txt'), str(output_filename))
+    assert output_filename.read_text(encoding='utf-8').splitlines() \
+        == (TEST_DIR / 'multi-script.uroman-ref.txt').read_text(encoding='utf-8').splitlines()
+
+
+def test_custom_token_delimiters_give_same_output(uroman, multi_script_lines):
+    token_delimiters = DEFAULT_TOKEN_DELIMITERS + ''.join(SCRIPT_TOKEN_DELIMITERS.values()) + '-'
+    custom_uroman, uncached_uroman = Uroman(cache_size=1000, token_delimiters=token_delimiters), Uroman()
+    strings = multi_script_lines + ['  Игорь  ', ' . Игорь;  ,Игорь . ', 'Игорь\n', 'a\nb c', '\n', '', ' ',
+                                    'foo-bar - baz--', 'สวัสดี๚ครับ๛', 'ខ្ញុំ។ស្រលាញ់៕', 'မြန်မာ၊ နိုင်ငံ။']
+    for s in strings:
+        for rom_format in (RomFormat.STR, RomFormat.EDGES):
+            expected = list(map(str, uncached_uroman.romanize_string(s, rom_format=rom_format)))
+            assert list(map(str, uroman.romanize_string(s, rom_format=rom_format))) == expected
+            assert list(map(str, custom_uroman.romanize_string(s, rom_format=rom_format))) == expected
+
+
+def test_segment_string_offsets():
+    uroman = Uroman(token_delimiters=' ,-')
+    assert uroman.segment_string(' a-b,, c- ') == [(' ', 0), ('a', 1), ('-', 2), ('b', 3), (',, ', 4), ('c', 7),
+                                                   ('- ', 8)]
+    assert uroman.segment_string('a b\n') == [('a', 0), (' ', 1), ('b', 2)]  # final line break dropped
+    assert uroman.segment_string('a b\nc') == [('a b\nc', 0)]  # no split
+    assert uroman.segment_string('') == []
+    for s in (' a-b,, c- ', '--x--', 'x', ' . Игорь;  ,Игорь . '):
+        segments = uroman.segment_string(s)
+        assert ''.join([token for token, _offset in segments]) == s
+        assert all([s[offset:offset + len(token)] == token for token, offset in segments])
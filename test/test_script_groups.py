@@ -0,0 +1,61 @@
+import threading
+
+import pytest
+
+from uroman import RomFormat, Uroman
+
+HAN, HANGUL = '北京大学', '서울특별시'
+
+
+@pytest.fixture(scope='module')
+def eager_uroman() -> Uroman:
+    return Uroman(use_snapshot=False, lazy_script_loading=False)
+
+
+def romanizations(uroman: Uroman, s: str) -> tuple:
+    return uroman.romanize_string(s), list(map(str, uroman.romanize_string(s, rom_format=RomFormat.EDGES)))
+
+
+@pytest.mark.parametrize('use_snapshot', [False, True])
+def test_first_use_loads_only_the_script_group_of_the_string(eager_uroman, use_snapshot):
+    uroman = Uroman(use_snapshot=use_snapshot)
+    assert set(uroman.pending_script_groups) == {'CJK', 'Hangul'}
+    assert eager_uroman.pending_script_groups == {}
+    assert romanizations(uroman, 'Игорь') == romanizations(eager_uroman, 'Игорь')
+    assert set(uroman.pending_script_groups) == {'CJK', 'Hangul'}
+    assert romanizations(uroman, HAN) == romanizations(eager_uroman, HAN)
+    assert set(uroman.pending_script_groups) == {'Hangul'}
+    assert romanizations(uroman, HANGUL) == romanizations(eager_uroman, HANGUL)
+    assert uroman.pending_script_groups == {}
+
+
+def test_multi_script_output_is_independent_of_load_order(eager_uroman, multi_script_lines):
+    uroman = Uroman()
+    for line in reversed(multi_script_lines):
+        assert romanizations(uroman, line) == romanizations(eager_uroman, line)
+
+
+@pytest.mark.parametrize('args, pending_script_groups', [({'lcodes': ['kor']}, set()),
+                                                         ({'lcodes': 'zho'}, {'Hangul'}),
+                                                         ({'scripts': ['Hangul']}, {'CJK'}),
+                                                         ({'lcodes': ['deu']}, {'CJK', 'Hangul'})])
+def test_predeclared_scripts_and_lcodes_preload_their_script_groups(args, pending_script_groups):
+    assert set(Uroman(**args).pending_script_groups) == pending_script_groups
+
+
+def test_concurrent_first_use_from_several_threads(eager_uroman):
+    uroman = Uroman()
+    strings = [f'{HAN} {HANGUL} {i}' for i in range(8)]
+    barrier, results = threading.Barrier(len(strings)), {}
+
+    def romanize(s: str):
+        barrier.wait()
+        results[s] = romanizations(uroman, s)
+
+    threads = [threading.Thread(target=romanize, args=(s,)) for s in strings]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert uroman.pending_script_groups == {}
+    assert results == {s: romanizations(eager_uroman, s) for s in strings}
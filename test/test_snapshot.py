@@ -0,0 +1,25 @@
+from uroman import RomFormat, Uroman
+
+
+def romanizations(uroman: Uroman, lines: list[str]) -> list:
+    return [(uroman.romanize_string(line), list(map(str, uroman.romanize_string(line, rom_format=RomFormat.EDGES))))
+            for line in lines]
+
+
+def test_snapshot_load_equals_fresh_load(data_dir, multi_script_lines):
+    fresh_uroman = Uroman(data_dir, use_snapshot=False)
+    assert fresh_uroman.load_source == 'resource files'
+    assert fresh_uroman.save_snapshot() == str(data_dir / 'uroman-snapshot.pickle')
+    snapshot_uroman = Uroman(data_dir)
+    assert snapshot_uroman.load_source == 'snapshot'
+    assert romanizations(snapshot_uroman, multi_script_lines) == romanizations(fresh_uroman, multi_script_lines)
+
+
+def test_snapshot_is_invalidated_by_data_file_change(data_dir):
+    Uroman(data_dir).save_snapshot()
+    assert Uroman(data_dir).load_source == 'snapshot'
+    with open(data_dir / 'romanization-table.txt', 'a', encoding='utf-8') as f:
+        f.write('::s Ꝗ ::t Kw\n')
+    uroman = Uroman(data_dir)
+    assert uroman.load_source == 'resource files'
+    assert uroman.romanize_string('Ꝗuick') == 'Kwuick'
@@ -1,2 +1,2 @@
-from .uroman import Uroman, RomFormat
-_all_ = [Uroman, RomFormat]
+from .uroman import Uroman, RomFormat, AsyncUroman
+_all_ = [Uroman, RomFormat, AsyncUroman]
@@ -18,22 +18,129 @@ See below for 'sample calls' under main()
 
 from __future__ import annotations
 import argparse
-from collections import defaultdict
+from array import array
+import asyncio
+import atexit
+from collections import defaultdict, deque, OrderedDict
+import copy
+import concurrent.futures
+from contextlib import contextmanager
 # from memory_profiler import profile
 import datetime
 from enum import Enum
 from fractions import Fraction
+import functools
 import gc
+import hashlib
+from itertools import islice
 import json
 import math
+import multiprocessing
+from multiprocessing import resource_tracker, shared_memory
 import os
 from pathlib import Path
+import pickle
 import pstats
+import queue
 import regex
+import sqlite3
+import struct
+try:
+    import resource  # for peak memory (RSS) in load report; not available on Windows
+except ImportError:
+    resource = None
 import sys
-from typing import List, Tuple
+import threading
+import time
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Tuple
 import unicodedata as ud
 DEFAULT_ROM_MAX_CACHE_SIZE = 65536
+ROM_CACHE_ENTRY_OVERHEAD_BYTES = 56  # approx. memory per rom_cache entry for hash table slot and LRU list node
+ROM_CACHE_EDGE_RECORD_BYTES = 88     # approx. memory per cached plain edge record (4-tuple incl. share of txt)
+# adaptive cache sizing (see AdaptiveRomCache)
+DEFAULT_ADAPTIVE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+ADAPTIVE_CACHE_MIN_SIZE = 1024
+ADAPTIVE_CACHE_INTERVAL = 4096             # number of misses between adaptations
+ADAPTIVE_CACHE_GROW_THRESHOLD = 0.001      # min. estimated hit rate gain for growing by a step
+ADAPTIVE_CACHE_SHRINK_THRESHOLD = 0.0002   # max. estimated hit rate loss for shrinking by a step
+ANY_LCODE = '*'  # lcode in rom_cache keys for romanizations that do not depend on the language code
+PERSISTENT_CACHE_BATCH_SIZE = 1000  # number of new entries written to a persistent cache per transaction
+# shared memory cache tier (see SharedRomCache)
+SHARED_CACHE_MAGIC = b'uroman-shared-cache-1\0\0\0'
+SHARED_CACHE_N_SLOTS = 65536
+SHARED_CACHE_SLOT_SIZE = 256  # bytes per slot, incl. slot header; larger romanization results are not shared
+SHARED_CACHE_PROBE_LENGTH = 4  # number of consecutive slots considered for a key (open addressing)
+ROMANIZE_FILE_CHUNK_SIZE = 500  # number of lines per task for romanize_file worker processes
+ROMANIZE_BATCH_CHUNK_SIZE = 2000  # number of distinct strings per task for romanize_batch worker processes
+ASYNC_UROMAN_MAX_PENDING = 64  # default max number of AsyncUroman computations submitted to the executor at a time
+# romanize_file args that do not affect output lines, and are therefore not part of line memo keys (see line_memo_key)
+LINE_MEMO_KEY_IGNORED_ARGS = frozenset(('rom_format', 'decode_unicode', 'silent', 'verbose', 'stats', 'test',
+                                        'load_log', 'max_lines', 'workers', 'prefork', 'cache_size', 'cache_max_bytes',
+                                        'adaptive_cache', 'line_memo_size', 'persistent_cache',
+                                        'persistent_cache_read_only', 'shared_cache', 'shared_cache_slots',
+                                        'use_snapshot', 'snapshot_filename', 'rebuild_ud_props', 'rebuild_num_props'))
+# For caching, romanize_string splits strings into tokens and delimiters. A delimiter includes at least one
+# core delimiter character, plus any adjacent extension characters.
+DEFAULT_TOKEN_DELIMITERS = ' 。་'
+TOKEN_DELIMITER_EXTENSION_CHARS = '.,; '
+# Optional additional core delimiters (argument token_delimiters) for scripts with few spaces
+SCRIPT_TOKEN_DELIMITERS = {'Khmer': '\u17D4\u17D5', 'Myanmar': '\u104A\u104B', 'Thai': '\u0E5A\u0E5B'}
+SNAPSHOT_FILENAME = 'uroman-snapshot.pickle'
+SNAPSHOT_FORMAT_VERSION = 7
+# resource files loaded by Uroman.load_resource_files(); a snapshot is only valid for identical file contents
+RESOURCE_FILES = ("romanization-auto-table.txt", "UnicodeDataOverwrite.txt", "romanization-table.txt",
+                  "Chinese_to_Pinyin.txt", "Scripts.txt", "NumProps.jsonl",
+                  "UnicodeDataProps.txt", "UnicodeDataPropsCJK.txt", "UnicodeDataPropsHangul.txt")
+# romanization data files (in loading order) with their provenance tag and file format; these can be reloaded
+ROM_RULE_FILES = (("romanization-auto-table.txt", 'ud', 'rom'),
+                  ("UnicodeDataOverwrite.txt", 'ow', 'u2r'),
+                  ("romanization-table.txt", 'man', 'rom'))
+THAI_CANCELLATION_PROVENANCES = ('auto cancel letter', 'auto cancel syllable')
+# tables whose size is included in the load report (see Uroman.load_report())
+LOAD_REPORT_TABLES = ('rom_rules', 's_prefix_trie', 'dict_bool', 'dict_str', 'dict_num', 'num_props', 'hangul_rom',
+                      'chr_script_ids', 'chr_flags')
+# Large script-specific resources that are loaded only on demand, i.e. when a string to be romanized first contains
+# a character in one of the codepoint ranges, or when the caller pre-declares the scripts or lcodes it will use.
+# Romanization rules whose source string starts with a character in these ranges are deferred as well.
+LAZY_SCRIPT_GROUPS = {
+    'CJK': {'files': ("Chinese_to_Pinyin.txt", "UnicodeDataPropsCJK.txt"),
+            'ranges': ((0x25CB, 0x25CB), (0x3007, 0x3007), (0x3021, 0x3029), (0x3400, 0x4DBF), (0x4E00, 0x9FFF),
+                       (0xF900, 0xFAFF), (0x20000, 0x3134F)),
+            'lcodes': ('zho', 'cmn', 'yue', 'lzh', 'wuu', 'hak', 'nan', 'jpn', 'kor')},
+    'Hangul': {'files': ("UnicodeDataPropsHangul.txt",),
+               'ranges': ((0x1100, 0x11FF), (0x3130, 0x318F), (0xA960, 0xA97F), (0xAC00, 0xD7FF)),
+               'lcodes': ('kor',)},
+}
+# codepoint flags (bitmask) in Uroman.chr_flags, e.g. for abugida processing
+CP_VOWEL_SIGN = 1 << 0
+CP_VIRAMA = 1 << 1
+CP_MEDIAL_CONSONANT_SIGN = 1 << 2
+CP_TONE_MARK = 1 << 3
+# flags based on Unicode character names and categories (see Uroman.add_chr_name_props())
+CP_NAME_PROPS = 1 << 4         # the following flags have been computed for this codepoint
+CP_LETTER = 1 << 5             # name includes LETTER
+CP_SUBJOINED = 1 << 6          # name includes SUBJOINED
+CP_SUBJOINED_LETTER = 1 << 7   # name includes SUBJOINED LETTER
+CP_VOCALIC = 1 << 8            # name includes VOCALIC
+CP_NUKTA = 1 << 9              # name includes NUKTA
+CP_NONSPACING_MARK = 1 << 10   # category Mn, e.g. combining accents, points, vowel signs
+CP_FORMAT_CHAR = 1 << 11       # category Cf, e.g. zero-width joiner/non-joiner
+CP_SPACE_SEPARATOR = 1 << 12   # category Zs
+CP_PRIVATE_USE = 1 << 13       # category Co
+CP_NAME_FLAGS = CP_NAME_PROPS | CP_LETTER | CP_SUBJOINED | CP_SUBJOINED_LETTER | CP_VOCALIC | CP_NUKTA \
+    | CP_NONSPACING_MARK | CP_FORMAT_CHAR | CP_SPACE_SEPARATOR | CP_PRIVATE_USE  # all of the above
+CP_NAME_SUBSTRING_FLAGS = (('LETTER', CP_LETTER), ('SUBJOINED', CP_SUBJOINED),
+                           ('SUBJOINED LETTER', CP_SUBJOINED_LETTER), ('VOCALIC', CP_VOCALIC), ('NUKTA', CP_NUKTA))
+CP_CATEGORY_FLAGS = {'Mn': CP_NONSPACING_MARK, 'Cf': CP_FORMAT_CHAR, 'Zs': CP_SPACE_SEPARATOR, 'Co': CP_PRIVATE_USE}
+CODEPOINT_TABLE_SIZE = sys.maxunicode + 1
+S_PREFIX_TRIE_LEAF = {'': True}  # shared by all s_prefix_trie nodes without children; never to be modified
+# Characters that modify the romanization of a neighboring character, e.g. Japanese small tsu (consonant doubler),
+# small ya/yu/yo, vowel lengthener, combining grave accent (Coptic) and Braille capital sign (see Lattice methods).
+CONTEXT_TRIGGER_CHARS = 'っッ\u0A71ゃゅょャュョー\u0300\u2820'
+# Scripts with special romanization heuristics (in addition to any script with abugida default vowels)
+CONTEXT_SENSITIVE_SCRIPTS = ('Thai', 'Tibetan')
+CONTEXT_SENSITIVE_CP_FLAGS = (CP_VOWEL_SIGN | CP_VIRAMA | CP_MEDIAL_CONSONANT_SIGN | CP_TONE_MARK
+                              | CP_SUBJOINED | CP_NUKTA)
 PROFILE_FLAG = "--profile"  # also used in argparse processing
 if PROFILE_FLAG in sys.argv:
     import cProfile
@@ -70,6 +177,16 @@ def has_value_in_double_colon_del_list(line: str, slot: str) -> bool:
     return isinstance(slot_value_in_double_colon_del_list(line, slot), str)
 
 
+def double_colon_del_list_to_dict(line: str) -> dict:
+    """Splits a line such as '::s1 of course ::s2 ::cost 0.3' in a single scan into a slot-value dict:
+    {'s1': 'of course', 's2': '', 'cost': '0.3'}. For each slot, the value is the same as returned by
+    slot_value_in_double_colon_del_list(), which is much slower when called for many slots per line."""
+    result = {}
+    for m in regex.finditer(r'(?:^|\s)::(\S+)(?:\s+(\S+(?:\s+(?!::\S)\S+)*))??(?=\s+::\S|\s*$)', line):
+        result[m.group(1)] = (m.group(2) or '').strip()
+    return result
+
+
 def dequote_string(s: str) -> str:
     if isinstance(s, str):
         m = regex.match(r'''\s*(['"“])(.*)(['"”])\s*$''', s)
@@ -130,6 +247,104 @@ def add_non_none_to_dict(d: dict, key: str, value) -> None:
         d[key] = value
 
 
+def changed_runs(old_seq: list | array, new_seq: list | array) -> List[Tuple[int, list | array]]:
+    """Runs of consecutive positions in which new_seq differs from (or extends) old_seq, as (start, values) tuples.
+    Such runs can be applied as slice assignments: seq[start:start+len(values)] = values"""
+    runs, run_start, len_old_seq = [], None, len(old_seq)
+    for i, value in enumerate(new_seq):
+        if (i >= len_old_seq) or (value != old_seq[i]):
+            if run_start is None:
+                run_start = i
+        elif run_start is not None:
+            runs.append((run_start, new_seq[run_start:i]))
+            run_start = None
+    if run_start is not None:
+        runs.append((run_start, new_seq[run_start:]))
+    return runs
+
+
+def peak_rss_kb() -> int | None:
+    """Peak resident set size (RSS) of the current process in KB (None if not available)."""
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return (peak_rss // 1024) if sys.platform == 'darwin' else peak_rss  # macOS: bytes; Linux: KB
+
+
+gc_freeze_lock = threading.Lock()
+n_gc_freeze_holders = 0  # prefork-mode Uroman instances and live forked worker pools (see hold_gc_freeze)
+
+
+def hold_gc_freeze():
+    """Collects garbage and freezes all remaining objects (gc.freeze), so that garbage collections in forked worker
+    processes do not write to (and thereby copy) the memory pages inherited from this process. Garbage is collected
+    first, as frozen objects are never collected. Objects are unfrozen when the last holder releases the freeze."""
+    global n_gc_freeze_holders
+    with gc_freeze_lock:
+        gc.collect()
+        gc.freeze()
+        n_gc_freeze_holders += 1
+
+
+def release_gc_freeze():
+    global n_gc_freeze_holders
+    with gc_freeze_lock:
+        n_gc_freeze_holders -= 1
+        if n_gc_freeze_holders == 0:
+            gc.unfreeze()
+
+
+def smaps_rollup_kb(pid: int | str = 'self') -> dict | None:
+    """Resident memory of a process in KB (Rss, Pss, Shared_Clean, Shared_Dirty, Private_Clean, Private_Dirty)
+    from /proc/<pid>/smaps_rollup (Linux only; None if not available)."""
+    try:
+        with open(f'/proc/{pid}/smaps_rollup', 'r') as f:
+            return {key: int(value.split()[0]) for line in f if (m := line.split(':', 1)) and len(m) == 2
+                    and (key := m[0]) in ('Rss', 'Pss', 'Shared_Clean', 'Shared_Dirty', 'Private_Clean',
+                                          'Private_Dirty')
+                    for value in (m[1],)}
+    except OSError:
+        return None
+
+
+def deep_sizeof(obj) -> int:
+    """Approximate memory (in bytes) held by obj, incl. all objects reachable through containers and slots.
+    Shared objects are counted only once."""
+    size, seen, stack = 0, set(), [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif slots := getattr(type(obj), '__slots__', None):
+            stack.extend(getattr(obj, slot) for slot in slots if hasattr(obj, slot))
+    return size
+
+
+def line_hash(line: str) -> int:
+    """64-bit hash of a line of a resource file (stable across processes, unlike hash())."""
+    return int.from_bytes(hashlib.blake2b(line.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def rom_result_is_serializable(rom_result: str | tuple) -> bool:
+    """True for a romanization string or a tuple of plain edge records, but not for cached number edges (NumEdge),
+    which would lose their class and attributes (value, script etc.) when serialized (e.g. as JSON)."""
+    return isinstance(rom_result, str) or all([isinstance(record, tuple) for record in rom_result])
+
+
+def non_default_items(d: dict) -> dict:
+    """Copy of a (default) dict without entries that were merely created by defaultdict lookups,
+    i.e. without values such as None, False, '', [], {} or an empty Script."""
+    return {k: v for k, v in d.items()
+            if not ((v is None) or (isinstance(v, (bool, str, list, dict, set, DictClass)) and not v))}
+
+
 def fraction_char2fraction(fraction_char: str, fraction_value: float | None = None,
                            uroman: Uroman | None = None) -> Fraction | None:
     s = ''
@@ -184,12 +399,103 @@ class DictClass:
         return len(self.__dict__) > 0
 
 
-class RomRule(DictClass):
-    # key: source string
-    # typical attributes: s (source), t (target), prov (provenance), lcodes (language codes)
-    # t_alts=t_alts (target alternatives), use_only_at_start_of_word, dont_use_at_start_of_word,
-    # use_only_at_end_of_word, dont_use_at_end_of_word, use_only_for_whole_word
-    pass
+# RomRule flags (bitmask)
+RULE_USE_ONLY_AT_START_OF_WORD = 1 << 0
+RULE_DONT_USE_AT_START_OF_WORD = 1 << 1
+RULE_USE_ONLY_AT_END_OF_WORD = 1 << 2
+RULE_DONT_USE_AT_END_OF_WORD = 1 << 3
+RULE_USE_ONLY_FOR_WHOLE_WORD = 1 << 4
+RULE_IS_MINUS_SIGN = 1 << 5
+RULE_IS_PLUS_SIGN = 1 << 6
+RULE_IS_DECIMAL_POINT = 1 << 7
+RULE_IS_LARGE_POWER = 1 << 8
+RULE_WORD_RESTRICTIONS = (RULE_USE_ONLY_AT_START_OF_WORD | RULE_DONT_USE_AT_START_OF_WORD | RULE_USE_ONLY_AT_END_OF_WORD
+                          | RULE_DONT_USE_AT_END_OF_WORD | RULE_USE_ONLY_FOR_WHOLE_WORD)
+
+
+class RomRule:
+    """Romanization rule, stored in Uroman.rom_rules (key: source string).
+    Attributes: s (source), t (target), prov (provenance), lcodes (language codes), t_alts (target alternatives),
+    num, t_at_end_of_syllable, n_restr (number of restrictions), fraction_connector, percentage_marker,
+    int_frac_connector, and flags (bitmask of RULE_USE_ONLY_AT_START_OF_WORD, RULE_IS_MINUS_SIGN etc.)
+    Rules are compact (slots) as there are tens of thousands of them. Dictionary-style read access with
+    hyphenated keys, e.g. rom_rule['t-alts'] or rom_rule['use-only-at-start-of-word'], is still supported."""
+    __slots__ = ('s', 't', 'prov', 'lcodes', 't_alts', 'num', 't_at_end_of_syllable', 'n_restr',
+                 'fraction_connector', 'percentage_marker', 'int_frac_connector', 'flags')
+    flag_keys = {'use-only-at-start-of-word': RULE_USE_ONLY_AT_START_OF_WORD,
+                 'dont-use-at-start-of-word': RULE_DONT_USE_AT_START_OF_WORD,
+                 'use-only-at-end-of-word': RULE_USE_ONLY_AT_END_OF_WORD,
+                 'dont-use-at-end-of-word': RULE_DONT_USE_AT_END_OF_WORD,
+                 'use-only-for-whole-word': RULE_USE_ONLY_FOR_WHOLE_WORD,
+                 'is-minus-sign': RULE_IS_MINUS_SIGN,
+                 'is-plus-sign': RULE_IS_PLUS_SIGN,
+                 'is-decimal-point': RULE_IS_DECIMAL_POINT,
+                 'is-large-power': RULE_IS_LARGE_POWER}
+    # order of keys in repr (same as for DictClass)
+    repr_keys = ('s', 't', 'prov', 'lcodes', 't-alts', 'num', 'use-only-at-start-of-word', 'dont-use-at-start-of-word',
+                 'use-only-at-end-of-word', 'dont-use-at-end-of-word', 'use-only-for-whole-word',
+                 't-at-end-of-syllable', 'n-restr', 'is-minus-sign', 'is-plus-sign', 'is-decimal-point',
+                 'fraction-connector', 'percentage-marker', 'int-frac-connector', 'is-large-power')
+
+    def __init__(self, s: str | None = None, t: str | None = None, prov: str | None = None,
+                 lcodes: List[str] | None = None, t_alts: List[str] | None = None, num=None,
+                 t_at_end_of_syllable: str | None = None, n_restr: int = 0, fraction_connector: str | None = None,
+                 percentage_marker: str | None = None, int_frac_connector: str | None = None, **flag_args):
+        # As for DictClass, values None, [] and False (and equal values such as 0) count as unset (None).
+        self.s = self.value_or_none(s)
+        self.t = self.value_or_none(t)
+        self.prov = self.value_or_none(prov)
+        self.lcodes = self.value_or_none(lcodes)
+        self.t_alts = self.value_or_none(t_alts)
+        self.num = self.value_or_none(num)
+        self.t_at_end_of_syllable = self.value_or_none(t_at_end_of_syllable)
+        self.n_restr = n_restr or 0
+        self.fraction_connector = self.value_or_none(fraction_connector)
+        self.percentage_marker = self.value_or_none(percentage_marker)
+        self.int_frac_connector = self.value_or_none(int_frac_connector)
+        self.flags = 0
+        for flag_arg, value in flag_args.items():
+            if value:
+                self.flags |= self.flag_keys[flag_arg.replace('_', '-')]
+
+    @staticmethod
+    def value_or_none(value):
+        return None if value in (None, [], False) else value
+
+    def __getitem__(self, key: str, default=None):
+        if flag := self.flag_keys.get(key):
+            return True if self.flags & flag else default
+        if key == 'n-restr':
+            return self.n_restr or default
+        try:
+            value = getattr(self, key.replace('-', '_'))
+        except AttributeError:
+            return default
+        return default if value is None else value
+
+    get = __getitem__
+
+    def __reduce__(self):
+        """Compact pickle: slot values without trailing default values (see rom_rule_from_slot_values)"""
+        values = [getattr(self, slot) for slot in self.__slots__]
+        while values and (values[-1] in (None, 0)):
+            values.pop()
+        return rom_rule_from_slot_values, tuple(values)
+
+    def __repr__(self):
+        return str({key: value for key in self.repr_keys if (value := self[key]) is not None})
+
+
+ROM_RULE_SLOT_DEFAULTS = (None, None, None, None, None, None, None, 0, None, None, None, 0)
+
+
+def rom_rule_from_slot_values(*values) -> RomRule:
+    """Fast restore of a pickled RomRule (bypassing the argument normalization of RomRule.__init__)"""
+    rom_rule = object.__new__(RomRule)
+    (rom_rule.s, rom_rule.t, rom_rule.prov, rom_rule.lcodes, rom_rule.t_alts, rom_rule.num,
+     rom_rule.t_at_end_of_syllable, rom_rule.n_restr, rom_rule.fraction_connector, rom_rule.percentage_marker,
+     rom_rule.int_frac_connector, rom_rule.flags) = values + ROM_RULE_SLOT_DEFAULTS[len(values):]
+    return rom_rule
 
 
 class Script(DictClass):
@@ -205,17 +511,524 @@ class RomFormat(Enum):
     ALTS = 'alts'        # lattice including alternative edges
     LATTICE = 'lattice'  # lattice including alternative and superseded edges
 
+    # Members are singletons, so identity hashing is consistent with equality, and much faster than Enum's
+    # default hash (computed in Python), e.g. for rom_cache keys (s, lcode, rom_format).
+    __hash__ = object.__hash__
+
     def __str__(self):
         return self.value
 
 
+class RomCache:
+    """Bounded cache of romanization results with least-recently-used (LRU) eviction.
+    key: (s, lcode, rom_format)  value: romanization result (str or list of edges)
+    lcode is ANY_LCODE for romanizations that do not depend on the language code.
+    Also used for the line memo of romanize_file (key: hash of line etc.  value: output line).
+    Bounded by number of entries (max_size) and optionally by estimated memory (max_bytes).
+    Safe for use by several threads (e.g. AsyncUroman's thread executor)."""
+
+    def __init__(self, max_size: int = DEFAULT_ROM_MAX_CACHE_SIZE, max_bytes: int | None = None):
+        self.entries = OrderedDict()  # from least to most recently used
+        self.lock = threading.RLock()
+        self.max_size = max_size      # max number of entries; 0 or less: no new entries
+        self.max_bytes = max_bytes    # max estimated memory of all entries (None: no limit)
+        self.n_bytes = 0              # estimated memory of all entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self.entries
+
+    def keys(self) -> list:
+        with self.lock:
+            return list(self.entries)
+
+    def items(self) -> list:
+        """(key, value) pairs, from least to most recently used"""
+        with self.lock:
+            return list(self.entries.items())
+
+    def get(self, key, fallback_key=None):
+        """Returns cached value (marking it as most recently used) or None.
+        If there is no entry for key, tries fallback_key (if provided).
+        Hits do not take the lock: get and move_to_end are each a single (atomic) OrderedDict operation,
+        and an entry that is concurrently evicted after the get is still returned. The hits counter is not locked
+        either, so it might miss an increment of a concurrent hit (statistics only)."""
+        entries = self.entries
+        if (value := entries.get(key)) is None:
+            if (fallback_key is None) or ((value := entries.get(fallback_key)) is None):
+                with self.lock:
+                    self.misses += 1
+                return None
+            key = fallback_key
+        self.hits += 1
+        try:
+            entries.move_to_end(key)
+        except KeyError:  # concurrently evicted or removed
+            pass
+        return value
+
+    @staticmethod
+    def entry_n_bytes(key, value) -> int:
+        """Estimated memory (bytes) of a cache entry, incl. key, value and cache overhead.
+        Edges and edge records of a cached value are owned by the cache entry,
+        but their txt strings are often shared."""
+        n_bytes = ROM_CACHE_ENTRY_OVERHEAD_BYTES + sys.getsizeof(key)
+        if isinstance(key, tuple):
+            n_bytes += sys.getsizeof(key[0])
+        if isinstance(value, str):
+            return n_bytes + sys.getsizeof(value)
+        if isinstance(value, tuple):  # edge records (start, end, txt, annotation) or number edges
+            return n_bytes + sys.getsizeof(value) + sum([ROM_CACHE_EDGE_RECORD_BYTES if isinstance(record, tuple)
+                                                         else record.approx_n_bytes for record in value])
+        return n_bytes + sys.getsizeof(value) + sum([edge.approx_n_bytes for edge in value])
+
+    def put(self, key, value):
+        """Adds an entry as most recently used, evicting least recently used entries beyond max_size
+        (and beyond max_bytes, if specified)."""
+        if self.max_size <= 0:
+            return
+        n_bytes = self.entry_n_bytes(key, value)
+        if (self.max_bytes is not None) and (n_bytes > self.max_bytes):
+            return  # would not fit even into an empty cache
+        with self.lock:
+            entries = self.entries
+            if (old_value := entries.get(key)) is not None:
+                self.n_bytes -= self.entry_n_bytes(key, old_value)
+            entries[key] = value
+            entries.move_to_end(key)
+            self.n_bytes += n_bytes
+            self.evict()
+
+    def evict(self):
+        """Evicts least recently used entries while over max_size or max_bytes. Caller holds self.lock."""
+        entries, max_size, max_bytes = self.entries, max(self.max_size, 0), self.max_bytes
+        while (len(entries) > max_size) or ((max_bytes is not None) and (self.n_bytes > max_bytes) and entries):
+            key, value = entries.popitem(last=False)
+            self.n_bytes -= self.entry_n_bytes(key, value)
+            self.evictions += 1
+
+    def pop(self, key, default=None):
+        with self.lock:
+            value = self.entries.pop(key, None)
+            if value is None:
+                return default
+            self.n_bytes -= self.entry_n_bytes(key, value)
+            return value
+
+    def resize(self, max_size: int | None = None, max_bytes: int | None = None):
+        """Changes max_size and/or max_bytes, evicting least recently used entries as needed."""
+        with self.lock:
+            if max_size is not None:
+                self.max_size = max_size
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self.evict()
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.n_bytes = 0
+
+    def stats(self) -> dict:
+        n_lookups = self.hits + self.misses
+        return {'size': len(self.entries), 'max_size': self.max_size, 'bytes': self.n_bytes,
+                'max_bytes': self.max_bytes, 'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'hit_rate': round(self.hits / n_lookups, 4) if n_lookups else None}
+
+
+class AdaptiveRomCache(RomCache):
+    """RomCache whose max_size adapts to the observed hit rate curve, within a memory ceiling (max_bytes).
+    The least recently used step entries form a probation segment; hits there estimate the hit rate that would
+    be lost by shrinking the cache by step entries. Keys of the last step evicted entries are kept as ghosts
+    (without values); ghost hits estimate the hit rate that would be gained by growing the cache by step entries.
+    Every ADAPTIVE_CACHE_INTERVAL misses, the cache grows or shrinks by step (1/8 of max_size) accordingly."""
+
+    def __init__(self, max_size: int = DEFAULT_ROM_MAX_CACHE_SIZE,
+                 max_bytes: int | None = DEFAULT_ADAPTIVE_CACHE_MAX_BYTES, min_size: int = ADAPTIVE_CACHE_MIN_SIZE):
+        super().__init__(max(max_size, min_size), max_bytes=max_bytes)
+        self.min_size = min_size
+        self.probation = OrderedDict()  # least recently used entries (before eviction), from least to most recent
+        self.ghosts = OrderedDict()     # keys of recently evicted entries (values: None)
+        self.probation_hits = 0         # since last adaptation
+        self.ghost_hits = 0             # since last adaptation
+        self.n_lookups_at_adaptation = 0
+        self.misses_at_adaptation = 0
+        self.marginal_hit_rate_gain = None  # estimated hit rate gain of step more entries (at last adaptation)
+        self.marginal_hit_rate_loss = None  # estimated hit rate loss of step fewer entries (at last adaptation)
+
+    @property
+    def step(self) -> int:
+        return max(self.max_size // 8, 1)
+
+    def __len__(self) -> int:
+        return len(self.entries) + len(self.probation)
+
+    def __contains__(self, key) -> bool:
+        return (key in self.entries) or (key in self.probation)
+
+    def keys(self) -> list:
+        with self.lock:
+            return list(self.probation) + list(self.entries)
+
+    def items(self) -> list:
+        with self.lock:
+            return list(self.probation.items()) + list(self.entries.items())
+
+    def get(self, key, fallback_key=None):
+        with self.lock:  # unlike in RomCache.get, hits can move entries between segments
+            return self.get_locked(key, fallback_key)
+
+    def get_locked(self, key, fallback_key=None):
+        entries = self.entries
+        value = entries.get(key)
+        if (value is None) and (fallback_key is not None):
+            if (value := entries.get(fallback_key)) is not None:
+                key = fallback_key
+        if value is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            return value
+        for probation_key in (key, fallback_key):
+            if (probation_key is not None) and ((value := self.probation.pop(probation_key, None)) is not None):
+                self.hits += 1
+                self.probation_hits += 1
+                entries[probation_key] = value  # back to most recently used
+                self.evict()
+                return value
+        self.misses += 1
+        for ghost_key in (key, fallback_key):
+            if (ghost_key is not None) and (ghost_key in self.ghosts):
+                self.ghosts.pop(ghost_key, None)
+                self.ghost_hits += 1
+                break
+        if self.misses - self.misses_at_adaptation >= ADAPTIVE_CACHE_INTERVAL:
+            self.adapt()
+        return None
+
+    def put(self, key, value):
+        with self.lock:
+            if (old_value := self.probation.pop(key, None)) is not None:
+                self.n_bytes -= self.entry_n_bytes(key, old_value)
+            super().put(key, value)
+
+    def evict(self):
+        """Moves least recently used entries beyond max_size - step to probation, and evicts least recently used
+        entries beyond max_size or max_bytes, keeping their keys as ghosts."""
+        entries, probation, step, max_bytes = self.entries, self.probation, self.step, self.max_bytes
+        while len(entries) > max(self.max_size - step, 0):
+            key, value = entries.popitem(last=False)
+            probation[key] = value
+        while (len(probation) > step) or ((max_bytes is not None) and (self.n_bytes > max_bytes)
+                                          and (probation or entries)):
+            key, value = (probation or entries).popitem(last=False)
+            self.n_bytes -= self.entry_n_bytes(key, value)
+            self.evictions += 1
+            self.ghosts[key] = None
+        while len(self.ghosts) > step:
+            self.ghosts.popitem(last=False)
+
+    def adapt(self):
+        """Grows or shrinks max_size by a step, based on ghost and probation hits since the last adaptation."""
+        n_lookups = self.hits + self.misses - self.n_lookups_at_adaptation
+        step = self.step
+        self.marginal_hit_rate_gain = self.ghost_hits / n_lookups
+        self.marginal_hit_rate_loss = self.probation_hits / n_lookups
+        n_entries = len(self)
+        avg_entry_n_bytes = self.n_bytes / n_entries if n_entries else 0
+        if (self.marginal_hit_rate_gain >= ADAPTIVE_CACHE_GROW_THRESHOLD) \
+                and ((self.max_bytes is None) or (avg_entry_n_bytes * (self.max_size + step) <= self.max_bytes)):
+            self.max_size += step
+        elif (self.marginal_hit_rate_loss < ADAPTIVE_CACHE_SHRINK_THRESHOLD) \
+                and (self.max_size - step >= self.min_size):
+            self.max_size -= step
+            self.evict()
+        self.probation_hits, self.ghost_hits = 0, 0
+        self.n_lookups_at_adaptation, self.misses_at_adaptation = self.hits + self.misses, self.misses
+
+    def pop(self, key, default=None):
+        with self.lock:
+            if (value := self.probation.pop(key, None)) is not None:
+                self.n_bytes -= self.entry_n_bytes(key, value)
+                return value
+            return super().pop(key, default)
+
+    def clear(self):
+        with self.lock:
+            super().clear()
+            self.probation.clear()
+            self.ghosts.clear()
+
+    def stats(self) -> dict:
+        result = super().stats()
+        result['size'] = len(self)
+        result.update({'adaptive': True, 'step': self.step,
+                       'marginal_hit_rate_gain': self.marginal_hit_rate_gain,
+                       'marginal_hit_rate_loss': self.marginal_hit_rate_loss})
+        return result
+
+
+class PersistentRomCache:
+    """Optional on-disk (sqlite3) tier of the romanization cache, shared across runs and processes.
+    Entries are stored under a namespace derived from the uroman version and the fingerprint of the loaded
+    data files, so entries of other uroman versions or of modified data files are never served.
+    In read-only mode (e.g. for parallel workers), no entries are added.
+    Results in rom_format LATTICE (full edge objects) and results with number edges (NumEdge) are not stored."""
+    rom_formats = ('str', 'edges', 'alts')
+
+    def __init__(self, filename: str, data_fingerprint: str, read_only: bool = False,
+                 batch_size: int = PERSISTENT_CACHE_BATCH_SIZE):
+        self.filename = filename
+        self.read_only = read_only
+        self.namespace = self.make_namespace(data_fingerprint)
+        self.batch_size = batch_size
+        self.pending_entries = []  # new entries not yet written
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        if read_only:
+            # raises sqlite3.Error if file does not exist
+            self.connection = sqlite3.connect(f'{Path(filename).resolve().as_uri()}?mode=ro', uri=True,
+                                              check_same_thread=False)
+        else:
+            self.connection = sqlite3.connect(filename, check_same_thread=False)
+            self.connection.execute('PRAGMA journal_mode=WAL')  # concurrent readers while writing
+            self.connection.execute('CREATE TABLE IF NOT EXISTS rom_cache (namespace TEXT, s TEXT, lcode TEXT, '
+                                    'rom_format TEXT, rom TEXT, PRIMARY KEY (namespace, s, lcode, rom_format)) '
+                                    'WITHOUT ROWID')
+            self.connection.commit()
+        atexit.register(self.close)
+
+    @staticmethod
+    def make_namespace(data_fingerprint: str) -> str:
+        return hashlib.sha256(f'uroman {__version__} data {data_fingerprint}'.encode('utf-8')).hexdigest()[:32]
+
+    def get(self, s: str, lcode: str | None, rom_format: RomFormat) -> Tuple[str | None, str | tuple] | None:
+        """Returns (lcode of cache key, i.e. lcode or ANY_LCODE; romanization result) or None."""
+        if (rom_format_value := rom_format.value) not in self.rom_formats:
+            return None
+        with self.lock:
+            if self.connection is None:
+                return None
+            rows = self.connection.execute('SELECT lcode, rom FROM rom_cache WHERE namespace = ? AND s = ? '
+                                           'AND rom_format = ? AND lcode IN (?, ?)',
+                                           (self.namespace, s, rom_format_value, ANY_LCODE, lcode or '')).fetchall()
+            if not rows:
+                self.misses += 1
+                return None
+            self.hits += 1
+        row_lcode, rom = min(rows)  # ANY_LCODE ('*') sorts before lcodes
+        if rom_format_value != 'str':
+            rom = tuple([tuple(record) for record in json.loads(rom)])
+        return (ANY_LCODE if row_lcode == ANY_LCODE else lcode), rom
+
+    def put(self, key: Tuple[str, str | None, RomFormat], value: str | tuple):
+        """Adds entry for key (s, lcode, rom_format), written to disk in batches (see flush())."""
+        s, lcode, rom_format = key
+        if self.read_only or ((rom_format_value := rom_format.value) not in self.rom_formats) \
+                or not rom_result_is_serializable(value):
+            return
+        rom = value if rom_format_value == 'str' else json.dumps(value, ensure_ascii=False)
+        with self.lock:
+            self.pending_entries.append((self.namespace, s, lcode or '', rom_format_value, rom))
+            batch_complete = len(self.pending_entries) >= self.batch_size
+        if batch_complete:
+            self.flush()
+
+    def flush(self):
+        """Writes any pending new entries to disk."""
+        with self.lock:
+            pending_entries, self.pending_entries = self.pending_entries, []
+            if (not pending_entries) or (self.connection is None):
+                return
+            try:
+                self.connection.executemany('INSERT OR REPLACE INTO rom_cache VALUES (?, ?, ?, ?, ?)',
+                                            pending_entries)
+                self.connection.commit()
+                self.writes += len(pending_entries)
+            except sqlite3.Error as error:
+                sys.stderr.write(f'Cannot write to persistent cache {self.filename}: {error}\n')
+
+    def close(self):
+        self.flush()
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+    def stats(self) -> dict:
+        n_lookups = self.hits + self.misses
+        return {'filename': self.filename, 'read_only': self.read_only, 'hits': self.hits, 'misses': self.misses,
+                'writes': self.writes, 'hit_rate': round(self.hits / n_lookups, 4) if n_lookups else None}
+
+
+class SharedRomCache:
+    """Optional cross-process tier of the romanization cache, in shared memory (multiprocessing.shared_memory),
+    e.g. for worker processes, each with its own rom_cache. Fixed-size open-addressing hash table with linear probing;
+    when all probed slots are taken, an existing entry is overwritten.
+    Each slot holds a 16-byte digest of the key (incl. namespace, see PersistentRomCache.make_namespace), so
+    processes with other uroman versions or data files can share the same table without ever being served
+    each other's entries. There are no locks: a reader validates an entry by a checksum and
+    treats torn entries (concurrently being written) as misses.
+    Results in rom_format LATTICE (full edge objects) and results with number edges (NumEdge) are not stored.
+    The shared memory block is removed when the process that created it closes it.
+    The counters (hits, misses, writes, too_large) are per process; lock guards them against concurrent threads."""
+    rom_formats = ('str', 'edges', 'alts')
+    header_struct = struct.Struct('<24sII')     # magic, n_slots, slot_size
+    slot_header_struct = struct.Struct('<16s8sI')  # key digest, checksum, value length
+
+    def __init__(self, name: str, data_fingerprint: str, n_slots: int = SHARED_CACHE_N_SLOTS,
+                 slot_size: int = SHARED_CACHE_SLOT_SIZE, create: bool = True):
+        """Attaches to shared memory block name, or, if it does not exist yet and create is True, creates it.
+        When attaching, the n_slots and slot_size of the existing block apply. Raises OSError or ValueError."""
+        self.name = name
+        self.namespace = PersistentRomCache.make_namespace(data_fingerprint)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.too_large = 0  # results not stored, as larger than slot
+        self.created = False
+        try:
+            self.shm = self.attach(name)
+        except FileNotFoundError:
+            if not create:
+                raise
+            try:
+                self.shm = shared_memory.SharedMemory(name=name, create=True,
+                                                      size=self.header_struct.size + n_slots * slot_size)
+                self.created = True
+                self.header_struct.pack_into(self.shm.buf, 0, SHARED_CACHE_MAGIC, n_slots, slot_size)
+            except FileExistsError:  # concurrently created by another process
+                self.shm = self.attach(name)
+        magic, self.n_slots, self.slot_size = self.header_struct.unpack_from(self.shm.buf, 0)
+        if (magic != SHARED_CACHE_MAGIC) or (self.n_slots == 0) \
+                or (self.shm.size < self.header_struct.size + self.n_slots * self.slot_size):
+            # A block created concurrently by another process might not have its header yet.
+            self.shm.close()
+            self.shm = None
+            raise ValueError(f'{name} is not an initialized uroman shared cache')
+        self.max_value_size = self.slot_size - self.slot_header_struct.size
+        atexit.register(self.close)
+
+    @staticmethod
+    def attach(name: str) -> shared_memory.SharedMemory:
+        try:
+            return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+        except TypeError:
+            # Before Python 3.13, the resource tracker would remove the block at exit of any attached process.
+            register, resource_tracker.register = resource_tracker.register, lambda _name, _rtype: None
+            try:
+                return shared_memory.SharedMemory(name=name)
+            finally:
+                resource_tracker.register = register
+
+    def key_digest(self, s: str, lcode: str | None, rom_format_value: str) -> bytes:
+        return hashlib.blake2b(f'{self.namespace}\t{lcode or ""}\t{rom_format_value}\t{s}'
+                               .encode('utf-8', errors='surrogatepass'), digest_size=16).digest()
+
+    @staticmethod
+    def checksum(digest: bytes, value: bytes) -> bytes:
+        return hashlib.blake2b(value, key=digest, digest_size=8).digest()
+
+    def slot_positions(self, digest: bytes):
+        home = int.from_bytes(digest[:8], 'little') % self.n_slots
+        for i in range(SHARED_CACHE_PROBE_LENGTH):
+            yield self.header_struct.size + ((home + i) % self.n_slots) * self.slot_size
+
+    def lookup(self, digest: bytes) -> bytes | None:
+        buf = self.shm.buf
+        for position in self.slot_positions(digest):
+            slot_digest, checksum, value_size = self.slot_header_struct.unpack_from(buf, position)
+            if slot_digest == digest:
+                if value_size <= self.max_value_size:
+                    value_start = position + self.slot_header_struct.size
+                    value = bytes(buf[value_start:value_start + value_size])
+                    if checksum == self.checksum(digest, value):
+                        return value
+                return None  # torn entry
+            if not any(slot_digest):  # empty slot
+                return None
+        return None
+
+    def get(self, s: str, lcode: str | None, rom_format: RomFormat) -> Tuple[str | None, str | tuple] | None:
+        """Returns (lcode of cache key, i.e. lcode or ANY_LCODE; romanization result) or None."""
+        if (self.shm is None) or ((rom_format_value := rom_format.value) not in self.rom_formats):
+            return None
+        for key_lcode in (ANY_LCODE, lcode):
+            if (value := self.lookup(self.key_digest(s, key_lcode, rom_format_value))) is not None:
+                with self.lock:
+                    self.hits += 1
+                rom = value.decode('utf-8', errors='surrogatepass')
+                if rom_format_value != 'str':
+                    rom = tuple([tuple(record) for record in json.loads(rom)])
+                return key_lcode, rom
+        with self.lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: Tuple[str, str | None, RomFormat], value: str | tuple):
+        """Adds entry for key (s, lcode, rom_format), unless its romanization result does not fit into a slot."""
+        s, lcode, rom_format = key
+        if (self.shm is None) or ((rom_format_value := rom_format.value) not in self.rom_formats) \
+                or not rom_result_is_serializable(value):
+            return
+        rom = value if rom_format_value == 'str' else json.dumps(value, ensure_ascii=False)
+        value = rom.encode('utf-8', errors='surrogatepass')
+        if len(value) > self.max_value_size:
+            with self.lock:
+                self.too_large += 1
+            return
+        digest = self.key_digest(s, lcode, rom_format_value)
+        buf = self.shm.buf
+        target_position = None
+        for position in self.slot_positions(digest):
+            slot_digest = bytes(buf[position:position + 16])
+            if (slot_digest == digest) or not any(slot_digest):
+                target_position = position
+                break
+        if target_position is None:  # all probed slots taken; overwrite one of them
+            target_position = self.header_struct.size \
+                + ((int.from_bytes(digest[:8], 'little') + digest[8] % SHARED_CACHE_PROBE_LENGTH)
+                   % self.n_slots) * self.slot_size
+        value_start = target_position + self.slot_header_struct.size
+        buf[value_start:value_start + len(value)] = value
+        self.slot_header_struct.pack_into(buf, target_position, digest, self.checksum(digest, value), len(value))
+        with self.lock:
+            self.writes += 1
+
+    def close(self):
+        if self.shm is not None:
+            shm, self.shm = self.shm, None
+            shm.close()
+            if self.created:
+                try:
+                    shm.unlink()
+                except FileNotFoundError:
+                    pass
+
+    def stats(self) -> dict:
+        n_lookups = self.hits + self.misses
+        return {'name': self.name, 'n_slots': self.n_slots, 'slot_size': self.slot_size, 'hits': self.hits,
+                'misses': self.misses, 'writes': self.writes, 'too_large': self.too_large,
+                'hit_rate': round(self.hits / n_lookups, 4) if n_lookups else None}
+
+
 class Uroman:
     """This class loads and maintains uroman data independent of any specific text corpus.
     Typically, only a single instance will be used. (In contrast to multiple lattice instances, one per text.)
     Methods include some testing. And finally methods to romanize a string (romanize_string()) or an entire file
     (romanize_file())."""
     def __init__(self, data_dir: Path | None = None, **args):  # args: load_log, rebuild_ud_props
+        start_wall_time, start_cpu_time, start_peak_rss = time.perf_counter(), time.process_time(), peak_rss_kb()
+        self.load_profile = []  # wall time, CPU time, peak RSS delta and entries per resource (see load_report())
         self.data_dir = data_dir or self.default_data_dir(**args)
+        self.init_args = args  # for loading equivalent instances, e.g. in spawned worker processes
         self.rom_rules = defaultdict(list)
         self.scripts = defaultdict(Script)
         self.dict_bool = defaultdict(bool)
@@ -226,22 +1039,79 @@ class Uroman:
         # values:  {"txt": "\u137b", "rom": "100", "value": 100, "type": "base", "mult": 1, "script": "Ethiopic"}
         self.num_props = defaultdict(dict)
         self.dict_set = defaultdict(set)
+        # trie over the source strings of rom_rules: nested dicts keyed by char; key '' marks a full source string
+        self.s_prefix_trie = {}
+        # single-codepoint properties, indexed by codepoint: script (as index into script_names) and flags (CP_...)
+        self.script_names = ['']
+        self.script_ids = {'': 0}  # key: script name  value: index in script_names
+        self.chr_script_ids = array('H', [0]) * CODEPOINT_TABLE_SIZE
+        self.chr_flags = array('H', [0]) * CODEPOINT_TABLE_SIZE
         self.fraction_connectors = {}
         self.minus_signs = {}
         self.plus_signs = {}
         self.float2fraction = {}  # caching
         gc.disable()
-        self.rom_cache = {}   # key: (s, lcode) value: t
-        self.rom_cache_size = 0
-        self.rom_max_cache_size = args.get('cache_size', 0)
-        self.cache_p = (self.rom_max_cache_size != 0)
+        # key: (s, lcode, rom_format) value: t
+        if args.get('adaptive_cache'):
+            self.rom_cache = AdaptiveRomCache(args.get('cache_size') or DEFAULT_ROM_MAX_CACHE_SIZE,
+                                              max_bytes=args.get('cache_max_bytes') or DEFAULT_ADAPTIVE_CACHE_MAX_BYTES)
+        else:
+            self.rom_cache = RomCache(args.get('cache_size', 0), max_bytes=args.get('cache_max_bytes'))
+        self.cache_p = (self.rom_cache.max_size != 0)
+        self.token_delimiter_regex = self.compile_token_delimiter_regex(args.get('token_delimiters'))
+        # optional memo of romanize_file output lines  key: hash of line, lcode, rom_format (see line_memo_key)
+        self.line_memo = RomCache(line_memo_size) if (line_memo_size := args.get('line_memo_size')) else None
         self.hangul_rom = {}
         self.stats = defaultdict(int)  # stats, e.g. for unprocessed numbers
+        self.stats_lock = threading.Lock()
         self.abugida_cache = {}  # key: (script, char_rom) value: (base_rom, base_rom_plus_abugida_vowel, modified rom)
-        self.load_resource_files(self.data_dir, args.get('load_log', False),
-                                 args.get('rebuild_ud_props', False),
-                                 args.get('rebuild_num_props', False))
+        # key: char  value: (rom, edge annotation) for context-free chars, None for context-sensitive chars
+        self.context_free_roms = {}
+        with self.profiled_load('resource file digests') as load_record:
+            self.resource_file_digests = self.compute_resource_file_digests(self.data_dir)  # as of loading time
+            load_record['entries'] = len(self.resource_file_digests)
+        self.data_fingerprint = self.resource_fingerprint(self.resource_file_digests)
+        self.persistent_rom_cache = None
+        if persistent_cache := args.get('persistent_cache'):
+            self.open_persistent_cache(persistent_cache, read_only=args.get('persistent_cache_read_only', False))
+        self.shared_rom_cache = None
+        if shared_cache := args.get('shared_cache'):
+            self.open_shared_cache(shared_cache, n_slots=args.get('shared_cache_slots') or SHARED_CACHE_N_SLOTS)
+        # key: base filename of a romanization data file (see ROM_RULE_FILES)
+        # value: (list of source string s for each line, array of line hashes), see reload()
+        self.rom_file_lines = {}
+        load_log = args.get('load_log', False)
+        rebuild_ud_props = args.get('rebuild_ud_props', False)
+        rebuild_num_props = args.get('rebuild_num_props', False)
+        # lazy script groups (see LAZY_SCRIPT_GROUPS) key: group name  value: regex matching chars of that group
+        self.pending_script_groups = {group: regex.compile('[' + ''.join(f'{chr(r[0])}-{chr(r[1])}'
+                                                                         for r in props['ranges']) + ']')
+                                      for group, props in LAZY_SCRIPT_GROUPS.items()}
+        self.deferred_rom_entries = defaultdict(list)  # key: group  value: list of rom-file entries (not yet loaded)
+        self.script_group_snapshots = {}  # key: group  value: pickled table entries (from snapshot)
+        self.script_group_lock = threading.Lock()
+        self.load_log = load_log
+        self.load_source = 'resource files'
+        if not (rebuild_ud_props or rebuild_num_props or not args.get('use_snapshot', True)):
+            with self.profiled_load('snapshot') as load_record:
+                if self.load_snapshot(args.get('snapshot_filename'), load_log=load_log):
+                    self.load_source = 'snapshot'
+                    load_record['entries'] = len(self.rom_rules)
+        if self.load_source != 'snapshot':
+            self.load_resource_files(self.data_dir, load_log, rebuild_ud_props, rebuild_num_props)
+        if (not args.get('lazy_script_loading', True)) or args.get('test'):
+            self.load_scripts()
+        elif args.get('scripts') or args.get('lcodes'):
+            self.load_scripts(scripts=args.get('scripts'), lcodes=args.get('lcodes'))
         gc.enable()
+        self.prefork = False
+        if args.get('prefork'):
+            self.prepare_for_fork()
+        end_peak_rss = peak_rss_kb()
+        self.load_totals = {'wall_sec': round(time.perf_counter() - start_wall_time, 6),
+                            'cpu_sec': round(time.process_time() - start_cpu_time, 6),
+                            'peak_rss_delta_kb': None if end_peak_rss is None else end_peak_rss - start_peak_rss,
+                            'peak_rss_kb': end_peak_rss}
         self.n_error_messages_output = 0
         self.n_non_utf8_characters = 0
 
@@ -255,11 +1125,250 @@ class Uroman:
             sys.stderr.write(f"mini_test_dir: {str(mini_test_dir)}\n")
         return data_dir
 
-    def reset_cache(self, cache_size: int = DEFAULT_ROM_MAX_CACHE_SIZE):
-        self.rom_cache = {}
-        self.rom_cache_size = 0
-        self.rom_max_cache_size = cache_size
-        self.cache_p = (self.rom_max_cache_size != 0)
+    # Tables that are built from the resource files and saved in/restored from a snapshot.
+    # Codepoint-indexed arrays are stored as runs of non-zero values (see changed_runs()).
+    snapshot_tables = ('rom_rules', 's_prefix_trie', 'scripts', 'dict_bool', 'dict_str', 'dict_int', 'dict_num',
+                       'num_props', 'dict_set', 'fraction_connectors', 'minus_signs', 'plus_signs',
+                       'script_names', 'script_ids', 'chr_script_ids', 'chr_flags', 'rom_file_lines')
+
+    def default_snapshot_filename(self) -> str:
+        return os.path.join(self.data_dir, SNAPSHOT_FILENAME)
+
+    @staticmethod
+    def compute_resource_file_digests(data_dir: Path) -> dict:
+        """Returns a hash of the content of each resource file (key: base filename; value: None for missing files)."""
+        result = {}
+        for base_file in RESOURCE_FILES:
+            try:
+                with open(os.path.join(data_dir, base_file), 'rb') as f:
+                    result[base_file] = hashlib.sha256(f.read()).hexdigest()
+            except OSError:
+                result[base_file] = None
+        return result
+
+    @staticmethod
+    def resource_fingerprint(resource_file_digests: dict) -> str:
+        """Hash over the uroman version and the content of all resource files. Any edit of a resource file
+        (or a new uroman version) results in a new fingerprint and thereby invalidates any older snapshot."""
+        h = hashlib.sha256(f'uroman {__version__} snapshot-format {SNAPSHOT_FORMAT_VERSION}'.encode('utf-8'))
+        for base_file in RESOURCE_FILES:
+            h.update(f'\n{base_file} {resource_file_digests.get(base_file) or "** missing **"}'.encode('utf-8'))
+        return h.hexdigest()
+
+    def table_entries(self, table_name: str, old_table: dict | list | array | None = None) -> dict | list:
+        """Returns the entries of a resource table that are new or modified with respect to old_table (default: empty),
+        i.e. a dict (for dict tables) or a list of runs (for lists and codepoint-indexed arrays, see changed_runs())."""
+        table = getattr(self, table_name)
+        if isinstance(table, dict):
+            if old_table is None:
+                return non_default_items(table)
+            return non_default_items({k: v for k, v in table.items()
+                                      if (k not in old_table) or ((old_table[k] is not v) and (old_table[k] != v))})
+        if old_table is None:
+            old_table = (array(table.typecode, [0]) * len(table)) if isinstance(table, array) else []
+        return changed_runs(old_table, table)
+
+    def update_table(self, table_name: str, entries: dict | list):
+        """Adds entries (as returned by table_entries()) to a resource table."""
+        table = getattr(self, table_name)
+        if isinstance(table, dict):
+            table.update(entries)
+        else:
+            for start, values in entries:
+                table[start:start+len(values)] = values
+
+    def script_group_table_entries(self, group: str) -> dict:
+        """Loads a lazy script group and returns the resulting new or modified table entries."""
+        old_tables = {}
+        for table_name in self.snapshot_tables:
+            table = getattr(self, table_name)
+            # shallow copy; rom_rules lists are also copied, as they might be extended
+            old_tables[table_name] = {k: (v[:] if isinstance(v, list) else v) for k, v in table.items()} \
+                if isinstance(table, dict) else table[:]
+        self.load_script_group(group)
+        result = {}
+        for table_name in self.snapshot_tables:
+            if entries := self.table_entries(table_name, old_tables[table_name]):
+                result[table_name] = entries
+        return result
+
+    def save_snapshot(self, filename: str | None = None) -> str | None:
+        """Writes all loaded resource tables to a binary snapshot file that can be loaded in one bulk read,
+        which is much faster than re-parsing the resource files. Returns the snapshot filename (or None).
+        Table entries of lazy script groups are stored as separate pickles that are unpickled only on demand."""
+        filename = filename or self.default_snapshot_filename()
+        # The base tables must not include any lazy script group, so use a fresh Uroman object if necessary.
+        uroman = self if (len(self.pending_script_groups) == len(LAZY_SCRIPT_GROUPS)) and self.deferred_rom_entries \
+            else Uroman(self.data_dir, use_snapshot=False)
+        uroman.add_all_chr_name_props()
+        tables = {table_name: uroman.table_entries(table_name) for table_name in self.snapshot_tables}
+        script_groups = {group: pickle.dumps(uroman.script_group_table_entries(group), protocol=pickle.HIGHEST_PROTOCOL)
+                         for group in LAZY_SCRIPT_GROUPS}
+        snapshot = {'format': SNAPSHOT_FORMAT_VERSION,
+                    'fingerprint': uroman.data_fingerprint,
+                    'tables': tables,
+                    'script_groups': script_groups}
+        tmp_filename = f'{filename}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_filename, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_filename, filename)  # atomic, so that concurrent readers never see a partial snapshot
+        except OSError as error:
+            sys.stderr.write(f'Cannot write snapshot {filename} ({error})\n')
+            return None
+        return filename
+
+    def load_snapshot(self, filename: str | None = None, load_log: bool = False) -> bool:
+        """Loads all resource tables from a snapshot file (see save_snapshot()).
+        Returns False (without loading anything) if there is no snapshot or if it is outdated."""
+        filename = filename or self.default_snapshot_filename()
+        try:
+            with open(filename, 'rb') as f:
+                snapshot_bytes = f.read()
+        except OSError:
+            return False
+        try:
+            snapshot = pickle.loads(snapshot_bytes)
+        except Exception as error:  # e.g. truncated file or incompatible pickle
+            sys.stderr.write(f'Ignoring unreadable snapshot {filename} ({error})\n')
+            return False
+        if (not isinstance(snapshot, dict) or (snapshot.get('format') != SNAPSHOT_FORMAT_VERSION)
+                or (snapshot.get('fingerprint') != self.data_fingerprint)):
+            if load_log:
+                sys.stderr.write(f'Ignoring outdated snapshot {filename}\n')
+            return False
+        for table_name, entries in snapshot['tables'].items():
+            self.update_table(table_name, entries)
+        self.script_group_snapshots = snapshot['script_groups']
+        if load_log:
+            sys.stderr.write(f'Loaded snapshot {filename} ({len(snapshot_bytes):,d} bytes, '
+                             f'{len(self.rom_rules):,d} rom_rules entries)\n')
+        return True
+
+    def reset_cache(self, cache_size: int = DEFAULT_ROM_MAX_CACHE_SIZE, cache_max_bytes: int | None = None,
+                    adaptive: bool = False):
+        if adaptive:
+            self.rom_cache = AdaptiveRomCache(cache_size or DEFAULT_ROM_MAX_CACHE_SIZE,
+                                              max_bytes=cache_max_bytes or DEFAULT_ADAPTIVE_CACHE_MAX_BYTES)
+        else:
+            self.rom_cache = RomCache(cache_size, max_bytes=cache_max_bytes)
+        if self.line_memo is not None:
+            self.line_memo.clear()
+        self.cache_p = (self.rom_cache.max_size != 0)
+
+    def cache_stats(self) -> dict:
+        """Returns size, max_size, bytes, max_bytes, hits, misses, evictions and hit_rate of the romanization cache.
+        bytes is an estimate of the memory held by the cache entries."""
+        result = self.rom_cache.stats()
+        if self.persistent_rom_cache is not None:
+            result['persistent'] = self.persistent_rom_cache.stats()
+        if self.shared_rom_cache is not None:
+            result['shared'] = self.shared_rom_cache.stats()
+        if self.line_memo is not None:
+            result['line_memo'] = self.line_memo.stats()
+        return result
+
+    def warm_cache(self, tokens: Iterable[str], lcodes: List[str | None] | str | None = None,
+                   rom_formats: List[RomFormat] | RomFormat | None = None) -> int:
+        """Pre-populates the romanization cache with tokens, e.g. from a frequency-ranked token list
+        (most frequent first), for the given language codes (default: None) and formats (default: STR).
+        Only as many tokens as fit into the cache are used. Returns number of tokens romanized."""
+        if not self.cache_p:
+            return 0
+        lcodes = [lcodes] if (lcodes is None) or isinstance(lcodes, str) else lcodes
+        rom_formats = [rom_formats or RomFormat.STR] if not isinstance(rom_formats, list) else rom_formats
+        tokens = [token for token, _ in zip(tokens, range(max(self.rom_cache.max_size, 0)))]
+        # least frequent first, so that the most frequent tokens end up as most recently used
+        for token in reversed(tokens):
+            for lcode in lcodes:
+                for rom_format in rom_formats:
+                    self.romanize_string_segments(token, lcode, rom_format)
+        return len(tokens)
+
+    def export_cache(self, filename: str | None = None, max_entries: int | None = None) -> List[dict]:
+        """Returns the cache entries (except for rom_format LATTICE and results with number edges, which would lose
+        their NumEdge attributes), most recently used first, as dicts
+        with keys s, lcode, format and rom. If a filename is provided, they are also written to that file
+        (JSON lines, after a header line with uroman version and data fingerprint), e.g. for warm_cache_from_file()."""
+        entries = []
+        for (s, lcode, rom_format), rom in reversed(self.rom_cache.items()):
+            if (rom_format != RomFormat.LATTICE) and rom_result_is_serializable(rom):
+                entries.append({'s': s, 'lcode': lcode, 'format': rom_format.value, 'rom': rom})
+                if max_entries and len(entries) >= max_entries:
+                    break
+        if filename:
+            with open(filename, 'w', encoding='utf-8') as f_out:
+                f_out.write(json.dumps({'uroman-cache': {'version': __version__,
+                                                         'data_fingerprint': self.data_fingerprint}}) + '\n')
+                for entry in entries:
+                    f_out.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        return entries
+
+    def warm_cache_from_file(self, filename: str, lcodes: List[str | None] | str | None = None,
+                             rom_formats: List[RomFormat] | RomFormat | None = None) -> int:
+        """Pre-populates the romanization cache from a file, either a token list (one token per line,
+        optionally followed by a tab and a count; most frequent first), or a file written by export_cache().
+        Exported entries are used directly if the data files are unchanged, and romanized again otherwise.
+        Returns number of tokens or entries."""
+        try:
+            f = open(filename, 'r', encoding='utf-8')
+        except OSError:
+            sys.stderr.write(f'Cannot open cache warm-up file {filename}\n')
+            return 0
+        with f:
+            lines = f.read().splitlines()
+        header = None
+        if lines and lines[0].startswith('{"uroman-cache":'):
+            header = json.loads(lines[0])['uroman-cache']
+        if header is None:
+            return self.warm_cache([token for line in lines if (token := line.split('\t')[0])], lcodes, rom_formats)
+        if not self.cache_p:
+            return 0
+        entries = [json.loads(line) for line in lines[1:1+max(self.rom_cache.max_size, 0)]]
+        up_to_date = (header.get('version') == __version__) \
+            and (header.get('data_fingerprint') == self.data_fingerprint)
+        for entry in reversed(entries):  # least recently used first
+            rom_format = RomFormat(entry['format'])
+            if up_to_date:
+                rom = entry['rom'] if rom_format == RomFormat.STR else tuple([tuple(record) for record in entry['rom']])
+                self.rom_cache.put((entry['s'], entry['lcode'], rom_format), rom)
+            else:
+                lcode = None if entry['lcode'] == ANY_LCODE else entry['lcode']
+                self.romanize_string_segments(entry['s'], lcode, rom_format)
+        return len(entries)
+
+    def open_persistent_cache(self, filename: str, read_only: bool = False) -> bool:
+        """Adds an on-disk (sqlite3) tier to the romanization cache, shared across runs (see PersistentRomCache)."""
+        self.close_persistent_cache()
+        try:
+            self.persistent_rom_cache = PersistentRomCache(filename, self.data_fingerprint, read_only=read_only)
+        except sqlite3.Error as error:
+            sys.stderr.write(f'Cannot open persistent cache {filename}: {error}\n')
+            return False
+        return True
+
+    def close_persistent_cache(self):
+        """Writes any pending entries to the persistent cache and closes it."""
+        if self.persistent_rom_cache is not None:
+            self.persistent_rom_cache.close()
+            self.persistent_rom_cache = None
+
+    def open_shared_cache(self, name: str, n_slots: int = SHARED_CACHE_N_SLOTS, create: bool = True) -> bool:
+        """Adds a shared memory tier to the romanization cache, shared across processes (see SharedRomCache).
+        Attaches to an existing shared cache of that name, or creates it (if create is True)."""
+        self.close_shared_cache()
+        try:
+            self.shared_rom_cache = SharedRomCache(name, self.data_fingerprint, n_slots=n_slots, create=create)
+        except (OSError, ValueError) as error:
+            sys.stderr.write(f'Cannot open shared cache {name}: {error}\n')
+            return False
+        return True
+
+    def close_shared_cache(self):
+        """Detaches from the shared cache (and removes it, if created by this process)."""
+        if self.shared_rom_cache is not None:
+            self.shared_rom_cache.close()
+            self.shared_rom_cache = None
 
     # noinspection SpellCheckingInspection
     def second_rom_filter(self, c: str, rom: str, name: str | None) -> Tuple[str | None, str]:
@@ -277,142 +1386,182 @@ class Uroman:
                 return c, name
         return None, name
 
-    def load_rom_file(self, filename: str, provenance: str, file_format: str = None, load_log: bool = True):
+    def load_rom_file(self, filename: str, provenance: str, file_format: str = None, load_log: bool = True,
+                      defer_script_groups: bool = False) -> int:
         """Reads in and processes the 3 main romanization data files: (1) romanization-auto-table.txt
         which was automatically generated from UnicodeData.txt (2) UnicodeDataOverwrite.txt that "corrects"
         some entries in romanization-auto-table.txt and (3) romanization-table.txt which was largely manually
-        created and allows complex romanization rules, some for specific languages, some for specific contexts."""
+        created and allows complex romanization rules, some for specific languages, some for specific contexts.
+        With defer_script_groups, entries for pending lazy script groups are set aside (see load_script_group())."""
         n_entries = 0
         try:
             f = open(filename, 'r', encoding='utf-8')
         except FileNotFoundError:
             sys.stderr.write(f'Cannot open file {filename}\n')
-            return
+            return 0
+        # source string s and hash of each line (None and 0 for comments etc.), see reload()
+        line_keys, line_hashes = [], array('Q')
         with (f):
             for line_number, line in enumerate(f, 1):
-                if line.startswith('#'):
+                if (d := self.rom_file_line_to_dict(line)) is None:
+                    line_keys.append(None)
+                    line_hashes.append(0)
                     continue
-                if regex.match(r'^\s*$', line):  # blank line
-                    continue
-                line = regex.sub(r'\s{2,}#.*$', '', line)
-                if file_format == 'u2r':
-                    t_at_end_of_syllable = None
-                    u = dequote_string(slot_value_in_double_colon_del_list(line, 'u'))
-                    try:
-                        cp = int(u, 16)
-                        s = chr(cp)
-                    except ValueError:
-                        continue
-                    t = dequote_string(slot_value_in_double_colon_del_list(line, 'r'))
-                    if name := slot_value_in_double_colon_del_list(line, 'name'):
-                        self.dict_str[('name', s)] = name
-                    if pic := slot_value_in_double_colon_del_list(line, 'pic'):
-                        self.dict_str[('pic', s)] = pic
-                    if tone_mark := slot_value_in_double_colon_del_list(line, 'tone-mark'):
-                        self.dict_str[('tone-mark', s)] = tone_mark
-                    if syllable_info := slot_value_in_double_colon_del_list(line, 'syllable-info'):
-                        self.dict_str[('syllable-info', s)] = syllable_info
-                else:
-                    s = dequote_string(slot_value_in_double_colon_del_list(line, 's'))
-                    t = dequote_string(slot_value_in_double_colon_del_list(line, 't'))
-                    t_at_end_of_syllable = dequote_string(slot_value_in_double_colon_del_list(line,
-                                                                                              't-end-of-syllable'))
-                if (num_s := slot_value_in_double_colon_del_list(line, 'num')) is not None:
-                    num = robust_str_to_num(num_s)
-                    self.dict_num[s] = (num_s if (num is None) else num)
-                is_minus_sign = has_value_in_double_colon_del_list(line, 'is-minus-sign')
-                if is_minus_sign:
-                    self.minus_signs[s] = True
-                is_plus_sign = has_value_in_double_colon_del_list(line, 'is-plus-sign')
-                if is_plus_sign:
-                    self.plus_signs[s] = True
-                is_decimal_point = has_value_in_double_colon_del_list(line, 'is-decimal-point')
-                is_large_power = has_value_in_double_colon_del_list(line, 'is-large-power')
-                fraction_connector = slot_value_in_double_colon_del_list(line, 'fraction-connector')
-                if fraction_connector:
-                    self.fraction_connectors[s] = True
-                percentage_marker = slot_value_in_double_colon_del_list(line, 'percentage-marker')
-                int_frac_connector = slot_value_in_double_colon_del_list(line, 'int-frac-connector')
-                lcode_s = slot_value_in_double_colon_del_list(line, 'lcode')
-                lcodes = regex.split(r'[,;]\s*', lcode_s) if lcode_s else []
-                use_only_at_start_of_word = has_value_in_double_colon_del_list(line, 'use-only-at-start-of-word')
-                dont_use_at_start_of_word = has_value_in_double_colon_del_list(line, 'dont-use-at-start-of-word')
-                use_only_at_end_of_word = has_value_in_double_colon_del_list(line, 'use-only-at-end-of-word')
-                dont_use_at_end_of_word = has_value_in_double_colon_del_list(line, 'dont-use-at-end-of-word')
-                use_only_for_whole_word = has_value_in_double_colon_del_list(line, 'use-only-for-whole-word')
-                num_s = slot_value_in_double_colon_del_list(line, 'num')
-                num = robust_str_to_num(num_s, filename, line_number, silent=False)
-                t_alt_s = slot_value_in_double_colon_del_list(line, 't-alt')
-                t_alts = regex.split(r'[,;]\s*', t_alt_s) if t_alt_s else []
-                t_alts = list(map(dequote_string, t_alts))
-                t_mod, name2 = self.second_rom_filter(s, t, None)
-                if t_mod and (t_mod != t):
-                    if t != s:
-                        pass  # sys.stderr.write(f"UPDATE: {s} {name2} {t} -> {t_mod}\n")
-                    t = t_mod
-                if s is not None:
-                    for bool_key in ('is-large-power', 'is-minus-sign', 'is-plus-sign', 'is-decimal-point'):
-                        bool_value = eval(bool_key.replace('-', '_'))
-                        if bool_value:
-                            self.dict_bool[(bool_key, s)] = True
-                    if any_not_none(t, num, is_minus_sign, is_plus_sign, is_decimal_point, is_large_power,
-                                    fraction_connector, percentage_marker, int_frac_connector):
-                        self.register_s_prefix(s)
-                        n_entries += 1
-                        # if regex.match(r'[\u2800-\u28FF]', s): print("Braille", s, t)
-                        restrictions = [lcodes, use_only_at_start_of_word, dont_use_at_start_of_word,
-                                        use_only_at_end_of_word, dont_use_at_end_of_word, use_only_for_whole_word]
-                        n_restrictions = len([restr for restr in restrictions if restr])
-                        provenance2 = provenance
-                        if (t is None) and (num is not None) and (provenance2 == "rom"):
-                            provenance2 = "num"
-                        new_rom_rule = RomRule(s=s, t=t, prov=provenance2, lcodes=lcodes, t_alts=t_alts, num=num,
-                                               use_only_at_start_of_word=use_only_at_start_of_word,
-                                               dont_use_at_start_of_word=dont_use_at_start_of_word,
-                                               use_only_at_end_of_word=use_only_at_end_of_word,
-                                               dont_use_at_end_of_word=dont_use_at_end_of_word,
-                                               use_only_for_whole_word=use_only_for_whole_word,
-                                               t_at_end_of_syllable=t_at_end_of_syllable,
-                                               n_restr=n_restrictions,
-                                               is_minus_sign=is_minus_sign,
-                                               is_plus_sign=is_plus_sign,
-                                               is_decimal_point=is_decimal_point,
-                                               fraction_connector=fraction_connector,
-                                               percentage_marker=percentage_marker,
-                                               int_frac_connector=int_frac_connector,
-                                               is_large_power=is_large_power)
-                        old_rom_rules = self.rom_rules[s]
-                        if ((len(old_rom_rules) == 1) and (old_rom_rules[0]['prov'] in ('ud', 'ow'))
-                                and not (lcodes or use_only_at_start_of_word or dont_use_at_start_of_word
-                                         or use_only_at_end_of_word or dont_use_at_end_of_word
-                                         or use_only_for_whole_word)):
-                            self.rom_rules[s] = [new_rom_rule]  # overwrite
-                        else:
-                            self.rom_rules[s].append(new_rom_rule)
-        # Thai
+                line_keys.append(self.rom_entry_source(d, file_format))
+                line_hashes.append(line_hash(line))
+                if self.load_rom_entry(d, provenance, file_format, filename, line_number, defer_script_groups):
+                    n_entries += 1
+        self.rom_file_lines[os.path.basename(filename)] = (line_keys, line_hashes)
+        self.add_thai_cancellation_rules()
+        if load_log:
+            sys.stderr.write(f'Loaded {n_entries} from {filename}\n')
+        return n_entries
+
+    @staticmethod
+    def rom_file_line_to_dict(line: str) -> dict | None:
+        """Slot-value dict of a line of a romanization data file (None for comments and blank lines)."""
+        if line.startswith('#'):
+            return None
+        if regex.match(r'^\s*$', line):  # blank line
+            return None
+        if '#' in line:
+            line = regex.sub(r'\s{2,}#.*$', '', line)
+        return double_colon_del_list_to_dict(line)
+
+    @staticmethod
+    def rom_entry_source(d: dict, file_format: str | None) -> str | None:
+        """Source string s of an entry (slot-value dict) of a romanization data file."""
+        if file_format == 'u2r':
+            try:
+                return chr(int(dequote_string(d.get('u')), 16))
+            except (ValueError, TypeError):
+                return None
+        return dequote_string(d.get('s'))
+
+    def add_thai_cancellation_rules(self, keys: set | None = None):
+        """Thai cancellation mark rules, unless there are already other rules (optionally restricted to keys)."""
         thai_cancellation_mark = '\u0E4C'
         # cancellation applies to preceding letter incl. any vowel modifier letter
         # noinspection SpellCheckingInspection (e.g. ศักดิ์สิทธิ์ -> saksit)
         for cp in range(0x0E01, 0x0E4C):   # Thai
             c = chr(cp)
             s = c + thai_cancellation_mark
-            new_rom_rule = RomRule(s=s, t='', prov='auto cancel letter')
-            if not self.rom_rules[s]:
-                self.rom_rules[s] = [new_rom_rule]
-                self.register_s_prefix(s)
+            if (keys is None) or (s in keys):
+                new_rom_rule = RomRule(s=s, t='', prov='auto cancel letter')
+                if not self.rom_rules[s]:
+                    self.rom_rules[s] = [new_rom_rule]
+                    self.register_s_prefix(s)
         thai_consonants = list(map(chr, range(0x0E01, 0x0E2F)))
         thai_vowel_modifiers = ['\u0E31', '\u0E47'] + list(map(chr, range(0x0E33, 0x0E3B)))
         for c1 in thai_consonants:
             for v in thai_vowel_modifiers:
                 s = c1 + v + thai_cancellation_mark
-                new_rom_rule = RomRule(s=s, t='', prov='auto cancel syllable')
-                if not self.rom_rules[s]:
-                    self.rom_rules[s] = [new_rom_rule]
-                    self.register_s_prefix(s)
-        if load_log:
-            sys.stderr.write(f'Loaded {n_entries} from {filename}\n')
+                if (keys is None) or (s in keys):
+                    new_rom_rule = RomRule(s=s, t='', prov='auto cancel syllable')
+                    if not self.rom_rules[s]:
+                        self.rom_rules[s] = [new_rom_rule]
+                        self.register_s_prefix(s)
 
-    def load_script_file(self, filename: str, load_log: bool = True):
+    def load_rom_entry(self, d: dict, provenance: str, file_format: str | None, filename: str, line_number: int,
+                       defer_script_groups: bool = False) -> bool:
+        """Processes a single line (slot-value dict) of a romanization data file. Returns True if an entry was added."""
+        s = self.rom_entry_source(d, file_format)
+        if file_format == 'u2r':
+            if s is None:
+                return False
+            cp = ord(s)
+            t_at_end_of_syllable = None
+            t = dequote_string(d.get('r'))
+        else:
+            t = dequote_string(d.get('t'))
+            t_at_end_of_syllable = dequote_string(d.get('t-end-of-syllable'))
+        if defer_script_groups and s and (group := self.script_group_of_char(s[0])):
+            self.deferred_rom_entries[group].append((d, provenance, file_format, filename, line_number))
+            return False
+        if file_format == 'u2r':
+            if name := d.get('name'):
+                self.dict_str[('name', s)] = name
+                self.chr_flags[cp] &= ~CP_NAME_FLAGS  # (re)computed from new name on next use (see chr_props)
+            if pic := d.get('pic'):
+                self.dict_str[('pic', s)] = pic
+            if tone_mark := d.get('tone-mark'):
+                self.dict_str[('tone-mark', s)] = tone_mark
+                self.chr_flags[cp] |= CP_TONE_MARK
+            if syllable_info := d.get('syllable-info'):
+                self.dict_str[('syllable-info', s)] = syllable_info
+        if (num_s := d.get('num')) is not None:
+            num = robust_str_to_num(num_s)
+            self.dict_num[s] = (num_s if (num is None) else num)
+        is_minus_sign = 'is-minus-sign' in d
+        if is_minus_sign:
+            self.minus_signs[s] = True
+        is_plus_sign = 'is-plus-sign' in d
+        if is_plus_sign:
+            self.plus_signs[s] = True
+        is_decimal_point = 'is-decimal-point' in d
+        is_large_power = 'is-large-power' in d
+        fraction_connector = d.get('fraction-connector')
+        if fraction_connector:
+            self.fraction_connectors[s] = True
+        percentage_marker = d.get('percentage-marker')
+        int_frac_connector = d.get('int-frac-connector')
+        lcode_s = d.get('lcode')
+        lcodes = regex.split(r'[,;]\s*', lcode_s) if lcode_s else []
+        use_only_at_start_of_word = 'use-only-at-start-of-word' in d
+        dont_use_at_start_of_word = 'dont-use-at-start-of-word' in d
+        use_only_at_end_of_word = 'use-only-at-end-of-word' in d
+        dont_use_at_end_of_word = 'dont-use-at-end-of-word' in d
+        use_only_for_whole_word = 'use-only-for-whole-word' in d
+        num = robust_str_to_num(num_s, filename, line_number, silent=False)
+        t_alt_s = d.get('t-alt')
+        t_alts = regex.split(r'[,;]\s*', t_alt_s) if t_alt_s else []
+        t_alts = list(map(dequote_string, t_alts))
+        t_mod, name2 = self.second_rom_filter(s, t, None)
+        if t_mod and (t_mod != t):
+            if t != s:
+                pass  # sys.stderr.write(f"UPDATE: {s} {name2} {t} -> {t_mod}\n")
+            t = t_mod
+        if s is not None:
+            for bool_key in ('is-large-power', 'is-minus-sign', 'is-plus-sign', 'is-decimal-point'):
+                if bool_key in d:
+                    self.dict_bool[(bool_key, s)] = True
+            if any_not_none(t, num, is_minus_sign, is_plus_sign, is_decimal_point, is_large_power,
+                            fraction_connector, percentage_marker, int_frac_connector):
+                self.register_s_prefix(s)
+                # if regex.match(r'[\u2800-\u28FF]', s): print("Braille", s, t)
+                restrictions = [lcodes, use_only_at_start_of_word, dont_use_at_start_of_word,
+                                use_only_at_end_of_word, dont_use_at_end_of_word, use_only_for_whole_word]
+                n_restrictions = len([restr for restr in restrictions if restr])
+                provenance2 = provenance
+                if (t is None) and (num is not None) and (provenance2 == "rom"):
+                    provenance2 = "num"
+                new_rom_rule = RomRule(s=s, t=t, prov=provenance2, lcodes=lcodes, t_alts=t_alts, num=num,
+                                       use_only_at_start_of_word=use_only_at_start_of_word,
+                                       dont_use_at_start_of_word=dont_use_at_start_of_word,
+                                       use_only_at_end_of_word=use_only_at_end_of_word,
+                                       dont_use_at_end_of_word=dont_use_at_end_of_word,
+                                       use_only_for_whole_word=use_only_for_whole_word,
+                                       t_at_end_of_syllable=t_at_end_of_syllable,
+                                       n_restr=n_restrictions,
+                                       is_minus_sign=is_minus_sign,
+                                       is_plus_sign=is_plus_sign,
+                                       is_decimal_point=is_decimal_point,
+                                       fraction_connector=fraction_connector,
+                                       percentage_marker=percentage_marker,
+                                       int_frac_connector=int_frac_connector,
+                                       is_large_power=is_large_power)
+                old_rom_rules = self.rom_rules[s]
+                if ((len(old_rom_rules) == 1) and (old_rom_rules[0].prov in ('ud', 'ow'))
+                        and not (lcodes or use_only_at_start_of_word or dont_use_at_start_of_word
+                                 or use_only_at_end_of_word or dont_use_at_end_of_word
+                                 or use_only_for_whole_word)):
+                    self.rom_rules[s] = [new_rom_rule]  # overwrite
+                else:
+                    self.rom_rules[s].append(new_rom_rule)
+                return True
+        return False
+
+    def load_script_file(self, filename: str, load_log: bool = True) -> int:
         """Reads in (typically from Scripts.txt) information about various scripts such as Devanagari,
         incl. information such as the default abugida vowel letter (e.g. "a")."""
         n_entries, max_n_script_name_components = 0, 0
@@ -420,29 +1569,30 @@ class Uroman:
             f = open(filename, 'r', encoding='utf-8')
         except FileNotFoundError:
             sys.stderr.write(f'Cannot open file {filename}\n')
-            return
+            return 0
         with f:
             for line_number, line in enumerate(f, 1):
                 if line.startswith('#'):
                     continue
                 if regex.match(r'^\s*$', line):  # blank line
                     continue
-                line = regex.sub(r'\s{2,}#.*$', '', line)
-                if script_name := slot_value_in_double_colon_del_list(line, 'script-name'):
+                if '#' in line:
+                    line = regex.sub(r'\s{2,}#.*$', '', line)
+                d = double_colon_del_list_to_dict(line)
+                if script_name := d.get('script-name'):
                     lc_script_name = script_name.lower()
                     if lc_script_name in self.scripts:
                         sys.stderr.write(f'** Ignoring duplicate script "{script_name}" '
                                          f'in line {line_number} of {filename}\n')
                     else:
                         n_entries += 1
-                        direction = slot_value_in_double_colon_del_list(line, 'direction')
-                        abugida_default_vowel_s = slot_value_in_double_colon_del_list(line,
-                                                                                      'abugida-default-vowel')
+                        direction = d.get('direction')
+                        abugida_default_vowel_s = d.get('abugida-default-vowel')
                         abugida_default_vowels = regex.split(r'[,;]\s*', abugida_default_vowel_s) \
                             if abugida_default_vowel_s else []
-                        alt_script_name_s = slot_value_in_double_colon_del_list(line, 'alt-script-name')
+                        alt_script_name_s = d.get('alt-script-name')
                         alt_script_names = regex.split(r'[,;]\s*', alt_script_name_s) if alt_script_name_s else []
-                        language_s = slot_value_in_double_colon_del_list(line, 'language')
+                        language_s = d.get('language')
                         languages = regex.split(r'[,;]\s*', language_s) if language_s else []
                         new_script = Script(script_name=script_name, alt_script_names=alt_script_names,
                                             languages=languages, direction=direction,
@@ -465,6 +1615,7 @@ class Uroman:
         if load_log:
             sys.stderr.write(f'Loaded {n_entries} script descriptions from {filename}'
                              f' (max_n_scripts_name_components: {max_n_script_name_components})\n')
+        return n_entries
 
     def extract_script_name(self, script_name_plus: str, full_char_name: str = None) -> str | None:
         """Using info from Scripts.txt, this script selects the script name from a Unicode,
@@ -479,7 +1630,7 @@ class Uroman:
             script_name_plus = regex.sub(r'\s*\S*\s*$', '', script_name_plus)
         return None
 
-    def load_unicode_data_props(self, filename: str, load_log: bool = True):
+    def load_unicode_data_props(self, filename: str, load_log: bool = True) -> int:
         """Loads Unicode derived data from (1) UnicodeDataProps.txt, (2) UnicodeDataPropsHangul.txt
         and UnicodeDataPropsCJK.txt with a list of valid script-specific characters."""
         n_script, n_script_char, n_script_vowel_sign, n_script_medial_consonant_sign, n_script_virama = 0, 0, 0, 0, 0
@@ -487,30 +1638,34 @@ class Uroman:
             f = open(filename, 'r', encoding='utf-8')
         except FileNotFoundError:
             sys.stderr.write(f'Cannot open file {filename}\n')
-            return
+            return 0
         with f:
             for line_number, line in enumerate(f, 1):
                 if line.startswith('#'):
                     continue
                 if regex.match(r'^\s*$', line):  # blank line
                     continue
-                line = regex.sub(r'\s{2,}#.*$', '', line)
-                if script_name := slot_value_in_double_colon_del_list(line, 'script-name'):
+                if '#' in line:
+                    line = regex.sub(r'\s{2,}#.*$', '', line)
+                d = double_colon_del_list_to_dict(line)
+                if script_name := d.get('script-name'):
                     n_script += 1
-                    for char in slot_value_in_double_colon_del_list(line, 'char', []):
-                        self.dict_str[('script', char)] = script_name
+                    script_id = self.script_id(script_name)
+                    chr_script_ids, chr_flags = self.chr_script_ids, self.chr_flags
+                    for char in d.get('char', []):
+                        chr_script_ids[ord(char)] = script_id
                         n_script_char += 1
-                    for char in slot_value_in_double_colon_del_list(line, 'numeral', []):
-                        self.dict_str[('script', char)] = script_name
+                    for char in d.get('numeral', []):
+                        chr_script_ids[ord(char)] = script_id
                         n_script_char += 1
-                    for char in slot_value_in_double_colon_del_list(line, 'vowel-sign', []):
-                        self.dict_bool[('is-vowel-sign', char)] = True
+                    for char in d.get('vowel-sign', []):
+                        chr_flags[ord(char)] |= CP_VOWEL_SIGN
                         n_script_vowel_sign += 1
-                    for char in slot_value_in_double_colon_del_list(line, 'medial-consonant-sign', []):
-                        self.dict_bool[('is-medial-consonant-sign', char)] = True
+                    for char in d.get('medial-consonant-sign', []):
+                        chr_flags[ord(char)] |= CP_MEDIAL_CONSONANT_SIGN
                         n_script_medial_consonant_sign += 1
-                    for char in slot_value_in_double_colon_del_list(line, 'sign-virama', []):
-                        self.dict_bool[('is-virama', char)] = True
+                    for char in d.get('sign-virama', []):
+                        chr_flags[ord(char)] |= CP_VIRAMA
                         n_script_virama += 1
         if load_log:
             sys.stderr.write(f'Loaded from {filename} mappings of {n_script_char:,d} characters '
@@ -520,8 +1675,9 @@ class Uroman:
                                  f'{n_script_medial_consonant_sign} medial consonant signs '
                                  f'and {n_script_virama} viramas')
             sys.stderr.write('.\n')
+        return n_script_char
 
-    def load_num_props(self, filename: str, load_log: bool = True):
+    def load_num_props(self, filename: str, load_log: bool = True) -> int:
         """Loads Unicode derived data from (1) UnicodeDataProps.txt, (2) UnicodeDataPropsHangul.txt
         and UnicodeDataPropsCJK.txt with a list of valid script-specific characters."""
         n_entries = 0
@@ -529,7 +1685,7 @@ class Uroman:
             f = open(filename, 'r', encoding='utf-8')
         except FileNotFoundError:
             sys.stderr.write(f'Cannot open file {filename}\n')
-            return
+            return 0
         with f:
             for line_number, line in enumerate(f, 1):
                 if line.startswith('#'):
@@ -550,6 +1706,7 @@ class Uroman:
                     sys.stderr.write(f'json in l.{line_number} in file {filename} not a dict: {line.strip()}\n')
         if load_log:
             sys.stderr.write(f'Loaded {n_entries} entries from {filename}\n')
+        return n_entries
 
     @staticmethod
     def de_accent_pinyin(s: str) -> str:
@@ -573,17 +1730,48 @@ class Uroman:
         return result
 
     def register_s_prefix(self, s: str):
-        for prefix_len in range(1, len(s) + 1):
-            self.dict_bool[('s-prefix', s[:prefix_len])] = True
+        """Adds source string s to s_prefix_trie, which thereby includes all prefixes of s.
+        Trie nodes without children (most of them) share a single read-only leaf node to save memory."""
+        node = self.s_prefix_trie
+        last_position = len(s) - 1
+        for position, char in enumerate(s):
+            child = node.get(char)
+            if position == last_position:
+                if child is None:
+                    node[char] = S_PREFIX_TRIE_LEAF
+                elif '' not in child:
+                    child[''] = True
+            else:
+                if (child is None) or ((len(child) == 1) and ('' in child)):  # copy (shared) leaf before extending
+                    node[char] = child = dict(child or {})
+                node = child
 
-    def load_chinese_pinyin_file(self, filename: str, load_log: bool = True):
+    def unregister_s_prefix(self, s: str):
+        """Removes source string s from s_prefix_trie, incl. any prefix nodes that are no longer needed."""
+        path = [self.s_prefix_trie]
+        for char in s:
+            if (node := path[-1].get(char)) is None:
+                return
+            path.append(node)
+        if '' not in path[-1]:
+            return
+        if len(path[-1]) > 1:
+            del path[-1]['']  # (not the shared leaf, which has no children)
+            return
+        for position in range(len(s) - 1, -1, -1):  # remove now empty nodes, from the end of s
+            parent = path[position]
+            del parent[s[position]]
+            if parent or (position == 0):
+                break
+
+    def load_chinese_pinyin_file(self, filename: str, load_log: bool = True) -> int:
         """Loads file Chinese_to_Pinyin.txt which maps Chinese characters to their Latin form."""
         n_entries = 0
         try:
             f = open(filename, 'r', encoding='utf-8')
         except FileNotFoundError:
             sys.stderr.write(f'Cannot open file {filename}\n')
-            return
+            return 0
         with f:
             for line_number, line in enumerate(f, 1):
                 if line.startswith('#'):
@@ -603,6 +1791,7 @@ class Uroman:
                     n_entries += 1
         if load_log:
             sys.stderr.write(f'Loaded {n_entries} script descriptions from {filename}\n')
+        return n_entries
 
     @staticmethod
     def add_char_to_rebuild_unicode_data_dict(d: dict, script_name: str, prop_class: str, char: str):
@@ -713,7 +1902,7 @@ class Uroman:
                 num_base = None  # num_base(500) = 100
                 base_multiplier = None  # base_multiplier(500) = 5
                 script = None
-                is_large_power = self.dict_bool[('is-large-power', char)]
+                is_large_power = self.dict_bool.get(('is-large-power', char), False)
                 # num_base is typically a power of 10: 1, 10, 100, 1000, 10000, 100000, 1000000, ...
                 # exceptions might include 12 for the 'dozen' in popular English 'two dozen and one' (2*12+1=25)
                 # exceptions might include 20 for the 'score' in archaic English 'four score and seven' (4*20+7=87)
@@ -795,17 +1984,21 @@ class Uroman:
             sys.stderr.write(f'Error: data_dir is of {type(data_dir)}, not a Path.\n'
                              f'       Cannot load any resource files.\n')
             return
-        self.load_rom_file(os.path.join(data_dir, "romanization-auto-table.txt"),
-                           'ud', file_format='rom', load_log=load_log)
-        self.load_rom_file(os.path.join(data_dir, "UnicodeDataOverwrite.txt"),
-                           'ow', file_format='u2r', load_log=load_log)
-        self.load_rom_file(os.path.join(data_dir, "romanization-table.txt"),
-                           'man', file_format='rom', load_log=load_log)
-        self.load_chinese_pinyin_file(os.path.join(data_dir, "Chinese_to_Pinyin.txt"), load_log=load_log)
-        self.load_script_file(os.path.join(data_dir, "Scripts.txt"), load_log=load_log)
-        self.load_num_props(os.path.join(data_dir, "NumProps.jsonl"), load_log=load_log)
-        for base_file in ("UnicodeDataProps.txt", "UnicodeDataPropsCJK.txt", "UnicodeDataPropsHangul.txt"):
-            self.load_unicode_data_props(os.path.join(data_dir, base_file), load_log=load_log)
+        # Resources of lazy script groups (see LAZY_SCRIPT_GROUPS) are deferred until needed (see load_script_group).
+        for base_file, provenance, file_format in ROM_RULE_FILES:
+            with self.profiled_load(base_file) as load_record:
+                load_record['entries'] = self.load_rom_file(os.path.join(data_dir, base_file), provenance,
+                                                            file_format=file_format, load_log=load_log,
+                                                            defer_script_groups=True)
+        with self.profiled_load('Scripts.txt') as load_record:
+            load_record['entries'] = self.load_script_file(os.path.join(data_dir, "Scripts.txt"), load_log=load_log)
+        with self.profiled_load('NumProps.jsonl') as load_record:
+            load_record['entries'] = self.load_num_props(os.path.join(data_dir, "NumProps.jsonl"), load_log=load_log)
+        with self.profiled_load('UnicodeDataProps.txt') as load_record:
+            load_record['entries'] = self.load_unicode_data_props(os.path.join(data_dir, "UnicodeDataProps.txt"),
+                                                                  load_log=load_log)
+        if rebuild_ud_props or rebuild_num_props:
+            self.load_scripts()
         if rebuild_ud_props:
             self.rebuild_unicode_data_props(os.path.join(data_dir, "UnicodeDataProps.txt"),
                                             cjk=os.path.join(data_dir, "UnicodeDataPropsCJK.txt"),
@@ -814,6 +2007,274 @@ class Uroman:
             self.rebuild_num_props(os.path.join(data_dir, "NumProps.jsonl"),
                                    os.path.join(data_dir, "NumPropsRejects.jsonl"))
 
+    @contextmanager
+    def profiled_load(self, resource_name: str):
+        """Measures wall time, CPU time and peak RSS delta of loading a resource and adds a record to
+        self.load_profile. The caller may set the number of loaded entries in the yielded record."""
+        load_record = {'resource': resource_name, 'entries': None}
+        start_wall_time, start_cpu_time, start_peak_rss = time.perf_counter(), time.process_time(), peak_rss_kb()
+        try:
+            yield load_record
+        finally:
+            end_peak_rss = peak_rss_kb()
+            load_record['wall_sec'] = round(time.perf_counter() - start_wall_time, 6)
+            load_record['cpu_sec'] = round(time.process_time() - start_cpu_time, 6)
+            load_record['peak_rss_delta_kb'] = None if end_peak_rss is None else end_peak_rss - start_peak_rss
+            self.load_profile.append(load_record)
+
+    def load_report(self, table_sizes: bool = True) -> dict:
+        """Returns a JSON-serializable report on how uroman's resources were loaded: wall time, CPU time,
+        peak RSS delta and number of entries per resource (incl. lazy script groups loaded so far),
+        plus the resulting number of entries and approximate memory (bytes) of major tables."""
+        report = {'version': __version__,
+                  'data_dir': str(self.data_dir),
+                  'data_fingerprint': self.data_fingerprint,
+                  'load_source': self.load_source,
+                  'totals': dict(self.load_totals),
+                  'resources': [dict(load_record) for load_record in self.load_profile],
+                  'pending_script_groups': sorted(self.pending_script_groups)}
+        if table_sizes:
+            report['tables'] = {}
+            for table_name in LOAD_REPORT_TABLES:
+                table = getattr(self, table_name)
+                report['tables'][table_name] = {'entries': len(table), 'bytes': deep_sizeof(table)}
+        return report
+
+    def prepare_for_fork(self):
+        """Prefork mode: prepares the loaded tables for sharing with forked worker processes (copy-on-write).
+        Loads any pending lazy script groups, which each worker would otherwise load into its own memory,
+        precomputes the per-codepoint tables that are otherwise filled on first use (name props for all codepoints,
+        context-free classification for the Basic Multilingual Plane), which would grow in (and be copied to) each
+        worker, and freezes all current objects once and for all (see hold_gc_freeze), so that garbage collections
+        in workers do not write to (and thereby copy) the pages of the loaded tables.
+        Frozen objects are never collected, so prefork mode is meant for processes that load and then fork."""
+        self.load_pending_script_groups()
+        self.add_all_chr_name_props()
+        self.classify_all_context_free_chars()
+        if not self.prefork:
+            self.prefork = True
+            hold_gc_freeze()  # never released
+
+    def load_pending_script_groups(self):
+        for group in list(self.pending_script_groups):
+            self.load_script_group(group)
+
+    def script_group_of_char(self, char: str) -> str | None:
+        """Returns the pending lazy script group (if any) that includes char, e.g. 'CJK' for '中'."""
+        for group, group_regex in self.pending_script_groups.items():
+            if group_regex.match(char):
+                return group
+        return None
+
+    def load_script_group(self, group: str):
+        """Loads the resources of a lazy script group (see LAZY_SCRIPT_GROUPS), either from the snapshot,
+        or from the deferred romanization table entries and the script group's resource files."""
+        with self.script_group_lock:
+            if group not in self.pending_script_groups:
+                return  # already loaded (possibly by another thread)
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            if group_snapshot := self.script_group_snapshots.pop(group, None):
+                with self.profiled_load(f'snapshot script group {group}') as load_record:
+                    group_tables = self.remap_group_script_ids(pickle.loads(group_snapshot))
+                    for table_name, entries in group_tables.items():
+                        self.update_table(table_name, entries)
+                    for key in group_tables.get('dict_str', ()):
+                        if key[0] == 'name':
+                            self.chr_flags[ord(key[1])] &= ~CP_NAME_FLAGS  # see load_rom_entry
+                    load_record['entries'] = len(group_tables.get('rom_rules', ()))
+            else:
+                # Same order as all other entries: romanization tables first, then the script group's files.
+                with self.profiled_load(f'deferred romanization entries {group}') as load_record:
+                    deferred_rom_entries = self.deferred_rom_entries.pop(group, [])
+                    for entry in deferred_rom_entries:
+                        self.load_rom_entry(*entry)
+                    load_record['entries'] = len(deferred_rom_entries)
+                for base_file in LAZY_SCRIPT_GROUPS[group]['files']:
+                    filename = os.path.join(self.data_dir, base_file)
+                    with self.profiled_load(base_file) as load_record:
+                        if base_file == "Chinese_to_Pinyin.txt":
+                            load_record['entries'] = self.load_chinese_pinyin_file(filename, load_log=self.load_log)
+                        else:
+                            load_record['entries'] = self.load_unicode_data_props(filename, load_log=self.load_log)
+            # new dict (rather than del) as other threads might iterate over pending_script_groups without lock
+            self.pending_script_groups = {k: v for k, v in self.pending_script_groups.items() if k != group}
+            self.context_free_roms = {}  # new rules and props might change classification
+            if gc_enabled:
+                gc.enable()
+            if self.load_log:
+                sys.stderr.write(f'Loaded resources for script group {group}\n')
+
+    def remap_group_script_ids(self, group_tables: dict) -> dict:
+        """Script ids in a script group snapshot were assigned when saving the snapshot, after loading all
+        previous groups. As groups can be loaded in any order, new script names are registered by name instead,
+        and the script group's chr_script_ids values are mapped to the actual script ids."""
+        group_script_ids = group_tables.pop('script_ids', None)
+        group_tables.pop('script_names', None)
+        if group_script_ids:
+            script_id_map = {script_id: self.script_id(script_name)
+                             for script_name, script_id in group_script_ids.items()}
+            if chr_script_id_runs := group_tables.get('chr_script_ids'):
+                group_tables['chr_script_ids'] = [(start, array('H', [script_id_map.get(script_id, script_id)
+                                                                      for script_id in values]))
+                                                  for start, values in chr_script_id_runs]
+        return group_tables
+
+    def load_scripts_for_string(self, s: str):
+        """Loads any pending lazy script group that includes a character in s."""
+        for group, group_regex in self.pending_script_groups.items():
+            if group_regex.search(s):
+                self.load_script_group(group)
+
+    def load_scripts(self, scripts: List[str] | str | None = None, lcodes: List[str] | str | None = None):
+        """Pre-loads lazy script groups for script names (e.g. 'CJK', 'Chinese', 'Hangul') and/or
+        language codes (e.g. 'kor'). Without any scripts or lcodes, all lazy script groups are loaded."""
+        if (scripts is None) and (lcodes is None):
+            groups = list(LAZY_SCRIPT_GROUPS)
+        else:
+            groups = []
+            for script_name in ([scripts] if isinstance(scripts, str) else scripts or []):
+                script = self.scripts.get(script_name.lower())
+                groups.append(script['script-name'] if script else script_name)
+            for lcode in ([lcodes] if isinstance(lcodes, str) else lcodes or []):
+                groups.extend(group for group, props in LAZY_SCRIPT_GROUPS.items() if lcode in props['lcodes'])
+        for group in groups:
+            if group in LAZY_SCRIPT_GROUPS:
+                self.load_script_group(group)
+
+    def reload(self) -> List[str]:
+        """Re-reads any modified romanization data files (see ROM_RULE_FILES) in a long-lived Uroman object.
+        Only the changed files are re-parsed, and only the affected rom_rules keys (with their s_prefix_trie and
+        other table entries) and rom_cache entries are updated. Each key is swapped in with a single assignment,
+        so concurrent romanize_string() calls see either the old or the new rules of a key.
+        Returns the list of reloaded files. Changes to other resource files require a new Uroman object."""
+        new_digests = self.compute_resource_file_digests(self.data_dir)
+        rom_rule_file_names = [base_file for base_file, _provenance, _file_format in ROM_RULE_FILES]
+        changed_files = [base_file for base_file in RESOURCE_FILES
+                         if new_digests[base_file] != self.resource_file_digests.get(base_file)]
+        for base_file in changed_files:
+            if base_file not in rom_rule_file_names:
+                sys.stderr.write(f'Warning: reload() does not cover changes in {base_file} '
+                                 f'(requires a new Uroman object)\n')
+        changed_files = [base_file for base_file in changed_files if base_file in rom_rule_file_names]
+        if not changed_files:
+            return []
+        # Affected keys are those whose sequence of entry lines has changed. Lines are identified by their hash,
+        # so that only new or modified lines need to be parsed.
+        file_lines, new_file_lines = {}, {}
+        affected_keys = set()
+        for base_file, _provenance, file_format in ROM_RULE_FILES:
+            if base_file not in changed_files:
+                continue
+            try:
+                with open(os.path.join(self.data_dir, base_file), 'r', encoding='utf-8') as f:
+                    lines = file_lines[base_file] = f.readlines()
+            except OSError:
+                sys.stderr.write(f'Cannot open file {os.path.join(self.data_dir, base_file)}\n')
+                lines = file_lines[base_file] = []
+            old_line_keys, old_line_hashes = self.rom_file_lines.get(base_file, ([], array('Q')))
+            old_key_of_hash = dict(zip(old_line_hashes, old_line_keys))
+            line_keys, line_hashes = new_file_lines[base_file] = ([], array('Q'))
+            for line in lines:
+                if (h := line_hash(line)) in old_key_of_hash:
+                    line_keys.append(old_key_of_hash[h])
+                    line_hashes.append(h)
+                elif (d := self.rom_file_line_to_dict(line)) is None:
+                    line_keys.append(None)
+                    line_hashes.append(0)
+                else:
+                    line_keys.append(self.rom_entry_source(d, file_format))
+                    line_hashes.append(h)
+            old_key_line_hashes, new_key_line_hashes = defaultdict(list), defaultdict(list)
+            for s, h in zip(old_line_keys, old_line_hashes):
+                old_key_line_hashes[s].append(h)
+            for s, h in zip(line_keys, line_hashes):
+                new_key_line_hashes[s].append(h)
+            affected_keys.update(s for s in set(old_key_line_hashes) | set(new_key_line_hashes)
+                                 if old_key_line_hashes.get(s) != new_key_line_hashes.get(s))
+        affected_keys.discard(None)
+        affected_keys.discard('')
+        # pending lazy script groups are loaded first, so that they can't later overwrite any reloaded key
+        if self.pending_script_groups:
+            self.load_scripts_for_string(''.join(s[0] for s in affected_keys))
+        with self.script_group_lock:
+            # replay all entries of the affected keys (from all files, in loading order) into separate tables
+            scratch = Uroman.__new__(Uroman)
+            scratch.rom_rules, scratch.s_prefix_trie, scratch.chr_flags = defaultdict(list), {}, defaultdict(int)
+            scratch.dict_bool, scratch.dict_str, scratch.dict_num = \
+                defaultdict(bool), defaultdict(str), defaultdict(lambda: None)
+            scratch.minus_signs, scratch.plus_signs, scratch.fraction_connectors = {}, {}, {}
+            for base_file, provenance, file_format in ROM_RULE_FILES:
+                filename = os.path.join(self.data_dir, base_file)
+                line_keys = new_file_lines.get(base_file, self.rom_file_lines.get(base_file, ([],)))[0]
+                if line_numbers := [line_number for line_number, s in enumerate(line_keys, 1) if s in affected_keys]:
+                    if base_file not in file_lines:  # unchanged file, only needed for the lines of affected keys
+                        with open(filename, 'r', encoding='utf-8') as f:
+                            file_lines[base_file] = f.readlines()
+                    for line_number in line_numbers:
+                        d = self.rom_file_line_to_dict(file_lines[base_file][line_number-1])
+                        scratch.load_rom_entry(d, provenance, file_format, filename, line_number)
+                scratch.add_thai_cancellation_rules(affected_keys)
+            # swap in the new values, key by key
+            replayed_provenances = [provenance for _base_file, provenance, _file_format in ROM_RULE_FILES] \
+                + list(THAI_CANCELLATION_PROVENANCES)
+            for s in affected_keys:
+                # keep rules from other sources (such as pinyin), which were loaded after the romanization data files
+                rom_rules = scratch.rom_rules.get(s, []) \
+                    + [rom_rule for rom_rule in self.rom_rules.get(s, []) if rom_rule.prov not in replayed_provenances]
+                if rom_rules:
+                    self.rom_rules[s] = rom_rules
+                    self.register_s_prefix(s)
+                elif self.rom_rules.pop(s, None) is not None:
+                    self.unregister_s_prefix(s)
+                table_keys = [(table_name, s) for table_name in ('dict_num', 'minus_signs', 'plus_signs',
+                                                                 'fraction_connectors')]
+                table_keys += [('dict_bool', (bool_key, s)) for bool_key in ('is-large-power', 'is-minus-sign',
+                                                                             'is-plus-sign', 'is-decimal-point')]
+                table_keys += [('dict_str', (slot, s)) for slot in ('name', 'pic', 'tone-mark', 'syllable-info')]
+                for table_name, key in table_keys:
+                    table = getattr(self, table_name)
+                    value = getattr(scratch, table_name).get(key)
+                    if key == ('is-large-power', s):
+                        value = value or bool((self.num_props.get(s) or {}).get('is-large-power'))  # see NumProps
+                    if (value is not None) and (value is not False) and (value != ''):  # but incl. 0
+                        table[key] = value
+                    elif key in table:
+                        del table[key]
+                if len(s) == 1:
+                    self.chr_flags[ord(s)] &= ~CP_NAME_FLAGS  # name might have changed; see load_rom_entry
+                    if scratch.chr_flags.get(ord(s), 0) & CP_TONE_MARK:
+                        self.chr_flags[ord(s)] |= CP_TONE_MARK
+                    else:
+                        self.chr_flags[ord(s)] &= ~CP_TONE_MARK
+                self.context_free_roms.pop(s[0], None)
+            for base_file in changed_files:
+                self.rom_file_lines[base_file] = new_file_lines[base_file]
+                self.resource_file_digests[base_file] = new_digests[base_file]
+            self.data_fingerprint = self.resource_fingerprint(self.resource_file_digests)
+            if self.persistent_rom_cache is not None:
+                self.persistent_rom_cache.flush()  # pending entries are based on the old data
+                self.persistent_rom_cache.namespace = PersistentRomCache.make_namespace(self.data_fingerprint)
+            if self.shared_rom_cache is not None:
+                self.shared_rom_cache.namespace = PersistentRomCache.make_namespace(self.data_fingerprint)
+        self.remove_cache_entries(affected_keys)
+        if self.load_log:
+            sys.stderr.write(f'Reloaded {", ".join(changed_files)} ({len(affected_keys):,d} affected keys)\n')
+        return changed_files
+
+    def remove_cache_entries(self, keys: set):
+        """Removes all rom_cache entries of strings that include any of the keys (source strings),
+        also within the decomposition of a character such as ﻼ."""
+        if not keys:
+            return
+        keys_regex = regex.compile('|'.join(map(regex.escape, sorted(keys, key=len, reverse=True))))
+        for cache_key in self.rom_cache.keys():
+            s = cache_key[0]
+            if keys_regex.search(s) or keys_regex.search(ud.normalize('NFKD', s)):
+                self.rom_cache.pop(cache_key)
+        if self.line_memo is not None:
+            self.line_memo.clear()  # keys are hashes of lines
+
     def unicode_hangul_romanization(self, s: str, pass_through_p: bool = False):
         """Special algorithmic solution to convert (Korean) Hangul characters to the Latin alphabet."""
         if cached_rom := self.hangul_rom.get(s, None):
@@ -837,35 +2298,32 @@ class Uroman:
                 result += c
         return result
 
-    @staticmethod
-    def char_is_nonspacing_mark(s) -> bool:
+    def char_is_nonspacing_mark(self, s) -> bool:
         """ Checks whether a character is a nonspacing mark, e.g. combining accents, points, vowel signs"""
-        return (len(s) == 1) and (ud.category(s) == 'Mn')
+        return bool(self.chr_props(s) & CP_NONSPACING_MARK)
 
-    @staticmethod
-    def char_is_format_char(s) -> bool:
+    def char_is_format_char(self, s) -> bool:
         """ Checks whether a character is a formatting character, e.g. a zero-with joiner/non-joiner"""
-        return (len(s) == 1) and (ud.category(s) == 'Cf')
+        return bool(self.chr_props(s) & CP_FORMAT_CHAR)
 
-    @staticmethod
-    def char_is_space_separator(s) -> bool:
+    def char_is_space_separator(self, s) -> bool:
         """ Checks whether a character is a space,
             e.g. ' ', non-breakable space, en space, ideographic (Chinese) space, Ogham space mark
             but excluding \t, \r, \n"""
-        return (len(s) == 1) and (ud.category(s) == 'Zs')
+        return bool(self.chr_props(s) & CP_SPACE_SEPARATOR)
 
     def chr_name(self, char: str) -> str:
         try:
             return ud.name(char)
         except (ValueError, TypeError):
-            if name := self.dict_str[('name', char)]:
+            if name := self.dict_str.get(('name', char)):
                 return name
         return ''
 
     def num_value(self, s: str) -> int | float | Fraction | None:
         """rom_rules include numeric values beyond UnicodeData.txt, e.g. for Egyptian numerals"""
         for rom_rule in self.rom_rules[s]:
-            if (num := rom_rule['num']) is not None:
+            if (num := rom_rule.num) is not None:
                 return num
         return None
 
@@ -887,12 +2345,128 @@ class Uroman:
                     return result
         return None
 
+    def script_id(self, script_name: str) -> int:
+        """Index of script_name in script_names (as used in chr_script_ids), registering new script names."""
+        if (script_id := self.script_ids.get(script_name)) is None:
+            script_id = self.script_ids[script_name] = len(self.script_names)
+            self.script_names.append(script_name)
+        return script_id
+
     def chr_script_name(self, char: str) -> str:
         """For letters, diacritics, numerals etc."""
-        return self.dict_str[('script', char)]
+        try:
+            return self.script_names[self.chr_script_ids[ord(char)]]
+        except TypeError:  # char is None, '' or longer than a single character
+            return ''
+
+    def chr_props(self, char: str) -> int:
+        """Codepoint flags (bitmask of CP_VOWEL_SIGN, CP_VIRAMA, CP_LETTER etc.) of a single character"""
+        try:
+            cp = ord(char)
+        except TypeError:  # char is None, '' or longer than a single character
+            return 0
+        if (props := self.chr_flags[cp]) & CP_NAME_PROPS:
+            return props
+        return self.add_chr_name_props(cp)
+
+    def add_chr_name_props(self, cp: int) -> int:
+        """Adds flags based on the name and category of a character to chr_flags. Such flags are computed
+        for all codepoints when building a snapshot (see add_all_chr_name_props), otherwise on first use.
+        They are reset (and recomputed on next use) when a data file entry (re)defines the name of a character,
+        e.g. in a lazily loaded script group or reload()."""
+        char = chr(cp)
+        props = CP_NAME_PROPS
+        if name := ud.name(char, '') or self.dict_str.get(('name', char), ''):
+            for name_substring, flag in CP_NAME_SUBSTRING_FLAGS:
+                if name_substring in name:
+                    props |= flag
+        props |= CP_CATEGORY_FLAGS.get(ud.category(char), 0)
+        self.chr_flags[cp] |= props
+        return self.chr_flags[cp]
+
+    def add_all_chr_name_props(self):
+        for cp in range(CODEPOINT_TABLE_SIZE):
+            if not (self.chr_flags[cp] & CP_NAME_PROPS):
+                self.add_chr_name_props(cp)
+
+    def classify_context_free_char(self, char: str) -> Tuple[str, str, dict | None] | None:
+        """A character is context-free if its romanization in a string of context-free characters does not
+        depend on any neighboring character, the lcode or the position in a word. Returns the romanization and
+        edge annotation (as produced by the lattice) for context-free characters, None for all others.
+        The third element is the character's s_prefix_trie node if the character is also the start of longer
+        rom_rules source strings (context-free only if not followed by a continuing character).
+        Alternative romanizations (t-alts) are irrelevant here, as they are limited to the ALTS and LATTICE formats."""
+        cp = ord(char)
+        if ((char in CONTEXT_TRIGGER_CHARS)
+                or (0x2800 <= cp <= 0x28FF)  # Braille
+                or (0xAC00 <= cp <= 0xD7A3)  # Hangul syllables
+                or (self.chr_props(char) & CONTEXT_SENSITIVE_CP_FLAGS)
+                or self.dict_str.get(('syllable-info', char))
+                or self.num_props.get(char)
+                or (ud_numeric(char) is not None)):
+            return None
+        script_name = self.chr_script_name(char)
+        if (script_name in CONTEXT_SENSITIVE_SCRIPTS) \
+                or ((script := self.scripts.get(script_name.lower())) and script['abugida-default-vowels']):
+            return None
+        if (ud_decomp_s := ud.decomposition(char)).startswith('<') \
+                and not ud_decomp_s.startswith(('<super>', '<sub>', '<noBreak>', '<compat>')):
+            return None
+        if (node := self.s_prefix_trie.get(char)) and (len(node) == ('' in node)):
+            node = None  # not a prefix of any longer rom_rules source string
+        rom_rules = self.rom_rules.get(char)
+        if not rom_rules:
+            if self.char_is_nonspacing_mark(char):
+                return '', 'Mn', node
+            elif self.char_is_format_char(char):
+                return '', 'Cf', node
+            elif self.chr_props(char) & CP_PRIVATE_USE:
+                return '', 'Co', node
+            return char, 'orig', node
+        if len(rom_rules) > 1:
+            return None
+        rom_rule = rom_rules[0]
+        rom = rom_rule.t
+        if ((rom is None) or rom_rule.lcodes or (rom_rule.flags & RULE_WORD_RESTRICTIONS)
+                or (rom_rule.t_at_end_of_syllable is not None) or (rom_rule.num is not None)
+                or rom.startswith(('+', ' ')) or rom.endswith(' ')
+                or (rom.isupper() and (rom.capitalize() != rom))):  # see expand_rom_with_special_chars
+            return None
+        return rom, 'rom', node
+
+    def classify_all_context_free_chars(self, max_cp: int = 0xFFFF):
+        """Classifies all assigned characters up to max_cp (default: Basic Multilingual Plane) in advance
+        (see prepare_for_fork), rather than on first use (see context_free_roms_of_string)."""
+        context_free_roms = self.context_free_roms
+        for cp in range(max_cp + 1):
+            char = chr(cp)
+            if (char not in context_free_roms) and (ud.category(char) not in ('Cn', 'Cs')):
+                context_free_roms[char] = self.classify_context_free_char(char)
+
+    def context_free_roms_of_string(self, s: str) -> List[Tuple[str, str]] | None:
+        """Romanizations and edge annotations of the characters of s if all of them are context-free
+        (and none starts a longer rom_rules source string in s), else None. Characters are classified on first use."""
+        if self.pending_script_groups:
+            self.load_scripts_for_string(s)
+        context_free_roms = self.context_free_roms
+        result = []
+        last_position = len(s) - 1
+        for position, char in enumerate(s):
+            try:
+                entry = context_free_roms[char]
+            except KeyError:
+                entry = context_free_roms[char] = self.classify_context_free_char(char)
+            if entry is None:
+                return None
+            rom, annotation, s_prefix_trie_node = entry
+            if s_prefix_trie_node and (position < last_position) and (s[position+1] in s_prefix_trie_node):
+                return None
+            result.append((rom, annotation))
+        return result
 
     def test_output_of_selected_scripts_and_rom_rules(self):
         """Low level test function that checks and displays romanization information."""
+        self.load_scripts()
         output = ''
         for s in ("Oriya", "Chinese"):
             d = self.scripts[s.lower()]
@@ -955,10 +2529,130 @@ class Uroman:
                 n_alerts += 1
         sys.stderr.write(f'{n_alerts} alerts for roms with spaces\n')
 
+    def romanize_file_line(self, line: str, lcode: str | None = None, **args) -> str:
+        """Romanizes a line of romanize_file (incl. any ::lcode prefix) and returns the output line."""
+        if m := regex.match(r'(::lcode\s+)([a-z]{3})(\s+)(.*)$', line):
+            lcode_kw, lcode2, space, snt = m.group(1, 2, 3, 4)
+            segments = self.romanize_string_segments(snt, lcode2 or lcode, **args)
+            if args.get('rom_format', RomFormat.STR) == RomFormat.STR:
+                lcode_prefix = f"{lcode_kw}{lcode2}{space}"
+                return lcode_prefix + self.segments_json_str(segments) + '\n'
+            else:
+                lcode_prefix = f'[0, 0, "", "lcode: {lcode2}"]'  # meta edge with lcode info
+                return self.segments_json_str(segments, prefix=lcode_prefix) + '\n'
+        else:
+            segments = self.romanize_string_segments(line.rstrip('\n'), lcode, **args)
+            return self.segments_json_str(segments) + '\n'
+
+    def romanize_file_line_memoized(self, line: str, lcode: str | None = None, **args) -> str:
+        """romanize_file_line, using any line memo, so that duplicate lines (e.g. boilerplate) cost a single lookup"""
+        if (self.line_memo is None) or not self.cache_p:
+            return self.romanize_file_line(line, lcode, **args)
+        line_key = self.line_memo_key(line, lcode, **args)
+        if (rom_line := self.line_memo.get(line_key)) is None:
+            rom_line = self.romanize_file_line(line, lcode, **args)
+            self.line_memo.put(line_key, rom_line)
+        return rom_line
+
+    def file_lines(self, f_in, input_filename: str | None = None, max_lines: int | None = None) -> Iterable[str]:
+        """Lines of romanize_file input, up to max_lines, with any non-UTF-8 characters replaced (and reported)."""
+        for line_number, line in enumerate(f_in, 1):
+            if non_utf8_chars := regex.findall(r'[\uDC80-\uDCFF]', line):
+                repl_char = '\uFFFD'
+                line2 = regex.sub(r'[\uDC80-\uDCFF]', repl_char, line)
+                n_non_utf8_chars = len(non_utf8_chars)
+                self.n_non_utf8_characters += n_non_utf8_chars
+                max_n_error_messages = 10
+                if self.n_error_messages_output < max_n_error_messages:
+                    s_ending = '' if n_non_utf8_chars == 1 else 's'
+                    sys.stderr.write(f"Detected encoding error: file {input_filename} line {line_number} "
+                                     f"contains {n_non_utf8_chars} non-UTF-8 character{s_ending} "
+                                     f"(replaced by {repl_char}): {line2.rstrip()}\n")
+                    self.n_error_messages_output += 1
+                elif self.n_error_messages_output == max_n_error_messages:
+                    sys.stderr.write(f"Too many errors. No further errors reported.\n")
+                    self.n_error_messages_output += 1
+                line = line2
+            yield line
+            if max_lines and line_number >= max_lines:
+                break
+
+    def romanize_file_lines_in_parallel(self, lines: Iterable[str], lcode: str | None, n_workers: int, **args) \
+            -> Iterable[str]:
+        """Romanizes lines in chunks (ROMANIZE_FILE_CHUNK_SIZE) in a pool of n_workers worker processes and
+        returns output lines in input order. Workers inherit this (loaded) instance copy-on-write (where fork is
+        available; see worker_pool), or else load an equivalent instance. At most 2 * n_workers chunks
+        are in flight."""
+        lines = iter(lines)
+        tasks = ((chunk, lcode, args) for chunk in iter(lambda: list(islice(lines, ROMANIZE_FILE_CHUNK_SIZE)), []))
+        with self.worker_pool(n_workers) as pool:
+            for rom_lines in self.map_tasks_in_parallel(pool, romanize_file_worker_chunk, tasks, n_workers):
+                yield from rom_lines
+
+    def map_tasks_in_parallel(self, pool: multiprocessing.pool.Pool, worker_function, tasks: Iterable[tuple],
+                              n_workers: int) -> Iterator[list]:
+        """Applies worker_function to each task (tuple of arguments) in a pool of n_workers worker processes
+        (see worker_pool) and yields the task results in input order (see merge_worker_result).
+        At most 2 * n_workers tasks are in flight, so tasks can be a lazy stream."""
+        pending_results = deque()
+        for task in tasks:
+            pending_results.append(pool.apply_async(worker_function, task))
+            while len(pending_results) >= 2 * n_workers:
+                yield self.merge_worker_result(pending_results.popleft().get())
+        while pending_results:
+            yield self.merge_worker_result(pending_results.popleft().get())
+
+    @contextmanager
+    def worker_pool(self, n_workers: int) -> Iterator[multiprocessing.pool.Pool]:
+        """Pool of n_workers worker processes, each with a Uroman instance equivalent to this one, inherited
+        copy-on-write (where fork is available), or else newly loaded. Objects are frozen while a forked pool
+        exists (see hold_gc_freeze) and unfrozen when it is done (unless in prefork mode)."""
+        context, init_args = self.worker_process_setup()
+        forked = (context.get_start_method() == 'fork')
+        if forked:
+            hold_gc_freeze()
+        try:
+            with context.Pool(n_workers, initializer=init_romanize_file_worker, initargs=init_args) as pool:
+                yield pool
+        finally:
+            if forked:
+                release_gc_freeze()
+
+    def worker_process_setup(self, fork: bool = True) -> Tuple[multiprocessing.context.BaseContext, tuple]:
+        """Multiprocessing context and init_romanize_file_worker args for worker processes (see worker_pool).
+        fork=False: workers load their own Uroman instance ('forkserver' or 'spawn'), e.g. if threads are running."""
+        if self.persistent_rom_cache is not None:
+            self.persistent_rom_cache.flush()  # pending entries would otherwise be inherited by each worker
+        start_methods = multiprocessing.get_all_start_methods()
+        if fork and ('fork' in start_methods):
+            self.load_pending_script_groups()  # once, shared by all workers
+            return multiprocessing.get_context('fork'), (self, None)
+        start_method = 'forkserver' if 'forkserver' in start_methods else 'spawn'
+        return multiprocessing.get_context(start_method), (None, {'data_dir': self.data_dir, **self.init_args})
+
+    def merge_worker_result(self, result: Tuple[list, dict]) -> list:
+        """Adds the stats of a worker task to self.stats and returns the task's results."""
+        results, stats = result
+        with self.stats_lock:
+            for key, count in stats.items():
+                self.stats[key] += count
+        return results
+
+    @staticmethod
+    def line_memo_key(line: str, lcode: str | None = None, **args) -> bytes:
+        """Hash of a line of romanize_file and the arguments that its romanization might depend on, i.e. all args
+        except for those in LINE_MEMO_KEY_IGNORED_ARGS (rom_format and decode_unicode are included, normalized)."""
+        other_args = '\t'.join([f'{name}={value!r}' for name, value in sorted(args.items())
+                                if name not in LINE_MEMO_KEY_IGNORED_ARGS])
+        key_s = f"{lcode}\t{args.get('rom_format', RomFormat.STR)}\t{bool(args.get('decode_unicode'))}\t{other_args}" \
+                f"\t{line}"
+        return hashlib.blake2b(key_s.encode('utf-8', errors='surrogatepass'), digest_size=16).digest()
+
     def romanize_file(self, input_filename: str | None = None, output_filename: str | None = None,
                       lcode: str | None = None, direct_input: List[str] = None, **args):
         """Script to apply romanization to an entire file. Input and output files needed.
-        Language code (lcode) recommended."""
+        Language code (lcode) recommended.
+        With args workers > 1, lines are romanized by a pool of worker processes (same output, in input order)."""
         f_in_to_be_closed, f_out_to_be_closed = False, False
         if direct_input and (input_filename is None):
             f_in = direct_input  # list of lines
@@ -993,38 +2687,15 @@ class Uroman:
             f_out = None
         self.n_non_utf8_characters = 0
         if f_in and f_out:
-            max_lines = args.get('max_lines')
+            lines = self.file_lines(f_in, input_filename, args.get('max_lines'))
+            if (n_workers := args.get('workers') or 1) > 1:
+                rom_lines = self.romanize_file_lines_in_parallel(lines, lcode, n_workers, **args)
+            else:
+                rom_lines = (self.romanize_file_line_memoized(line, lcode, **args) for line in lines)
             progress_dots_output = False
             try:
-                for line_number, line in enumerate(f_in, 1):
-                    if non_utf8_chars := regex.findall(r'[\uDC80-\uDCFF]', line):
-                        repl_char = '\uFFFD'
-                        line2 = regex.sub(r'[\uDC80-\uDCFF]', repl_char, line)
-                        n_non_utf8_chars = len(non_utf8_chars)
-                        self.n_non_utf8_characters += n_non_utf8_chars
-                        max_n_error_messages = 10
-                        if self.n_error_messages_output < max_n_error_messages:
-                            s_ending = '' if n_non_utf8_chars == 1 else 's'
-                            sys.stderr.write(f"Detected encoding error: file {input_filename} line {line_number} "
-                                             f"contains {n_non_utf8_chars} non-UTF-8 character{s_ending} "
-                                             f"(replaced by {repl_char}): {line2.rstrip()}\n")
-                            self.n_error_messages_output += 1
-                        elif self.n_error_messages_output == max_n_error_messages:
-                            sys.stderr.write(f"Too many errors. No further errors reported.\n")
-                            self.n_error_messages_output += 1
-                        line = line2
-                    if m := regex.match(r'(::lcode\s+)([a-z]{3})(\s+)(.*)$', line):
-                        lcode_kw, lcode2, space, snt = m.group(1, 2, 3, 4)
-                        rom_result = self.romanize_string(snt, lcode2 or lcode, **args)
-                        if args.get('rom_format', RomFormat.STR) == RomFormat.STR:
-                            lcode_prefix = f"{lcode_kw}{lcode2}{space}"
-                            f_out.write(lcode_prefix + rom_result + '\n')
-                        else:
-                            lcode_prefix = f'[0, 0, "", "lcode: {lcode2}"]'  # meta edge with lcode info
-                            prefixed_edges = [lcode_prefix] + self.romanize_string(snt, lcode2 or lcode, **args)
-                            f_out.write(Edge.json_str(prefixed_edges) + '\n')
-                    else:
-                        f_out.write(Edge.json_str(self.romanize_string(line.rstrip('\n'), lcode, **args)) + '\n')
+                for line_number, rom_line in enumerate(rom_lines, 1):
+                    f_out.write(rom_line)
                     if not args.get('silent'):
                         if line_number % 100 == 0:
                             if line_number % 1000 == 0:
@@ -1034,8 +2705,6 @@ class Uroman:
                             progress_dots_output = True
                             sys.stderr.flush()
                             gc.collect()
-                    if max_lines and line_number >= max_lines:
-                        break
             except UnicodeDecodeError as error:
                 sys.stderr.write(f"UnicodeDecodeError: {error}\n")
                 sys.stderr.write(f"   Please make sure the input stream is in Unicode (UTF-8).\n")
@@ -1050,19 +2719,26 @@ class Uroman:
             f_in.close()
         if f_out_to_be_closed:
             f_out.close()
+        if self.persistent_rom_cache is not None:
+            self.persistent_rom_cache.flush()
         if input_filename and self.n_non_utf8_characters:
             sys.stderr.write(f"Total number of non-UTF-8 characters in {input_filename}: "
                              f"{self.n_non_utf8_characters}\n")
 
     @staticmethod
-    def apply_any_offset_to_cached_rom_result(cached_rom_result: str | List[Edge], offset: int = 0) \
+    def apply_any_offset_to_cached_rom_result(cached_rom_result: str | tuple | List[Edge], offset: int = 0) \
             -> str | List[Edge]:
+        """Builds edges from cached edge records (start, end, txt, annotation) or copies of cached number edges,
+        adding offset. Number edges keep their class (NumEdge) and attributes, e.g. value."""
         if isinstance(cached_rom_result, str):
             return cached_rom_result
+        elif isinstance(cached_rom_result, tuple):
+            return [Edge(record[0] + offset, record[1] + offset, record[2], record[3]) if isinstance(record, tuple)
+                    else record.copy_with_offset(offset) for record in cached_rom_result]
         elif offset == 0:
             return cached_rom_result
         else:
-            return [Edge(edge.start + offset, edge.end + offset, edge.txt, edge.type) for edge in cached_rom_result]
+            return [edge.copy_with_offset(offset) for edge in cached_rom_result]
 
     @staticmethod
     def decode_unicode_escapes(s: str) -> str:
@@ -1082,13 +2758,36 @@ class Uroman:
         else:
             return s
 
-    def romanize_string_core(self, s: str, lcode: str | None, rom_format: RomFormat, offset: int = 0, **args) \
-            -> str | List[Edge]:
-        """Script to support token-by-token romanization with caching for higher speed."""
+    def romanize_token(self, s: str, lcode: str | None, rom_format: RomFormat, **args) \
+            -> str | Tuple[Tuple[int, int, str, str | None], ...] | List[Edge]:
+        """Romanizes a token (or delimiter) independent of its position in a larger string, with caching.
+        Returns a string (RomFormat.STR), a tuple of immutable edge records (start, end, txt, annotation)
+        and number edges (NumEdge, with value, script etc.) (RomFormat.EDGES, RomFormat.ALTS)
+        or a list of edges (RomFormat.LATTICE), with offsets relative to s.
+        Cached results are shared, so they must not be modified."""
         if self.cache_p:
-            cached_rom = self.rom_cache.get((s, lcode, rom_format))
+            # Most romanizations do not depend on the language code, so they are shared across lcodes.
+            cached_rom = self.rom_cache.get((s, ANY_LCODE, rom_format), (s, lcode, rom_format))
             if cached_rom is not None:
-                return self.apply_any_offset_to_cached_rom_result(cached_rom, offset)
+                return cached_rom
+        # fast path for strings of context-free characters, bypassing the lattice (same result)
+        if (rom_format in (RomFormat.STR, RomFormat.EDGES)) \
+                and ((context_free_roms := self.context_free_roms_of_string(s)) is not None):
+            if rom_format == RomFormat.STR:
+                return ''.join([rom for rom, _annotation in context_free_roms])
+            return tuple([(i, i + 1, rom, annotation) for i, (rom, annotation) in enumerate(context_free_roms)])
+        if self.cache_p and (self.shared_rom_cache is not None) \
+                and ((shared_entry := self.shared_rom_cache.get(s, lcode, rom_format)) is not None):
+            cached_lcode, cached_rom = shared_entry
+            self.rom_cache.put((s, cached_lcode, rom_format), cached_rom)
+            return cached_rom
+        if self.cache_p and (self.persistent_rom_cache is not None) \
+                and ((persistent_entry := self.persistent_rom_cache.get(s, lcode, rom_format)) is not None):
+            cached_lcode, cached_rom = persistent_entry
+            self.rom_cache.put((s, cached_lcode, rom_format), cached_rom)
+            if self.shared_rom_cache is not None:
+                self.shared_rom_cache.put((s, cached_lcode, rom_format), cached_rom)
+            return cached_rom
         lat = Lattice(s, uroman=self, lcode=lcode)
         lat.pick_tibetan_vowel_edge(**args)
         lat.prep_braille(**args)
@@ -1097,60 +2796,393 @@ class Uroman:
         lat.add_braille_numbers(**args)
         lat.add_rom_fall_back_singles(**args)
         if rom_format == RomFormat.LATTICE:
-            all_edges = lat.all_edges(0, len(s))
-            lat.add_alternatives(all_edges)
-            if self.rom_cache_size < self.rom_max_cache_size:
-                self.rom_cache[(s, lcode, rom_format)] = all_edges
-                self.rom_cache_size += 1
-            result = self.apply_any_offset_to_cached_rom_result(all_edges, offset)
+            result = lat.all_edges(0, len(s))
+            lat.add_alternatives(result)
         else:
             best_edges = lat.best_rom_edge_path(0, len(s))
             if rom_format in (RomFormat.EDGES, RomFormat.ALTS):
                 if rom_format == RomFormat.ALTS:
                     lat.add_alternatives(best_edges)
-                if self.rom_cache_size < self.rom_max_cache_size:
-                    self.rom_cache[(s, lcode, rom_format)] = best_edges
-                    self.rom_cache_size += 1
-                result = self.apply_any_offset_to_cached_rom_result(best_edges, offset)
+                # number edges are kept as such, as their class and attributes are part of the result
+                result = tuple([edge.record() if type(edge) is Edge else edge for edge in best_edges])
             else:
-                rom = lat.edge_path_to_surf(best_edges)
-                del lat
-                if self.rom_cache_size < self.rom_max_cache_size:
-                    self.rom_cache[(s, lcode, rom_format)] = rom
-                    self.rom_cache_size += 1
-                result = rom
+                result = lat.edge_path_to_surf(best_edges)
+        if self.cache_p:
+            cache_key = (s, lcode if lat.lcode_dependent else ANY_LCODE, rom_format)
+            self.rom_cache.put(cache_key, result)
+            if self.shared_rom_cache is not None:
+                self.shared_rom_cache.put(cache_key, result)
+            if self.persistent_rom_cache is not None:
+                self.persistent_rom_cache.put(cache_key, result)
         return result
 
+    def romanize_string_core(self, s: str, lcode: str | None, rom_format: RomFormat, offset: int = 0, **args) \
+            -> str | List[Edge]:
+        """Script to support token-by-token romanization with caching for higher speed."""
+        return self.apply_any_offset_to_cached_rom_result(self.romanize_token(s, lcode, rom_format, **args), offset)
+
+    @staticmethod
+    def compile_token_delimiter_regex(token_delimiters: str | None = None) -> regex.Pattern:
+        """Regex for delimiters between tokens, e.g. ' ' or '. ' (default core delimiters: DEFAULT_TOKEN_DELIMITERS)"""
+        extension_class = f'[{regex.escape(TOKEN_DELIMITER_EXTENSION_CHARS)}]*'
+        core_class = f'[{regex.escape(token_delimiters or DEFAULT_TOKEN_DELIMITERS)}]'
+        return regex.compile(extension_class + core_class + extension_class)
+
+    def segment_string(self, s: str) -> List[Tuple[str, int]]:
+        """Splits s in a single pass into a list of (token, offset) pairs, with delimiters as separate tokens.
+        Tokens are not empty. Same segmentation as the earlier repeated regex.match(r'(.*?)(<delimiter>)(.*)$', rest),
+        incl. treatment of line breaks: no split if s contains a line break other than a final one,
+        which is in turn dropped when splitting."""
+        end_position = len(s)
+        if (newline_position := s.find('\n')) >= 0:
+            if newline_position < end_position - 1:
+                return [(s, 0)]
+            end_position -= 1
+        segments, position = [], 0
+        for m in self.token_delimiter_regex.finditer(s, 0, end_position):
+            start, end = m.span()
+            if start > position:
+                segments.append((s[position:start], position))
+            segments.append((m.group(), start))
+            position = end
+        if not segments:
+            return [(s, 0)] if s else []
+        if end_position > position:
+            segments.append((s[position:end_position], position))
+        return segments
+
+    def romanize_string_segments(self, s: str, lcode: str | None = None, rom_format: RomFormat = RomFormat.STR,
+                                 **args) -> List[Tuple[int, str | tuple | List[Edge]]]:
+        """Romanizes s token by token (when caching) and returns a list of (offset, position-independent
+        romanization) pairs (see romanize_token), so that offsets can be applied lazily (e.g. by segments_json_str)."""
+        lcode = lcode or args.get('lcode', None)
+        if args.get('decode_unicode'):
+            s = self.decode_unicode_escapes(s)
+        if not self.cache_p:
+            return [(0, self.romanize_token(s, lcode, rom_format, **args))]
+        return [(offset, self.romanize_token(token, lcode, rom_format, **args))
+                for token, offset in self.segment_string(s)] \
+            or [(0, self.romanize_token('', lcode, rom_format, **args))]
+
+    @staticmethod
+    def segments_json_str(segments: List[Tuple[int, str | tuple | List[Edge]]], prefix: str = '') -> str:
+        """Serializes the result of romanize_string_segments, like Edge.json_str for romanize_string,
+        but without building any offset-adjusted Edge objects. Optional prefix, e.g. a JSON meta edge."""
+        if segments and isinstance(segments[0][1], str):
+            return ''.join([rom for _offset, rom in segments])
+        result = [prefix]
+        for offset, rom in segments:
+            if isinstance(rom, tuple):
+                for record in rom:
+                    start, end, txt, annotation = record if isinstance(record, tuple) else record.record()
+                    result.append(json.dumps([start + offset, end + offset, txt, annotation]))
+            else:
+                for edge in rom:
+                    result.append(json.dumps([edge.start + offset, edge.end + offset, edge.txt, edge.type]))
+        return '[' + ''.join(result) + ']'
+
     def romanize_string(self, s: str, lcode: str | None = None, rom_format: RomFormat = RomFormat.STR, **args) \
             -> str | List[Edge]:
         """Main entry point for romanizing a string. Recommended argument: lcode (language code).
         recursive only used for development.
         Method returns a string or a list of edges (with start and end offsets)."""
-        lcode = lcode or args.get('lcode', None)
         # print('rom::', s, 'lcode:', lcode, 'print-lattice:', print_lattice_p)
+        return self.segments_to_rom_result(self.romanize_string_segments(s, lcode, rom_format, **args), rom_format)
 
-        if args.get('decode_unicode'):
-            s = self.decode_unicode_escapes(s)
-        # with caching (for string format output only for now)
-        if self.cache_p:
-            rest, offset = s, 0
-            result = '' if rom_format == RomFormat.STR else []
-            while m3 := regex.match(r'(.*?)([.,; ]*[ 。་][.,; ]*)(.*)$', rest):
-                pre, delimiter, rest = m3.group(1, 2, 3)
-                result += self.romanize_string_core(pre, lcode, rom_format, offset, **args)
-                offset += len(pre)
-                result += self.romanize_string_core(delimiter, lcode, rom_format, offset, **args)
-                offset += len(delimiter)
-            result += self.romanize_string_core(rest, lcode, rom_format, offset, **args)
+    def segments_to_rom_result(self, segments: List[Tuple[int, str | tuple | List[Edge]]], rom_format: RomFormat) \
+            -> str | List[Edge]:
+        """Joins the result of romanize_string_segments into a string or a new list of edges."""
+        if rom_format == RomFormat.STR:
+            return ''.join([rom for _offset, rom in segments])
+        result = []
+        for offset, rom in segments:
+            result += self.apply_any_offset_to_cached_rom_result(rom, offset)
+        return result
+
+    def romanize_batch_segments(self, pairs: List[Tuple[str, str | None]], rom_format: RomFormat = RomFormat.STR,
+                                **args) -> List[List[Tuple[int, str | tuple | List[Edge]]]]:
+        """romanize_string_segments for a list of (s, lcode) pairs. Tokens that occur in several strings
+        (with the same lcode) are romanized (or looked up in the cache) only once, independent of the cache size."""
+        token_roms = {}  # key: (token, lcode)  value: position-independent romanization (see romanize_token)
+        result = []
+        for s, lcode in pairs:
+            if args.get('decode_unicode'):
+                s = self.decode_unicode_escapes(s)
+            segments = []
+            for token, offset in (self.segment_string(s) if self.cache_p else [(s, 0)]) or [('', 0)]:
+                if (rom := token_roms.get((token, lcode))) is None:
+                    rom = token_roms[(token, lcode)] = self.romanize_token(token, lcode, rom_format, **args)
+                segments.append((offset, rom))
+            result.append(segments)
+        return result
+
+    def romanize_batch(self, strings: List[str], lcodes: List[str | None] | str | None = None,
+                       rom_format: RomFormat = RomFormat.STR, workers: int = 1, **args) -> List[str | List[Edge]]:
+        """Romanizes a list of strings, e.g. entity names, with an optional language code for all strings or
+        a list of language codes, one per string. Identical (string, lcode) pairs are romanized only once,
+        grouped by lcode, sharing the romanization of tokens across strings (see romanize_batch_segments).
+        With workers > 1, large batches are split across worker processes (see romanize_file).
+        Returns a list of romanizations as by romanize_string, in input order."""
+        if (lcodes is None) or isinstance(lcodes, str):
+            lcodes = [lcodes or args.pop('lcode', None)] * len(strings)
+        elif len(lcodes) != len(strings):
+            sys.stderr.write(f'Error in romanize_batch: {len(lcodes)} lcodes for {len(strings)} strings\n')
+            return []
+        # distinct (s, lcode) pairs, grouped by lcode
+        pairs = sorted(dict.fromkeys(zip(strings, lcodes)), key=lambda pair: pair[1] or '')
+        if (workers > 1) and (len(pairs) > ROMANIZE_BATCH_CHUNK_SIZE):
+            chunks = [(pairs[start:start + ROMANIZE_BATCH_CHUNK_SIZE], rom_format, args)
+                      for start in range(0, len(pairs), ROMANIZE_BATCH_CHUNK_SIZE)]
+            with self.worker_pool(min(workers, len(chunks))) as pool:
+                pair_segments = [segments for result in pool.starmap(romanize_batch_worker_chunk, chunks)
+                                 for segments in self.merge_worker_result(result)]
+        else:
+            pair_segments = self.romanize_batch_segments(pairs, rom_format, **args)
+        if rom_format == RomFormat.STR:  # strings can be shared among duplicates
+            pair_roms = {pair: self.segments_to_rom_result(segments, rom_format)
+                         for pair, segments in zip(pairs, pair_segments)}
+            return [pair_roms[pair] for pair in zip(strings, lcodes)]
+        pair_segments = dict(zip(pairs, pair_segments))
+        return [self.segments_to_rom_result(pair_segments[pair], rom_format) for pair in zip(strings, lcodes)]
+
+    def romanize_iter(self, items: Iterable[str | Tuple[str, str | None]], lcode: str | None = None,
+                      rom_format: RomFormat = RomFormat.STR, prefetch: int = 0, workers: int = 1,
+                      chunk_size: int = ROMANIZE_FILE_CHUNK_SIZE, **args) -> Iterator[str | List[Edge]]:
+        """Lazily romanizes a stream of strings or (string, lcode) pairs (lcode: default language code) and yields
+        romanizations (as by romanize_string) in input order, with bounded memory.
+        With prefetch > 0, up to prefetch items are read ahead in a background thread, so that upstream I/O overlaps
+        with romanization. With workers > 1, chunks of chunk_size items are romanized by worker processes
+        (see romanize_file), at most 2 * workers chunks in flight."""
+        if workers <= 1:
+            if prefetch > 0:
+                items = self.prefetched(items, prefetch)
+            for item in items:
+                s, item_lcode = (item, lcode) if isinstance(item, str) else (item[0], item[1] or lcode)
+                yield self.romanize_string(s, item_lcode, rom_format, **args)
+            return
+        # Worker processes are forked before the prefetch thread is started, as forking a process with
+        # running threads can deadlock.
+        with self.worker_pool(workers) as pool:
+            if prefetch > 0:
+                items = self.prefetched(items, prefetch)
+            pairs = ((item, lcode) if isinstance(item, str) else (item[0], item[1] or lcode) for item in items)
+            tasks = ((chunk, rom_format, args) for chunk in iter(lambda: list(islice(pairs, chunk_size)), []))
+            for chunk_segments in self.map_tasks_in_parallel(pool, romanize_batch_worker_chunk, tasks, workers):
+                for segments in chunk_segments:
+                    yield self.segments_to_rom_result(segments, rom_format)
+
+    @staticmethod
+    def prefetched(items: Iterable, max_n_items: int) -> Iterator:
+        """Iterates over items in a background thread, at most max_n_items ahead of the consumer.
+        Any exception raised by the iteration over items is re-raised to the consumer."""
+        buffer = queue.Queue(maxsize=max_n_items)
+        end_of_items = object()
+        consumer_done = threading.Event()
+
+        def put(entry) -> bool:
+            while not consumer_done.is_set():
+                try:
+                    buffer.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce():
+            try:
+                for item in items:
+                    if not put((item, None)):
+                        return
+                put((end_of_items, None))
+            except BaseException as error:
+                put((end_of_items, error))
+
+        threading.Thread(target=produce, daemon=True).start()
+        try:
+            while True:
+                item, error = buffer.get()
+                if item is end_of_items:
+                    if error is not None:
+                        raise error
+                    return
+                yield item
+        finally:
+            consumer_done.set()
+
+
+romanize_file_worker_uroman: Uroman | None = None  # Uroman instance of a romanize_file worker process
+romanize_file_worker_inherited_caches = []  # inherited persistent caches, to be neither used nor closed by workers
+
+
+def init_romanize_file_worker(uroman: Uroman | None, uroman_args: dict | None):
+    """Initializes a romanize_file worker process with an inherited (forked) Uroman instance or a new one."""
+    global romanize_file_worker_uroman
+    if uroman is None:
+        uroman = Uroman(**uroman_args)
+    elif (persistent_rom_cache := uroman.persistent_rom_cache) is not None:
+        # An sqlite3 connection must not be used (or closed) across a fork, so each worker opens its own.
+        romanize_file_worker_inherited_caches.append(persistent_rom_cache)
+        uroman.persistent_rom_cache = None
+        uroman.open_persistent_cache(persistent_rom_cache.filename, read_only=persistent_rom_cache.read_only)
+    romanize_file_worker_uroman = uroman
+
+
+def romanize_batch_worker_chunk(pairs: List[Tuple[str, str | None]], rom_format: RomFormat, args: dict) \
+        -> Tuple[List[List[Tuple[int, str | tuple | List[Edge]]]], dict]:
+    """Romanizes a chunk of romanize_batch (s, lcode) pairs in a worker process. Returns segments and stats."""
+    uroman = romanize_file_worker_uroman
+    uroman.stats = defaultdict(int)
+    result = uroman.romanize_batch_segments(pairs, rom_format, **args)
+    if uroman.persistent_rom_cache is not None:
+        uroman.persistent_rom_cache.flush()  # worker processes exit without atexit handlers
+    return result, dict(uroman.stats)
+
+
+def romanize_string_worker(s: str, lcode: str | None, rom_format: RomFormat, args: dict) -> str | List[Edge]:
+    """Romanizes a string in a worker process (see AsyncUroman)."""
+    return romanize_file_worker_uroman.romanize_string(s, lcode, rom_format, **args)
+
+
+def romanize_file_worker_chunk(lines: List[str], lcode: str | None, args: dict) -> Tuple[List[str], dict]:
+    """Romanizes a chunk of romanize_file lines in a worker process. Returns output lines and stats of this chunk."""
+    uroman = romanize_file_worker_uroman
+    uroman.stats = defaultdict(int)
+    rom_lines = [uroman.romanize_file_line_memoized(line, lcode, **args) for line in lines]
+    if uroman.persistent_rom_cache is not None:
+        uroman.persistent_rom_cache.flush()  # worker processes exit without atexit handlers
+    if not args.get('silent'):
+        gc.collect()
+    return rom_lines, dict(uroman.stats)
+
+
+class AsyncUroman:
+    """asyncio facade of a Uroman instance. Romanization runs in an executor, so that long lines (e.g. Thai or
+    Tibetan) do not block the event loop: a thread pool sharing the Uroman instance (executor='thread', default),
+    a process pool of workers (executor='process'; started with 'forkserver' or 'spawn', not 'fork', so each worker
+    loads its own Uroman instance with the same data_dir and init args) or a given concurrent.futures.Executor
+    (threads; for processes, use executor='process', which sets up the workers' Uroman instances).
+    At most max_pending computations are submitted to the executor at a time (backpressure).
+    Concurrent requests for the same (s, lcode, rom_format) are coalesced into one computation, which is
+    cancelled when all of its requests are cancelled (unless already running)."""
+
+    def __init__(self, uroman: Uroman | None = None, executor: str | concurrent.futures.Executor = 'thread',
+                 max_workers: int | None = None, max_pending: int = ASYNC_UROMAN_MAX_PENDING, **args):
+        """args: romanization args as for romanize_string, e.g. decode_unicode"""
+        self.uroman = uroman or Uroman()
+        self.args = args
+        self.own_executor = isinstance(executor, str)
+        if executor == 'thread':
+            self.executor = concurrent.futures.ThreadPoolExecutor(max_workers, thread_name_prefix='uroman')
+        elif executor == 'process':
+            # Not forked, as an asyncio program typically has threads running (e.g. of other executors).
+            context, init_args = self.uroman.worker_process_setup(fork=False)
+            self.executor = concurrent.futures.ProcessPoolExecutor(max_workers, mp_context=context,
+                                                                   initializer=init_romanize_file_worker,
+                                                                   initargs=init_args)
+        elif isinstance(executor, concurrent.futures.Executor):
+            self.executor = executor
+        else:
+            raise ValueError(f"AsyncUroman executor {executor!r} is not 'thread', 'process' or an Executor")
+        self.in_process_pool = (executor == 'process')
+        self.max_pending = max_pending
+        self.semaphore = asyncio.Semaphore(max_pending)
+        # key: (s, lcode, rom_format)  value: [future of computation, number of waiting requests]
+        self.in_flight = {}
+        self.n_requests = 0
+        self.n_coalesced = 0
+        self.n_computations = 0
+
+    async def compute(self, s: str, lcode: str | None, rom_format: RomFormat) -> str | List[Edge]:
+        async with self.semaphore:
+            self.n_computations += 1
+            if self.in_process_pool:
+                function = functools.partial(romanize_string_worker, s, lcode, rom_format, self.args)
+            else:
+                function = functools.partial(self.uroman.romanize_string, s, lcode, rom_format, **self.args)
+            return await asyncio.get_running_loop().run_in_executor(self.executor, function)
+
+    async def romanize(self, s: str, lcode: str | None = None, rom_format: RomFormat = RomFormat.STR) \
+            -> str | List[Edge]:
+        """Returns the romanization of s, as by Uroman.romanize_string."""
+        self.n_requests += 1
+        key = (s, lcode, rom_format)
+        if (entry := self.in_flight.get(key)) is None:
+            future = asyncio.ensure_future(self.compute(s, lcode, rom_format))
+            entry = self.in_flight[key] = [future, 0]
+            future.add_done_callback(lambda _future: self.remove_in_flight_entry(key, entry))
+        else:
+            self.n_coalesced += 1
+        future = entry[0]
+        entry[1] += 1
+        try:
+            # shielded, so that cancelling one request does not cancel the computation for other requests
+            result = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if (entry[1] == 1) and not future.done():
+                future.cancel()
+                self.remove_in_flight_entry(key, entry)  # new requests start a new computation
+            raise
+        finally:
+            entry[1] -= 1
+        if isinstance(result, str):
             return result
+        return [edge.copy_with_offset(0) for edge in result]  # own edges for each of any coalesced requests
+
+    def remove_in_flight_entry(self, key: Tuple[str, str | None, RomFormat], entry: list):
+        if self.in_flight.get(key) is entry:
+            del self.in_flight[key]
+
+    async def romanize_iter(self, items: AsyncIterable[str | Tuple[str, str | None]] | Iterable,
+                            lcode: str | None = None, rom_format: RomFormat = RomFormat.STR,
+                            max_ahead: int | None = None) -> AsyncIterator[str | List[Edge]]:
+        """Romanizes an (async) stream of strings or (string, lcode) pairs, yielding romanizations in input order.
+        Up to max_ahead items (default: max_pending) are romanized ahead of the consumer.
+        Pending romanizations are cancelled when the iteration is closed early."""
+        max_ahead = max_ahead or self.max_pending
+        pending = deque()
+        try:
+            async for item in self.async_items(items):
+                s, item_lcode = (item, lcode) if isinstance(item, str) else (item[0], item[1] or lcode)
+                pending.append(asyncio.ensure_future(self.romanize(s, item_lcode, rom_format)))
+                if len(pending) >= max_ahead:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    async def async_items(items: AsyncIterable | Iterable) -> AsyncIterator:
+        if hasattr(items, '__aiter__'):
+            async for item in items:
+                yield item
         else:
-            return self.romanize_string_core(s, lcode, rom_format, 0, **args)
+            for item in items:
+                yield item
+
+    def stats(self) -> dict:
+        return {'requests': self.n_requests, 'coalesced': self.n_coalesced, 'computations': self.n_computations,
+                'in_flight': len(self.in_flight)}
+
+    def close(self, wait: bool = True):
+        """Shuts down the executor (unless provided by the caller)."""
+        if self.own_executor:
+            self.executor.shutdown(wait=wait, cancel_futures=True)
+
+    async def __aenter__(self) -> AsyncUroman:
+        return self
+
+    async def __aexit__(self, *_exc_info):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
 
 
 class Edge:
     """This class defines edges that span part of a sentence with a specific romanization.
     There might be multiple edges for a given span. The edges in turn are part of the
     romanization lattice."""
+    approx_n_bytes = 120  # approx. memory of an edge (object, attribute values, share of txt), for rom_cache
+
     def __init__(self, start: int, end: int, s: str, annotation: str = None):
         self.start = start
         self.end = end
@@ -1166,6 +3198,17 @@ class Edge:
     def json(self) -> str:  # start - end - text - annotation
         return json.dumps([self.start, self.end, self.txt, self.type])
 
+    def record(self) -> Tuple[int, int, str, str | None]:
+        """Immutable compact form of the edge, e.g. for rom_cache."""
+        return self.start, self.end, self.txt, self.type
+
+    def copy_with_offset(self, offset: int) -> Edge:
+        """Copy of the edge (same class, e.g. NumEdge, and attributes), with start and end moved by offset."""
+        edge = copy.copy(self)
+        edge.start += offset
+        edge.end += offset
+        return edge
+
     @staticmethod
     def json_str(rom_result: List[Edge] | str) -> str:
         if isinstance(rom_result, str):
@@ -1182,6 +3225,8 @@ class Edge:
 
 
 class NumEdge(Edge):
+    approx_n_bytes = 280
+
     def __init__(self, start: int, end: int, s: str, uroman: Uroman | None, active: bool = False):
         """For NumEdge, the s argument is in original language (not yet romanized)."""
         # For speed, much of this processing should at some point be cached in data files.
@@ -1260,6 +3305,7 @@ class Lattice:
     def __init__(self, s: str, uroman: Uroman, lcode: str = None):
         self.s = s
         self.lcode = lcode
+        self.lcode_dependent = False  # set when any romanization decision depends on lcode (e.g. for rom_cache)
         self.lattice = defaultdict(set)
         self.max_vertex = len(s)
         self.uroman = uroman
@@ -1269,6 +3315,8 @@ class Lattice:
         self.check_for_scripts()
 
     def check_for_scripts(self):
+        if self.uroman.pending_script_groups:
+            self.uroman.load_scripts_for_string(self.s)
         for c in self.s:
             script_name = self.uroman.chr_script_name(c)
             self.contains_script[script_name] = True
@@ -1294,17 +3342,16 @@ class Lattice:
 
     # Help Tibet
     def char_is_subjoined_letter(self, c: str) -> bool:
-        return "SUBJOINED LETTER" in self.uroman.chr_name(c)
+        return bool(self.uroman.chr_props(c) & CP_SUBJOINED_LETTER)
 
     def char_is_regular_letter(self, c: str) -> bool:
-        char_name = self.uroman.chr_name(c)
-        return ("LETTER" in char_name) and not ("SUBJOINED" in char_name)
+        return (self.uroman.chr_props(c) & (CP_LETTER | CP_SUBJOINED)) == CP_LETTER
 
     def char_is_letter(self, c: str) -> bool:
-        return "LETTER" in self.uroman.chr_name(c)
+        return bool(self.uroman.chr_props(c) & CP_LETTER)
 
     def char_is_vowel_sign(self, c: str) -> bool:
-        return self.uroman.dict_bool[('is-vowel-sign', c)]
+        return bool(self.uroman.chr_props(c) & CP_VOWEL_SIGN)
 
     def char_is_letter_or_vowel_sign(self, c: str) -> bool:
         return self.char_is_letter(c) or self.char_is_vowel_sign(c)
@@ -1340,16 +3387,18 @@ class Lattice:
                 self.props[('followed_by_alpha', position)] = True
                 return False
         while (start+1 < self.max_vertex) \
-                and self.uroman.char_is_nonspacing_mark(self.s[start]) \
-                and ('NUKTA' in self.uroman.chr_name(self.s[start])):
+                and ((self.uroman.chr_props(self.s[start]) & (CP_NONSPACING_MARK | CP_NUKTA))
+                     == (CP_NONSPACING_MARK | CP_NUKTA)):
             start += 1
+        node = self.uroman.s_prefix_trie
         for end in range(start + 1, self.max_vertex + 1):
-            s = self.s[start:end]
-            if not self.uroman.dict_bool[('s-prefix', s)]:
+            if (node := node.get(self.s[end-1])) is None:
                 break
-            for rom_rule in self.uroman.rom_rules[s]:
-                rom = rom_rule['t']
-                if (not rom_rule['use-only-at-start-of-word']) and regex.search(r'\pL', rom):
+            if '' not in node:
+                continue
+            for rom_rule in self.uroman.rom_rules[self.s[start:end]]:
+                rom = rom_rule.t
+                if (not (rom_rule.flags & RULE_USE_ONLY_AT_START_OF_WORD)) and regex.search(r'\pL', rom):
                     self.props[('followed_by_alpha', position)] = True
                     return False
         self.props[('followed_by_alpha', position)] = False
@@ -1360,7 +3409,7 @@ class Lattice:
         prev_char = self.s[position-2] if position >= 2 else None
         # char = self.s[position-1] if position >= 1 else None
         next_char = self.s[position] if position < self.max_vertex else None
-        if self.uroman.dict_str[('tone-mark', next_char)]:
+        if self.uroman.chr_props(next_char) & CP_TONE_MARK:
             adj_position = position + 1
             next_char = self.s[adj_position] if adj_position < self.max_vertex else None
             # print('TONE-MARK', position, next_char)
@@ -1371,9 +3420,9 @@ class Lattice:
             return False, 'start-of-string'
         if not regex.search(r'(?:\pL|\pM)$', prev_char):  # start of token
             return False, 'start-of-token'
-        if self.uroman.dict_str[('syllable-info', prev_char)] == 'written-pre-consonant-spoken-post-consonant':
+        if self.uroman.dict_str.get(('syllable-info', prev_char)) == 'written-pre-consonant-spoken-post-consonant':
             return False, 'pre-post-vowel-on-left'
-        if self.uroman.dict_str[('syllable-info', next_char)] == 'written-pre-consonant-spoken-post-consonant':
+        if self.uroman.dict_str.get(('syllable-info', next_char)) == 'written-pre-consonant-spoken-post-consonant':
             return True, 'pre-post-vowel-on-right'
         if adj_position >= self.max_vertex:  # end of string
             return True, 'end-of-string'
@@ -1447,7 +3496,7 @@ class Lattice:
         # Thai
         if uroman.chr_script_name(first_char) == 'Thai':
             if (start+1 == end) and regex.match(r'[bcdfghjklmnpqrstvwxyz]+$', rom):
-                if uroman.dict_str[('syllable-info', prev_char)] == 'written-pre-consonant-spoken-post-consonant':
+                if uroman.dict_str.get(('syllable-info', prev_char)) == 'written-pre-consonant-spoken-post-consonant':
                     for vowel_prefix_len in [1]:
                         if vowel_prefix_len <= start:
                             for vowel_suffix_len in [3, 2, 1]:
@@ -1461,7 +3510,7 @@ class Lattice:
                                         # print(f" PATTERN {pattern} ({full_string[start:end]}/{rom}) {rom}{vowel_rom}")
                                         return rom + vowel_rom, start-vowel_prefix_len, end+vowel_suffix_len, 'rom exp'
             if (uroman.chr_script_name(prev_char) == 'Thai') \
-                    and (uroman.dict_str[('syllable-info', prev_char)]
+                    and (uroman.dict_str.get(('syllable-info', prev_char))
                          == 'written-pre-consonant-spoken-post-consonant') \
                     and regex.match(r'[bcdfghjklmnpqrstvwxyz]', rom) \
                     and (vowel_rom := self.romanization_by_first_rule(prev_char)):
@@ -1512,7 +3561,7 @@ class Lattice:
                 and (last_rom_char in 'aeiou'):
             return rom + last_rom_char, start, end+1, 'rom exp'
         # Virama (in Indian languages)
-        if self.uroman.dict_bool[('is-virama', next_char)]:
+        if self.uroman.chr_props(next_char) & CP_VIRAMA:
             return rom, start, end + 1, "rom exp"
         if rom.startswith(' ') and ((start == 0) or (prev_char == ' ')):
             rom = rom[1:]
@@ -1658,8 +3707,8 @@ class Lattice:
             first_s_char = s[start]
             last_s_char = s[end-1]
             script_name = uroman.chr_script_name(first_s_char)
-            script = self.uroman.scripts[script_name.lower()]
-            if not (abugida_default_vowels := script['abugida-default-vowels']):
+            script = self.uroman.scripts.get(script_name.lower())
+            if not (script and (abugida_default_vowels := script['abugida-default-vowels'])):
                 return rom
             key = (script, rom)
             if key in uroman.abugida_cache:
@@ -1701,26 +3750,26 @@ class Lattice:
             if (next_s_char and ((base_rom in "bcdfghklmnpqrstvwz") or (base_rom in ["ng"]))
                     and (next_s_char in "យ")):  # Khmer yo
                 return base_rom
-            if self.uroman.dict_bool[('is-vowel-sign', next_s_char)]:
-                return base_rom
-            if self.uroman.dict_bool[('is-medial-consonant-sign', next_s_char)]:
+            next_s_char_props = uroman.chr_props(next_s_char)
+            if next_s_char_props & (CP_VOWEL_SIGN | CP_MEDIAL_CONSONANT_SIGN):
                 return base_rom
             if self.char_is_subjoined_letter(next_s_char):
                 return base_rom
             if self.uroman.char_is_nonspacing_mark(next_s_char) \
-                    and self.uroman.dict_bool[('is-vowel-sign', next2_s_char)]:
+                    and (uroman.chr_props(next2_s_char) & CP_VOWEL_SIGN):
                 return base_rom
-            if self.uroman.dict_bool[('is-virama', next_s_char)]:
+            if next_s_char_props & CP_VIRAMA:
                 return base_rom
             if self.uroman.char_is_nonspacing_mark(next_s_char) \
-                    and self.uroman.dict_bool[('is-virama', next2_s_char)]:
+                    and (uroman.chr_props(next2_s_char) & CP_VIRAMA):
                 return base_rom
-            if self.uroman.dict_bool[('is-virama', prev_s_char)]:
+            if uroman.chr_props(prev_s_char) & CP_VIRAMA:
                 return base_rom_plus_vowel
             if self.is_at_start_of_word(start) and not regex.search('r[aeiou]', rom):
                 return base_rom_plus_vowel
             # delete many final schwas from most Devanagari languages (except: Sanskrit)
             if self.is_at_end_of_word(end):
+                self.lcode_dependent = True
                 if (script_name in ("Devanagari",)) and (self.lcode not in ('san',)):  # Sanskrit
                     return rom
                 elif self.lcode in ('asm', 'ben', 'guj', 'kas', 'pan'):
@@ -1729,7 +3778,7 @@ class Lattice:
                     return base_rom_plus_vowel
             if uroman.chr_script_name(prev_s_char) != script_name:
                 return base_rom_plus_vowel
-            if 'VOCALIC' in self.uroman.chr_name(last_s_char):
+            if uroman.chr_props(last_s_char) & CP_VOCALIC:
                 return base_rom
             if uroman.chr_script_name(next_s_char) == script_name:
                 return base_rom_plus_vowel
@@ -1743,31 +3792,31 @@ class Lattice:
     def cand_is_valid(self, rom_rule: RomRule, start: int, end: int, rom: str) -> bool:
         if rom is None:
             return False
-        if rom_rule['dont-use-at-start-of-word'] and self.is_at_start_of_word(start):
-            return False
-        if rom_rule['use-only-at-start-of-word'] and not self.is_at_start_of_word(start):
-            return False
-        if rom_rule['dont-use-at-end-of-word'] and self.is_at_end_of_word(end):
-            return False
-        if rom_rule['use-only-at-end-of-word'] and not self.is_at_end_of_word(end):
-            return False
-        if rom_rule['use-only-for-whole-word'] \
-                and not (self.is_at_start_of_word(start) and self.is_at_end_of_word(end)):
-            return False
-        if (lcodes := rom_rule['lcodes']) and (self.lcode not in lcodes):
-            return False
+        if flags := rom_rule.flags & RULE_WORD_RESTRICTIONS:
+            if (flags & RULE_DONT_USE_AT_START_OF_WORD) and self.is_at_start_of_word(start):
+                return False
+            if (flags & RULE_USE_ONLY_AT_START_OF_WORD) and not self.is_at_start_of_word(start):
+                return False
+            if (flags & RULE_DONT_USE_AT_END_OF_WORD) and self.is_at_end_of_word(end):
+                return False
+            if (flags & RULE_USE_ONLY_AT_END_OF_WORD) and not self.is_at_end_of_word(end):
+                return False
+            if (flags & RULE_USE_ONLY_FOR_WHOLE_WORD) \
+                    and not (self.is_at_start_of_word(start) and self.is_at_end_of_word(end)):
+                return False
+        if lcodes := rom_rule.lcodes:
+            self.lcode_dependent = True
+            if self.lcode not in lcodes:
+                return False
         return True
 
     # @profile
     def simple_sorted_romanization_candidates_for_span(self, start, end) -> List[str]:
-        s = self.s[start:end]
-        if not self.uroman.dict_bool[('s-prefix', s)]:
-            return []
         rom_rule_candidates = []
-        for rom_rule in self.uroman.rom_rules[s]:
-            rom = rom_rule['t']
+        for rom_rule in self.uroman.rom_rules.get(self.s[start:end], []):
+            rom = rom_rule.t
             if self.cand_is_valid(rom_rule, start, end, rom):
-                rom_rule_candidates.append((rom_rule['n-restr'] or 0, rom_rule['t']))
+                rom_rule_candidates.append((rom_rule.n_restr, rom))
         rom_rule_candidates.sort(reverse=True)
         return [x[1] for x in rom_rule_candidates]
 
@@ -1779,14 +3828,14 @@ class Lattice:
             return cached_result
         best_cand, best_n_restr, best_rom_rule = None, None, None
         for rom_rule in self.uroman.rom_rules[self.s[start:end]]:
-            if self.cand_is_valid(rom_rule, start, end, rom_rule['t']):
-                n_restr = rom_rule['n-restr'] or 0
+            if self.cand_is_valid(rom_rule, start, end, rom_rule.t):
+                n_restr = rom_rule.n_restr
                 if best_n_restr is None or (n_restr > best_n_restr):
-                    best_cand, best_n_restr, best_rom_rule = rom_rule['t'], n_restr, rom_rule
+                    best_cand, best_n_restr, best_rom_rule = rom_rule.t, n_restr, rom_rule
         if simple_search:
             return best_cand
         if best_rom_rule:
-            t_at_end_of_syllable = best_rom_rule['t-at-end-of-syllable']
+            t_at_end_of_syllable = best_rom_rule.t_at_end_of_syllable
             # noinspection GrazieInspection
             if t_at_end_of_syllable is not None:
                 is_at_end_of_syllable, rationale = self.is_at_end_of_syllable(end)
@@ -1822,6 +3871,7 @@ class Lattice:
                         decomp_s += norm_char
             if (format_comps and (format_comps[0] not in ('<super>', '<sub>', '<noBreak>', '<compat>'))
                     and (not other_comps) and decomp_s):
+                self.lcode_dependent = True  # conservatively, as the romanization of decomp_s might depend on lcode
                 rom = self.uroman.romanize_string(decomp_s, self.lcode)
             # make sure to add a space for 23½ -> 23 1/2
             if rom and ud.numeric(char, None):
@@ -1834,10 +3884,15 @@ class Lattice:
 
     def add_romanization(self, **args):
         """Adds a romanization edge to the romanization lattice."""
+        s_prefix_trie = self.uroman.s_prefix_trie
         for start in range(self.max_vertex):
+            node = s_prefix_trie
             for end in range(start+1, self.max_vertex+1):
-                if not self.uroman.dict_bool[('s-prefix', self.s[start:end])]:
+                # walk the trie forward from start (rather than checking each substring self.s[start:end])
+                if (node := node.get(self.s[end-1])) is None:
                     break
+                if '' not in node:
+                    continue  # only a prefix of rom_rules source strings
                 if (rom := self.simple_top_romanization_candidate_for_span(start, end)) is not None:
                     if self.contains_script['Braille'] and (start+1 == end):
                         if self.props.get(('is-upper', start)):
@@ -1939,7 +3994,7 @@ class Lattice:
         num_edges = []
         for start in range(len(s)):
             char = s[start]
-            if uroman.num_props[char]:
+            if uroman.num_props.get(char):
                 new_edge = NumEdge(start, start + 1, char, uroman)
                 num_edges.append(new_edge)
                 if verbose:
@@ -2167,7 +4222,8 @@ class Lattice:
                     # if start_char not in '0123456789': print('DIGIT', s[start], num, name)
                     self.add_edge(Edge(start, start + 1, str(num), 'num'))
                 else:
-                    uroman.stats[('*NUM', start_char, num)] += 1
+                    with self.uroman.stats_lock:
+                        self.uroman.stats[('*NUM', start_char, num)] += 1
 
     def add_rom_fall_back_singles(self, **_args):
         """For characters in the original string not covered by romanizations and numbers,
@@ -2181,7 +4237,7 @@ class Lattice:
                     rom, edge_annotation = '', 'Mn'
                 elif self.uroman.char_is_format_char(rom):  # e.g. zero-width non-joiner, zero-width joiner
                     rom, edge_annotation = '', 'Cf'
-                elif ud.category(orig_char) == 'Co':
+                elif self.uroman.chr_props(orig_char) & CP_PRIVATE_USE:
                     rom, edge_annotation = '', 'Co'
                 elif rom == ' ':
                     edge_annotation = 'orig'
@@ -2225,10 +4281,10 @@ class Lattice:
                 # print(f'    CORE:{old_rom_core} SUFFIX:{old_rom_suffix}')
             # self.lattice[(start, end)]:
             for rom_rule in self.uroman.rom_rules[orig_s]:
-                rom_t = rom_rule['t']
+                rom_t = rom_rule.t
                 if self.cand_is_valid(rom_rule, start, end, rom_t):
-                    rom_alts = rom_rule['t-alts']
-                    rom_end_of_syllable = rom_rule['t-at-end-of-syllable']
+                    rom_alts = rom_rule.t_alts
+                    rom_end_of_syllable = rom_rule.t_at_end_of_syllable
                     if (rom_t in [old_rom, old_rom_core]) and rom_alts:
                         for rom_alt in rom_alts:
                             if old_rom_suffix and (rom_t == old_rom_core):
@@ -2326,6 +4382,94 @@ class Lattice:
         return result
 
 
+def fork_memory_worker(uroman: Uroman, lines: List[str], args: dict, barrier, queue):
+    init_romanize_file_worker(uroman, None)
+    for start in range(0, len(lines), ROMANIZE_FILE_CHUNK_SIZE):
+        romanize_file_worker_chunk(lines[start:start + ROMANIZE_FILE_CHUNK_SIZE], args.get('lcode'), args)
+    barrier.wait()  # all workers are alive when measured (Pss)
+    queue.put((os.getpid(), smaps_rollup_kb()))
+    barrier.wait()
+
+
+def measure_fork_memory(uroman: Uroman, n_workers: int, lines: List[str], **args) -> dict:
+    """Development tool: forks n_workers worker processes from uroman (as is, e.g. with or without prefork mode),
+    each romanizing lines as a romanize_file worker, and reports their shared and private memory (in KB, from
+    /proc/<pid>/smaps_rollup, Linux only), with all workers still alive. Pss (proportional set size) splits shared
+    pages among the processes sharing them, so the sum of Pss is the total memory of the parent and its workers."""
+    if smaps_rollup_kb() is None:
+        sys.stderr.write('Fork memory report requires /proc/<pid>/smaps_rollup (Linux)\n')
+        return {}
+    context = multiprocessing.get_context('fork')
+    barrier, queue = context.Barrier(n_workers), context.Queue()
+    workers = [context.Process(target=fork_memory_worker, args=(uroman, lines, args, barrier, queue))
+               for _ in range(n_workers)]
+    for worker in workers:
+        worker.start()
+    worker_memory = dict(queue.get() for _ in workers)
+    parent_memory = smaps_rollup_kb()
+    for worker in workers:
+        worker.join()
+    result = {'n_workers': n_workers, 'n_lines': len(lines), 'prefork': bool(gc.get_freeze_count()),
+              'parent': parent_memory, 'workers': [worker_memory[worker.pid] for worker in workers]}
+    for key, memory_keys in (('shared', ('Shared_Clean', 'Shared_Dirty')),
+                             ('private', ('Private_Clean', 'Private_Dirty'))):
+        result[f'worker_{key}_kb'] = sum(memory[k] for memory in result['workers'] for k in memory_keys)
+    result['worker_rss_kb'] = sum(memory['Rss'] for memory in result['workers'])
+    result['total_pss_kb'] = parent_memory['Pss'] + sum(memory['Pss'] for memory in result['workers'])
+    sys.stderr.write(f"{n_workers} workers (prefork: {result['prefork']}): "
+                     f"shared {result['worker_shared_kb']:,d} KB, private {result['worker_private_kb']:,d} KB, "
+                     f"RSS {result['worker_rss_kb']:,d} KB; parent RSS {parent_memory['Rss']:,d} KB; "
+                     f"total PSS {result['total_pss_kb']:,d} KB\n")
+    return result
+
+
+def benchmark_double_colon_parsing(data_dir: Path, n_repeats: int = 1) -> dict:
+    """Development tool: compares, for each resource file in ::slot value format, the parse cost of the
+    old approach (one slot_value_in_double_colon_del_list() regex call per slot that a loader queries)
+    with the single-pass double_colon_del_list_to_dict(). Returns {filename: (old_sec, new_sec)}."""
+    rom_common_slots = ['num', 'is-minus-sign', 'is-plus-sign', 'is-decimal-point', 'is-large-power',
+                        'fraction-connector', 'percentage-marker', 'int-frac-connector', 'lcode',
+                        'use-only-at-start-of-word', 'dont-use-at-start-of-word', 'use-only-at-end-of-word',
+                        'dont-use-at-end-of-word', 'use-only-for-whole-word', 'num', 't-alt']
+    # slots as formerly queried (line by line) by load_rom_file, load_script_file and load_unicode_data_props
+    file_slots = {"romanization-auto-table.txt": ['s', 't', 't-end-of-syllable'] + rom_common_slots,
+                  "UnicodeDataOverwrite.txt": ['u', 'r', 'name', 'pic', 'tone-mark', 'syllable-info']
+                  + rom_common_slots,
+                  "romanization-table.txt": ['s', 't', 't-end-of-syllable'] + rom_common_slots,
+                  "Scripts.txt": ['script-name', 'direction', 'abugida-default-vowel', 'alt-script-name',
+                                  'language'],
+                  "UnicodeDataProps.txt": ['script-name', 'char', 'numeral', 'vowel-sign', 'medial-consonant-sign',
+                                           'sign-virama'],
+                  "UnicodeDataPropsCJK.txt": ['script-name', 'char', 'numeral', 'vowel-sign',
+                                              'medial-consonant-sign', 'sign-virama'],
+                  "UnicodeDataPropsHangul.txt": ['script-name', 'char', 'numeral', 'vowel-sign',
+                                                 'medial-consonant-sign', 'sign-virama']}
+    result = {}
+    for base_file, slots in file_slots.items():
+        try:
+            with open(os.path.join(data_dir, base_file), 'r', encoding='utf-8') as f:
+                lines = [regex.sub(r'\s{2,}#.*$', '', line) for line in f
+                         if not (line.startswith('#') or regex.match(r'^\s*$', line))]
+        except OSError:
+            sys.stderr.write(f'Cannot open file {base_file}\n')
+            continue
+        start_time = time.perf_counter()
+        for _ in range(n_repeats):
+            for line in lines:
+                for slot in slots:
+                    slot_value_in_double_colon_del_list(line, slot)
+        old_time = (time.perf_counter() - start_time) / n_repeats
+        start_time = time.perf_counter()
+        for _ in range(n_repeats):
+            for line in lines:
+                double_colon_del_list_to_dict(line)
+        new_time = (time.perf_counter() - start_time) / n_repeats
+        result[base_file] = (old_time, new_time)
+        sys.stderr.write(f'{base_file:28s} {len(lines):6d} lines  old: {old_time:7.3f} sec  '
+                         f'new: {new_time:7.3f} sec  speed-up: {old_time / max(new_time, 1e-9):5.1f}x\n')
+    return result
+
+
 # @timer
 def main():
     """This function provides a user interface, either using argparse for a command line interface,
@@ -2346,6 +4490,13 @@ def main():
                         choices=list(RomFormat), help="Output format of romanization. 'edges' provides offsets")
     # The remaining arguments are mostly for development and test
     parser.add_argument('--max_lines', type=int, default=None, help='limit uroman to first n lines')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='number of worker processes for romanizing an input file (output in input order)')
+    parser.add_argument('--prefork', action='count', default=0,
+                        help='prepare loaded tables for sharing with forked worker processes (copy-on-write)')
+    parser.add_argument('--fork_memory_report', type=int, default=0, metavar='N-WORKERS',
+                        help='report shared and private memory of N forked workers romanizing the input file '
+                             '(default: mini-test) (for development mode only; Linux)')
     parser.add_argument('--load_log', action='count', default=0, help='report load stats (boolean)')
     parser.add_argument('--test', action='count', default=0, help='perform/display a few tests')
     parser.add_argument('-d', '--decode_unicode', action='count', default=0,
@@ -2355,8 +4506,38 @@ def main():
                         help='rebuild UnicodeDataProps files (for development mode only)')
     parser.add_argument('--rebuild_num_props', action='count', default=0,
                         help='rebuild NumProps file (for development mode only)')
+    parser.add_argument('--benchmark_parsing', action='count', default=0,
+                        help='compare parse cost of resource files, old vs. new (for development mode only)')
     parser.add_argument('-c', '--cache_size', type=int, default=DEFAULT_ROM_MAX_CACHE_SIZE,
-                        help='for speed')
+                        help='max number of entries in LRU romanization cache (for speed; 0: no cache)')
+    parser.add_argument('--cache_max_bytes', type=int, default=None,
+                        help='max estimated memory (bytes) of romanization cache entries (default: no limit)')
+    parser.add_argument('--persistent_cache', type=str, default=None, metavar='CACHE-FILENAME',
+                        help='on-disk (sqlite3) romanization cache, shared across runs (created if needed)')
+    parser.add_argument('--persistent_cache_read_only', action='count', default=0,
+                        help='do not add any entries to the persistent cache (e.g. for parallel workers)')
+    parser.add_argument('--shared_cache', type=str, default=None, metavar='SHARED-MEMORY-NAME',
+                        help='romanization cache tier in shared memory, shared by processes using the same name')
+    parser.add_argument('--shared_cache_slots', type=int, default=SHARED_CACHE_N_SLOTS,
+                        help=f'number of {SHARED_CACHE_SLOT_SIZE}-byte slots of a new shared cache')
+    parser.add_argument('--warm_cache', type=str, default=None, metavar='TOKEN-OR-CACHE-FILENAME',
+                        help='pre-populate cache from frequency-ranked token list or from file by --export_cache')
+    parser.add_argument('--export_cache', type=str, default=None, metavar='CACHE-FILENAME',
+                        help='write cache entries (most recently used first) to file at end')
+    parser.add_argument('--adaptive_cache', action='count', default=0,
+                        help='adapt cache size to observed hit rates, within --cache_max_bytes (default: 64 MB)')
+    parser.add_argument('--line_memo_size', type=int, default=0,
+                        help='max number of memoized output lines, for duplicate-heavy input (default: 0, i.e. none)')
+    parser.add_argument('--token_delimiters', type=str, default=None,
+                        help=f'characters that split lines into cached tokens (default: {DEFAULT_TOKEN_DELIMITERS!r})')
+    parser.add_argument('--build_snapshot', action='count', default=0,
+                        help='parse resource files and save them as a snapshot for fast loading')
+    parser.add_argument('--snapshot_filename', type=str, default=None,
+                        help=f'default: {SNAPSHOT_FILENAME} in data_dir')
+    parser.add_argument('--no_snapshot', action='count', default=0,
+                        help='always load resource files, ignoring any snapshot')
+    parser.add_argument('--load_report', action='count', default=0,
+                        help='write JSON report of load time/memory per resource (to stderr if stdout has output)')
     parser.add_argument('--silent', action='count', default=0, help='suppress ... progress')
     parser.add_argument('-a', '--ablation', type=str, default='', help='for development mode: nocap')
     parser.add_argument('--stats', action='count', default=0, help='for development mode: numbers')
@@ -2368,9 +4549,18 @@ def main():
     args = parser.parse_args()
     # copy selected (minor) args from argparse.Namespace to dict
     args_dict = {'rom_format': args.rom_format, 'load_log': args.load_log, 'test': args.test, 'stats': args.stats,
-                 'cache_size': args.cache_size, 'max_lines': args.max_lines, 'verbose': args.verbose,
+                 'cache_size': args.cache_size, 'cache_max_bytes': args.cache_max_bytes,
+                 'adaptive_cache': bool(args.adaptive_cache),
+                 'token_delimiters': args.token_delimiters, 'line_memo_size': args.line_memo_size,
+                 'persistent_cache': args.persistent_cache,
+                 'persistent_cache_read_only': bool(args.persistent_cache_read_only),
+                 'shared_cache': args.shared_cache, 'shared_cache_slots': args.shared_cache_slots,
+                 'max_lines': args.max_lines, 'workers': args.workers, 'prefork': bool(args.prefork),
+                 'verbose': args.verbose,
                  'rebuild_ud_props': args.rebuild_ud_props, 'rebuild_num_props': args.rebuild_num_props,
-                 'ablation': args.ablation, 'silent': args.silent, 'decode_unicode': args.decode_unicode}
+                 'ablation': args.ablation, 'silent': args.silent, 'decode_unicode': args.decode_unicode,
+                 'use_snapshot': not (args.no_snapshot or args.build_snapshot),
+                 'snapshot_filename': args.snapshot_filename}
     pr = None
     if args.profile:
         gc.enable()
@@ -2390,6 +4580,8 @@ def main():
     uroman.py "महात्मा गांधी" -f lattice
     uroman.py สวัสดี --load_log
     uroman.py --test
+    uroman.py --build_snapshot
+    uroman.py --load_report
     uroman.py --ignore_args
     uroman.py Բարեւ -o ../test/tmp-out.txt -f edges
     # In double input cases such as in the line below,
@@ -2397,7 +4589,9 @@ def main():
     uroman.py ⴰⵣⵓⵍ -i ../test/multi-script.txt > ../test/multi-script-out2.txt
         '''
 
-    if args.ignore_args:
+    if args.benchmark_parsing:
+        benchmark_double_colon_parsing(args.data_dir or Uroman.default_data_dir())
+    elif args.ignore_args:
         # minimal calls
         uroman = Uroman(args.data_dir)
         s, s2, s3, s4 = 'Игорь', 'ちょっとまってください', 'ka‍n‍ne', 'महात्मा गांधी  '
@@ -2415,9 +4609,15 @@ def main():
         # uroman = Uroman(args.data_dir, load_log=args.load_log, rebuild_ud_props=args.rebuild_ud_props,
         #                 rebuild_num_props=args.rebuild_num_props)
         uroman = Uroman(args.data_dir, **args_dict)
-        romanize_file_p = (args.input_filename or args.output_filename
-                           or not (args.direct_input or args.test or args.ignore_args
-                                   or args.rebuild_ud_props or args.rebuild_num_props))
+        if args.build_snapshot:
+            if snapshot_filename := uroman.save_snapshot(args.snapshot_filename):
+                sys.stderr.write(f'Saved snapshot {snapshot_filename}\n')
+        if args.warm_cache:
+            uroman.warm_cache_from_file(args.warm_cache, lcodes=args.lcode, rom_formats=args.rom_format)
+        romanize_file_p = (not args.fork_memory_report) and \
+            (args.input_filename or args.output_filename
+             or not (args.direct_input or args.test or args.ignore_args or args.load_report
+                     or args.rebuild_ud_props or args.rebuild_num_props or args.build_snapshot))
         # Romanize any positional arguments, interpreted as strings to be romanized.
         for s in args.direct_input:
             result = uroman.romanize_string(s.rstrip('\n'), lcode=args.lcode, **args_dict)
@@ -2438,9 +4638,27 @@ def main():
         if args.test:
             uroman.test_output_of_selected_scripts_and_rom_rules()
             uroman.test_romanization()
+        if args.export_cache:
+            uroman.export_cache(args.export_cache)
+        if args.load_report:
+            load_report_json = json.dumps(uroman.load_report(), indent=2) + '\n'
+            # Do not mix the report with any romanization output to stdout.
+            if (romanize_file_p and not args.output_filename) or (args.direct_input and not romanize_file_p):
+                sys.stderr.write(load_report_json)
+            else:
+                sys.stdout.write(load_report_json)
+        if args.fork_memory_report:
+            # sample lines: input file (if any), else mini-test
+            sample_filename = args.input_filename or os.path.join(os.path.dirname(__file__), 'mini-test',
+                                                                  'multi-script.txt')
+            with open(sample_filename, 'r', encoding='utf-8', errors='surrogateescape') as f:
+                lines = list(islice(f, args.max_lines))
+            print(json.dumps(measure_fork_memory(uroman, args.fork_memory_report, lines, **args_dict), indent=2))
         if uroman.stats and args.stats:
             stats100 = {k: uroman.stats[k] for k in list(dict(uroman.stats))[:100]}
             sys.stderr.write(f'Stats: {stats100} ...\n')
+        if args.stats:
+            sys.stderr.write(f'Cache stats: {uroman.cache_stats()}\n')
     if args.profile:
         if pr:
             pr.disable()